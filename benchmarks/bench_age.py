@@ -0,0 +1,61 @@
+"""Ages for a column of birth dates: per-row calculate() against the datetime64 batch path.
+
+Run from the repository root:
+
+    python benchmarks/bench_age.py [--rows N] [--sample M]
+
+The per-row path (schema parsing plus the scalar handler) is timed on
+the first M rows and extrapolated to N.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculators import calculate  # noqa: E402
+from calculators.calendar_math import calendar_difference_array  # noqa: E402
+from calculators.vectorized import evaluate_columns  # noqa: E402
+
+AS_OF = "2025-06-30"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    births = np.datetime64("1930-01-01") + rng.integers(0, 30000, args.rows)
+    strings = births.astype(str).tolist()
+
+    # Distinct birth dates, so the result cache never answers
+    sample = list(dict.fromkeys(strings))[:args.sample]
+    start = time.perf_counter()
+    for dob in sample:
+        calculate("age", {"dob": dob, "as_of": AS_OF})
+    per_row = (time.perf_counter() - start) / len(sample)
+    print(f"per-row calculate():       {per_row * 1e6:7.2f} us/row -> {per_row * args.rows:7.2f} s for {args.rows:,} rows")
+
+    start = time.perf_counter()
+    calendar_difference_array(strings, AS_OF)
+    elapsed = time.perf_counter() - start
+    print(f"batch from ISO strings:    {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+    start = time.perf_counter()
+    calendar_difference_array(births, np.datetime64(AS_OF))
+    elapsed = time.perf_counter() - start
+    print(f"batch from datetime64:     {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+    start = time.perf_counter()
+    evaluate_columns("age", {"dob": strings, "as_of": AS_OF})
+    elapsed = time.perf_counter() - start
+    print(f"/calculate/columns engine: {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Throughput of /calculate/batch against one POST per item to /calculate.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch.py [--items N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+
+SAMPLE_ITEMS = [
+    {"calc_id": "bmi", "data": {"weight": "70", "height": "175"}},
+    {"calc_id": "loan_payment", "data": {"principal": "25000", "rate": "6.5", "months": "60"}},
+    {"calc_id": "unit_length", "data": {"value": "12", "from": "feet", "to": "meters"}},
+]
+
+
+def make_items(count):
+    return [SAMPLE_ITEMS[i % len(SAMPLE_ITEMS)] for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    args = parser.parse_args()
+
+    app.config["MAX_BATCH_SIZE"] = max(app.config["MAX_BATCH_SIZE"], args.items)
+    client = app.test_client()
+    items = make_items(args.items)
+
+    start = time.perf_counter()
+    for item in items:
+        client.post("/calculate", json=item)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = client.post("/calculate/batch", json=items)
+    batch = time.perf_counter() - start
+    assert len(response.get_json()["results"]) == len(items)
+
+    print(f"single-item route: {args.items / single:10.0f} items/s ({single * 1000:.1f} ms)")
+    print(f"batch route:       {args.items / batch:10.0f} items/s ({batch * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""One correlation_matrix call against a /calculate correlation call per pair.
+
+Run from the repository root:
+
+    python benchmarks/bench_correlation.py [--series N] [--observations M]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+
+
+def make_series(series, observations, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(observations, 1))
+    return base + rng.normal(size=(observations, series))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--observations", type=int, default=250)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    data = make_series(args.series, args.observations)
+    columns = [", ".join(f"{x:.6f}" for x in data[:, i]) for i in range(args.series)]
+    pairs = [(i, j) for i in range(args.series) for j in range(i + 1, args.series)]
+
+    start = time.perf_counter()
+    for i, j in pairs:
+        client.post("/calculate", json={"calc_id": "correlation", "data": {"x_values": columns[i], "y_values": columns[j]}})
+    pairwise = time.perf_counter() - start
+
+    series = "\n".join(f"s{i}: {column}" for i, column in enumerate(columns))
+    start = time.perf_counter()
+    response = client.post("/calculate", json={"calc_id": "correlation_matrix", "data": {"series": series, "method": "both"}})
+    matrix = time.perf_counter() - start
+    assert not response.get_json()["result"].startswith("Error")
+
+    print(f"{len(pairs)} pairwise calls:          {pairwise * 1000:9.1f} ms (Pearson only)")
+    print(f"one correlation_matrix call: {matrix * 1000:9.1f} ms (Pearson and Spearman)")
+
+
+if __name__ == "__main__":
+    main()
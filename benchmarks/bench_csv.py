@@ -0,0 +1,87 @@
+"""Streaming CSV endpoint: throughput and memory on a generated input.
+
+The input is generated on the fly (never written to disk) and fed to the
+WSGI app as a chunked request body; the response is consumed
+incrementally. Peak RSS is sampled as the output streams so flat memory
+use is visible.
+
+Run from the repository root:
+
+    python benchmarks/bench_csv.py [--size-mb 1024] [--calc bmi]
+"""
+import argparse
+import io
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.test import EnvironBuilder  # noqa: E402
+
+from app import app  # noqa: E402
+
+
+class GeneratedCSV(io.RawIOBase):
+    """A read-only stream of weight,height rows totalling about size bytes"""
+
+    def __init__(self, size):
+        self.remaining = size
+        self.header = b"weight,height\n"
+        row_block = b"".join(b"%d.5,%d\n" % (50 + i % 60, 150 + i % 45) for i in range(4096))
+        self.block = row_block
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.header:
+            chunk, self.header = self.header, b""
+        elif self.remaining <= 0:
+            return 0
+        else:
+            chunk = self.block[:min(len(buffer), self.remaining)]
+            end = chunk.rfind(b"\n") + 1
+            chunk = chunk[:end] or chunk
+            self.remaining -= len(chunk)
+        chunk = chunk[:len(buffer)]
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--calc", default="bmi")
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    environ = EnvironBuilder(f"/calculate/{args.calc}/csv", method="POST", content_type="text/csv").get_environ()
+    # No Content-Length: the body is read until EOF, like a chunked upload
+    environ.pop("CONTENT_LENGTH", None)
+    source = GeneratedCSV(size)
+    environ["wsgi.input"] = io.BufferedReader(source)
+    environ["wsgi.input_terminated"] = True
+
+    start = time.perf_counter()
+    rows = 0
+    next_report = size // 4
+    for chunk in app(environ, lambda status, headers: None):
+        rows += chunk.count(b"\n")
+        consumed = size - source.remaining
+        if consumed >= next_report:
+            print(f"  {consumed / 2**20:8.0f} MB read, peak RSS {peak_rss_mb():6.1f} MB")
+            next_report += size // 4
+    elapsed = time.perf_counter() - start
+
+    print(f"input {args.size_mb} MB, {rows - 1:,} rows in {elapsed:.1f} s "
+          f"({(rows - 1) / elapsed:,.0f} rows/s), peak RSS {peak_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Scaling of the Monte Carlo retirement simulation with worker processes.
+
+Run from the repository root:
+
+    python benchmarks/bench_montecarlo.py [--paths N] [--months M] [--workers 0,2,4]
+
+Worker pools are started and warmed up before timing. Every run uses the
+same seed and must give the same result.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculators.montecarlo import ShardPool, simulate_retirement  # noqa: E402
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--months", type=int, default=480)
+    parser.add_argument("--workers", default=",".join(str(w) for w in sorted({0, 2, cores}) if w != 1))
+    args = parser.parse_args()
+
+    print(f"{args.paths:,} paths x {args.months} months, {cores} cores")
+    reference = None
+    for workers in [int(w) for w in args.workers.split(",")]:
+        pool = ShardPool(workers)
+        pool.map([(12, 100.0, 0.005, 0.04, 10, 0, None)] * max(workers, 1))
+        start = time.perf_counter()
+        result = simulate_retirement(args.months, 500.0, 7.0, 15.0, args.paths, seed=1, goal=1e6, pool=pool)
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+        reference = reference or result
+        assert result == reference, "results differ between worker counts"
+        print(f"workers={workers:<3} {elapsed * 1000:9.1f} ms  {args.paths / elapsed:12,.0f} paths/s")
+
+
+if __name__ == "__main__":
+    main()
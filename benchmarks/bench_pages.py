@@ -0,0 +1,39 @@
+"""Micro-benchmark for the content-heavy HTML routes.
+
+Run from the repository root:
+
+    python benchmarks/bench_pages.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+
+ROUTES = ["/", "/guides", "/sitemap.xml", "/calculator/bmi-calculator"]
+
+
+def bench(client, path, repeat):
+    client.get(path)  # warm up templates and caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(path)
+        assert response.status_code == 200, (path, response.status_code)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    for path in ROUTES:
+        print(f"{path:<28} {bench(client, path, args.repeat):8.3f} ms/request")
+
+
+if __name__ == "__main__":
+    main()
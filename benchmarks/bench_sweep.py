@@ -0,0 +1,57 @@
+"""A compound_interest parameter sweep against one /calculate call per grid cell.
+
+Run from the repository root:
+
+    python benchmarks/bench_sweep.py [--side N] [--sample M]
+
+The grid is principal x rate x time with N values each. Per-cell calls
+are timed on the first M cells and extrapolated to the whole grid.
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=100)
+    parser.add_argument("--sample", type=int, default=2000)
+    args = parser.parse_args()
+
+    app.config["SWEEP_MAX_CELLS"] = max(app.config["SWEEP_MAX_CELLS"], args.side ** 3)
+    client = app.test_client()
+    principal = np.linspace(1000, 100000, args.side)
+    rate = np.linspace(0.5, 15, args.side)
+    years = np.linspace(1, 50, args.side)
+    cells = args.side ** 3
+
+    grid = itertools.islice(itertools.product(principal, rate, years), args.sample)
+    start = time.perf_counter()
+    for p, r, t in grid:
+        client.post("/calculate", json={"calc_id": "compound_interest", "data": {"principal": p, "rate": r, "time": t}})
+    per_cell = (time.perf_counter() - start) / args.sample
+    print(f"/calculate per cell: {per_cell * 1e6:8.1f} us -> {per_cell * cells:8.1f} s for {cells:,} cells")
+
+    inputs = {
+        "principal": {"start": 1000, "stop": 100000, "num": args.side},
+        "rate": {"start": 0.5, "stop": 15, "num": args.side},
+        "time": {"start": 1, "stop": 50, "num": args.side},
+    }
+    for fmt in ("csv", "json", "aggregate"):
+        start = time.perf_counter()
+        response = client.post("/calculate/sweep", json={"calc_id": "compound_interest", "inputs": inputs, "format": fmt})
+        size = len(response.get_data())
+        elapsed = time.perf_counter() - start
+        print(f"sweep format={fmt:<9}  {elapsed:8.2f} s for {cells:,} cells ({size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
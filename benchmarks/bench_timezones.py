@@ -0,0 +1,75 @@
+"""Wall-time conversion between IANA zones: tzdata loads per call, zoneinfo, transition tables and the batch path.
+
+Run from the repository root:
+
+    python benchmarks/bench_timezones.py [--rows N] [--sample M]
+
+The per-call paths are timed on the first M rows and extrapolated to N.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculators.timezones import ZONES, convert, convert_instants  # noqa: E402
+
+FROM_ZONE = "America/New_York"
+TO_ZONE = "Asia/Kolkata"
+
+
+def _zoneinfo_convert(moment, source, target):
+    return moment.replace(tzinfo=source).astimezone(target).replace(tzinfo=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    moments = np.datetime64("2000-01-01T00:00") + rng.integers(0, 40 * 365 * 1440, args.rows).astype("m8[m]")
+    strings = moments.astype(str).tolist()
+    sample = [datetime.fromisoformat(text) for text in strings[:args.sample]]
+
+    start = time.perf_counter()
+    for moment in sample:
+        _zoneinfo_convert(moment, ZoneInfo.no_cache(FROM_ZONE), ZoneInfo.no_cache(TO_ZONE))
+    loading = (time.perf_counter() - start) / len(sample)
+
+    source, target = ZoneInfo(FROM_ZONE), ZoneInfo(TO_ZONE)
+    start = time.perf_counter()
+    expected = [_zoneinfo_convert(moment, source, target) for moment in sample]
+    cached = (time.perf_counter() - start) / len(sample)
+
+    ZONES.clear()
+    start = time.perf_counter()
+    ZONES.get(FROM_ZONE), ZONES.get(TO_ZONE)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    scalar = [convert(moment, FROM_ZONE, TO_ZONE)[0] for moment in sample]
+    tables = (time.perf_counter() - start) / len(sample)
+    assert scalar == expected
+
+    start = time.perf_counter()
+    converted, _, valid = convert_instants(strings, FROM_ZONE, TO_ZONE)
+    batch = time.perf_counter() - start
+    assert valid.all()
+    assert converted[:len(sample)].astype(datetime).tolist() == expected
+
+    print(f"{args.rows:,} wall times {FROM_ZONE} -> {TO_ZONE}")
+    print(f"  tzdata load per call   {loading * args.rows:8.2f} s   ({loading * 1e6:.2f} us/row, extrapolated)")
+    print(f"  zoneinfo, cached zones {cached * args.rows:8.2f} s   ({cached * 1e6:.2f} us/row, extrapolated)")
+    print(f"  transition tables      {tables * args.rows:8.2f} s   ({tables * 1e6:.2f} us/row, extrapolated)")
+    print(f"  batch (searchsorted)   {batch:8.2f} s   ({batch / args.rows * 1e6:.2f} us/row)")
+    print(f"  one-time table build   {build * 1e3:8.2f} ms for both zones")
+
+
+if __name__ == "__main__":
+    main()
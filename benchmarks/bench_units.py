@@ -0,0 +1,65 @@
+"""A column of lengths from feet to meters: per-row calculate() against the conversion engine.
+
+Run from the repository root:
+
+    python benchmarks/bench_units.py [--rows N] [--sample M]
+
+The per-row path (schema parsing plus the scalar handler) is timed on
+the first M rows and extrapolated to N.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculators import calculate  # noqa: E402
+from calculators.conversion import LENGTH, convert_column  # noqa: E402
+from calculators.vectorized import evaluate_columns  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 10_000, args.rows).round(3)
+    numbers = values.tolist()
+
+    # Distinct values, so the result cache never answers
+    sample = numbers[:args.sample]
+    start = time.perf_counter()
+    for value in sample:
+        calculate("unit_length", {"value": value, "from": "feet", "to": "meters"})
+    per_row = (time.perf_counter() - start) / len(sample)
+    print(f"per-row calculate():       {per_row * 1e6:7.2f} us/row -> {per_row * args.rows:7.2f} s for {args.rows:,} rows")
+
+    start = time.perf_counter()
+    for value in sample:
+        LENGTH.convert(value, "feet", "meters")
+    per_row = (time.perf_counter() - start) / len(sample)
+    print(f"engine, one value a call:  {per_row * 1e6:7.2f} us/row -> {per_row * args.rows:7.2f} s")
+
+    start = time.perf_counter()
+    LENGTH.convert_array(values, "feet", "meters")
+    elapsed = time.perf_counter() - start
+    print(f"engine, float64 array:     {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+    start = time.perf_counter()
+    convert_column(numbers, "feet", "meters")
+    elapsed = time.perf_counter() - start
+    print(f"/units/convert engine:     {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+    start = time.perf_counter()
+    evaluate_columns("unit_length", {"value": numbers, "from": "feet", "to": "meters"})
+    elapsed = time.perf_counter() - start
+    print(f"/calculate/columns engine: {elapsed / args.rows * 1e6:7.2f} us/row -> {elapsed:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Calculator engine: one registered handler per calculator id"""
+from .registry import CHEAP, HEAVY, REGISTRY, CalculatorSpec, calculate, calculate_batch, calculator, get_spec, run
+
+# Importing the category modules registers their handlers
+from . import clock  # noqa: F401
+from . import (  # noqa: F401
+    automotive,
+    cooking,
+    date_time,
+    education,
+    environment,
+    finance,
+    health,
+    home,
+    mathematics,
+    physics,
+    stats,
+    units,
+)
+
+__all__ = ["CHEAP", "HEAVY", "REGISTRY", "CalculatorSpec", "calculate", "calculate_batch", "calculator", "get_spec", "run"]
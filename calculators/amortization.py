@@ -0,0 +1,117 @@
+"""Amortization schedules for fixed-rate loans
+
+A Loan yields its schedule one row at a time, so a 30-year mortgage is
+never held as a list. The balance after any period has a closed form:
+B(k) = B(0)(1 + r)^k - (P + E)((1 + r)^k - 1) / r, where P is the level
+payment and E a constant extra payment each month. That closed form lets
+a page of rows start at any period without replaying the earlier ones.
+It also gives the payoff period and the totals directly, and it works on
+whole numpy arrays of periods.
+"""
+import math
+
+import numpy as np
+
+# Inputs of each loan calculator as (principal, annual rate in %, months)
+LOAN_TERMS = {
+    "loan_payment": lambda values: (values["principal"], values["rate"], values["months"]),
+    "car_loan": lambda values: (values["principal"], values["rate"], values["months"]),
+    "mortgage": lambda values: (values["price"] - values["down"], values["rate"], values["years"] * 12),
+}
+
+COLUMNS = ("period", "payment", "interest", "principal", "balance")
+
+
+def annuity_payment(principal, monthly_rate, months):
+    """Level payment that repays principal over months (scalars or arrays)"""
+    monthly_rate = np.asarray(monthly_rate, dtype=np.float64)
+    growth = (1 + monthly_rate) ** months
+    return np.where(
+        monthly_rate == 0,
+        principal / months,
+        principal * (monthly_rate * growth) / (growth - 1),
+    )
+
+
+class Loan:
+    """A fixed-rate loan repaid monthly, optionally with a constant extra payment"""
+
+    def __init__(self, principal, rate, months, extra=0.0):
+        if principal <= 0:
+            raise ValueError("loan amount must be greater than 0")
+        if rate < 0:
+            raise ValueError("rate must be at least 0")
+        if months <= 0 or months != int(months):
+            raise ValueError("term must be a whole number of months")
+        if extra < 0:
+            raise ValueError("extra payment must be at least 0")
+        self.principal = principal
+        self.monthly_rate = rate / 100 / 12
+        self.months = int(months)
+        self.extra = extra
+        with np.errstate(all="ignore"):
+            self.payment = float(annuity_payment(principal, self.monthly_rate, self.months))
+        if not math.isfinite(self.payment):
+            raise ValueError("rate and term are too large to compute a payment")
+
+    @property
+    def payoff_period(self):
+        """Period of the last (possibly smaller) payment"""
+        if not self.extra:
+            return self.months
+        paid = self.payment + self.extra
+        r = self.monthly_rate
+        if r == 0:
+            periods = self.principal / paid
+        else:
+            periods = -math.log1p(-r * self.principal / paid) / math.log1p(r)
+        # The tolerance keeps float noise from adding an empty final period
+        return min(self.months, max(1, math.ceil(periods - 1e-9)))
+
+    def balance_at(self, period):
+        """Balance left after `period` payments; period may be a numpy array"""
+        period = np.asarray(period, dtype=np.float64)
+        r = self.monthly_rate
+        paid = self.payment + self.extra
+        if r == 0:
+            balance = self.principal - paid * period
+        else:
+            growth = (1 + r) ** period
+            balance = self.principal * growth - paid * (growth - 1) / r
+        balance = np.where(period >= self.payoff_period, 0.0, np.maximum(balance, 0.0))
+        return balance if balance.ndim else float(balance)
+
+    def totals(self):
+        """Payment, payoff period and total paid and interest, without building the schedule"""
+        last = self.payoff_period
+        final = self.balance_at(last - 1) * (1 + self.monthly_rate)
+        total_paid = (self.payment + self.extra) * (last - 1) + final
+        return {
+            "payment": self.payment,
+            "extra": self.extra,
+            "periods": last,
+            "total_paid": total_paid,
+            "total_interest": total_paid - self.principal,
+        }
+
+    def rows(self, start=1, end=None):
+        """Yield (period, payment, interest, principal, balance) for periods start..end inclusive"""
+        last = self.payoff_period
+        end = last if end is None else min(end, last)
+        if start > end:
+            return
+        balance = self.balance_at(start - 1)
+        for period in range(start, end + 1):
+            interest = balance * self.monthly_rate
+            if period == last:
+                payment = balance + interest
+                balance = 0.0
+            else:
+                payment = self.payment + self.extra
+                balance -= payment - interest
+            yield period, payment, interest, payment - interest, balance
+
+
+def loan_for(calc_id, values, extra=0.0):
+    """The Loan described by a loan calculator's validated inputs"""
+    return Loan(*LOAN_TERMS[calc_id](values), extra=extra)
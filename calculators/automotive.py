@@ -0,0 +1,47 @@
+"""Automotive calculators"""
+
+from .registry import calculator
+from .schema import number
+
+
+@calculator("car_loan", inputs=[number("principal"), number("rate"), number("months")])
+def car_loan(principal, rate, months):
+    rate = rate / 100 / 12
+    payment = principal * (rate * (1 + rate)**months) / ((1 + rate)**months - 1)
+    return f"Monthly Car Payment: ${payment:,.2f}"
+
+
+@calculator("fuel_cost", inputs=[number("distance"), number("mpg"), number("price", dest="price_per_gallon")])
+def fuel_cost(distance, mpg, price_per_gallon):
+    gallons = distance / mpg
+    cost = gallons * price_per_gallon
+    return f"Fuel Cost: ${cost:.2f} ({gallons:.2f} gallons)"
+
+
+@calculator("fuel_efficiency", inputs=[number("distance", gt=0), number("fuel", gt=0)])
+def fuel_efficiency(distance, fuel):
+    mpg = distance / fuel
+    kpl = mpg * 0.425144
+    return f"MPG: {mpg:.2f}, KPL: {kpl:.2f}"
+
+
+@calculator("tire_size", inputs=[number("width"), number("aspect"), number("diameter")])
+def tire_size(width, aspect, diameter):
+    sidewall = width * aspect / 100
+    total_diameter = (diameter * 25.4) + (2 * sidewall)
+    circumference = total_diameter * 3.14159
+    return f"Tire Diameter: {total_diameter:.2f}mm, Circumference: {circumference:.2f}mm"
+
+
+@calculator("lease_vs_buy", inputs=[
+    number("lease_payment", label="lease payment"),
+    number("lease_months", label="lease months"),
+    number("loan_payment", label="loan payment"),
+    number("loan_months", label="loan months"),
+])
+def lease_vs_buy(lease_payment, lease_months, loan_payment, loan_months):
+    lease_total = lease_payment * lease_months
+    loan_total = loan_payment * loan_months
+    savings = abs(lease_total - loan_total)
+    better = "Leasing" if lease_total < loan_total else "Buying"
+    return f"{better} is better. Lease: ${lease_total:,.2f}, Buy: ${loan_total:,.2f}, Savings: ${savings:,.2f}"
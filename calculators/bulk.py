@@ -0,0 +1,49 @@
+"""Streaming CSV bulk calculation
+
+Rows are read lazily from a text stream, evaluated in fixed-size chunks
+and written back out chunk by chunk, so memory use depends on the chunk
+size rather than on the size of the input.
+"""
+import csv
+import io
+from itertools import islice
+
+from .registry import calculate_batch
+
+DEFAULT_CHUNK_ROWS = 1000
+
+
+def stream_csv(calc_id, lines, chunk_rows=DEFAULT_CHUNK_ROWS, result_column="result"):
+    """Yield CSV text: the input rows with a result column appended
+
+    lines is any iterable of CSV lines (e.g. a text-mode file or request
+    stream). The header row names the calculator's input fields; columns
+    the calculator does not use are passed through unchanged.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV input needs a header row naming the input fields")
+    header = [name.strip() for name in header]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header + [result_column])
+    yield _drain(buffer)
+
+    while True:
+        rows = list(islice(reader, chunk_rows))
+        if not rows:
+            break
+        items = [(calc_id, dict(zip(header, row))) for row in rows]
+        for row, result in zip(rows, calculate_batch(items)):
+            row.append(result)
+        writer.writerows(rows)
+        yield _drain(buffer)
+
+
+def _drain(buffer):
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
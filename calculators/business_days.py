@@ -0,0 +1,123 @@
+"""Closed-form business-day arithmetic with pluggable holiday calendars
+
+Weekdays are counted from date ordinals with whole weeks plus a
+remainder, so the cost does not depend on the length of the span.
+Holiday calendars are sorted lists of ordinals and are counted with
+binary search.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+HOLIDAY_CALENDARS = {}
+
+
+def register_calendar(name, holidays):
+    """Register a holiday calendar from an iterable of dates
+
+    Weekend dates are dropped since they are never business days anyway.
+    """
+    ordinals = sorted({day.toordinal() for day in holidays if day.weekday() < 5})
+    HOLIDAY_CALENDARS[name] = ordinals
+    return ordinals
+
+
+def _weekdays_before(ordinal):
+    """Number of Monday-Friday days with ordinal < the given one (ordinal 1 is a Monday)"""
+    weeks, remainder = divmod(ordinal - 1, 7)
+    return weeks * 5 + min(remainder, 5)
+
+
+def _nth_weekday(k):
+    """Ordinal of the k-th weekday counting from ordinal 1 (k >= 1)"""
+    weeks, remainder = divmod(k - 1, 5)
+    return weeks * 7 + remainder + 1
+
+
+def _holidays_between(holidays, first, last):
+    """Holidays with first <= ordinal <= last"""
+    return bisect_right(holidays, last) - bisect_left(holidays, first)
+
+
+def _calendar(name):
+    if not name:
+        return ()
+    try:
+        return HOLIDAY_CALENDARS[name]
+    except KeyError:
+        raise LookupError(f"Unknown holiday calendar '{name}'") from None
+
+
+def count_business_days(start, end, calendar=None):
+    """Business days in the inclusive range between two dates, in either order"""
+    first, last = sorted((start.toordinal(), end.toordinal()))
+    weekdays = _weekdays_before(last + 1) - _weekdays_before(first)
+    return weekdays - _holidays_between(_calendar(calendar), first, last)
+
+
+def add_business_days(start, days, calendar=None):
+    """The date `days` business days after start (before it when negative)
+
+    Zero returns start unchanged, even on a weekend or holiday.
+    """
+    if days == 0:
+        return start
+    holidays = _calendar(calendar)
+    origin = start.toordinal()
+    wanted = abs(days)
+    # Step to the k-th weekday from start; every holiday in the way pushes
+    # k further out. k only grows by the remaining shortfall, so this stops
+    # at the nearest date with exactly `wanted` business days in between.
+    k = wanted
+    while True:
+        if days > 0:
+            target = _nth_weekday(_weekdays_before(origin + 1) + k)
+            skipped = _holidays_between(holidays, origin + 1, target)
+        else:
+            position = _weekdays_before(origin) - k + 1
+            if position < 1:
+                raise ValueError("Result is before the start of the calendar")
+            target = _nth_weekday(position)
+            skipped = _holidays_between(holidays, target, origin - 1)
+        if k - skipped == wanted:
+            break
+        k = wanted + skipped
+    return type(start).fromordinal(target)
+
+
+def _observed(day):
+    """US federal rule: Saturday holidays move to Friday, Sunday ones to Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday_of_month(year, month, weekday, n):
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    if n > 0:
+        return first + timedelta(days=offset + 7 * (n - 1))
+    # n == -1: last such weekday of the month
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def us_federal_holidays(first_year, last_year):
+    """Observed US federal holidays, using the current list of holidays for every year"""
+    for year in range(first_year, last_year + 1):
+        yield _observed(date(year, 1, 1))
+        yield _nth_weekday_of_month(year, 1, 0, 3)       # Martin Luther King Jr. Day
+        yield _nth_weekday_of_month(year, 2, 0, 3)       # Presidents' Day
+        yield _nth_weekday_of_month(year, 5, 0, -1)      # Memorial Day
+        yield _observed(date(year, 6, 19))               # Juneteenth
+        yield _observed(date(year, 7, 4))
+        yield _nth_weekday_of_month(year, 9, 0, 1)       # Labor Day
+        yield _nth_weekday_of_month(year, 10, 0, 2)      # Columbus Day
+        yield _observed(date(year, 11, 11))
+        yield _nth_weekday_of_month(year, 11, 3, 4)      # Thanksgiving
+        yield _observed(date(year, 12, 25))
+
+
+register_calendar("us_federal", us_federal_holidays(1900, 2200))
@@ -0,0 +1,129 @@
+"""Bounded in-process memoization of calculator results
+
+Keys are the calculator id plus the schema-coerced input values, so
+"70", "70.0" and 70 all map to the same entry. Pure calculators (not
+time-dependent, not random) go in RESULT_CACHE. Time-dependent ones
+go in DAILY_CACHE, keyed on the as-of date, which is emptied whenever the
+current date moves on.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+MISSING = object()
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _canonical(value):
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def make_key(calc_id, values):
+    """Hashable cache key from a calculator id and coerced input values"""
+    return (calc_id,) + tuple(_canonical(value) for value in values.values())
+
+
+def _entry_size(key, result):
+    # Rough footprint: the key tuple, its items and the cached string
+    return sys.getsizeof(key) + sum(sys.getsizeof(part) for part in key) + sys.getsizeof(result)
+
+
+class ResultCache:
+    """Thread-safe LRU cache with an entry limit and an approximate memory cap"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_entries=None, max_bytes=None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        size = _entry_size(key, result)
+        if size > self.max_bytes // 64:
+            # One huge entry (e.g. a long number list) would flush the whole cache
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class DailyResultCache(ResultCache):
+    """A ResultCache whose entries all expire together when the day changes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.day = None
+
+    def roll_over(self, day):
+        """Start a new day, dropping every entry cached for the previous one"""
+        if day == self.day:
+            return
+        with self._lock:
+            if day != self.day:
+                self._entries.clear()
+                self._bytes = 0
+                self.day = day
+
+    def stats(self):
+        stats = super().stats()
+        stats["day"] = self.day.date().isoformat() if self.day else None
+        return stats
+
+
+RESULT_CACHE = ResultCache()
+DAILY_CACHE = DailyResultCache()
@@ -0,0 +1,110 @@
+"""Exact calendar differences: whole years, months and days between two dates
+
+The difference is the largest number of whole months m such that start
+shifted by m months is still on or before end, plus the days left over.
+A shift that lands on a day the target month lacks follows the leap-day
+rule. "feb28" clamps to the month's last day, so a Feb 29 birthday falls
+on Feb 28 in common years. "mar1" rolls over to the first of the next
+month, as some jurisdictions count a Feb 29 birthday. The same rules run
+on single dates and, with datetime64 arithmetic, on whole columns.
+"""
+import calendar
+from datetime import date, datetime
+
+import numpy as np
+
+from .schema import parse_date
+
+LEAP_RULES = ("feb28", "mar1")
+
+
+def _check_rule(leap_rule):
+    if leap_rule not in LEAP_RULES:
+        raise LookupError(f"Unknown leap-day rule '{leap_rule}'; use {' or '.join(LEAP_RULES)}")
+
+
+def shift_months(start, months, leap_rule="feb28"):
+    """start moved by a whole number of months, with days past the month's end handled by leap_rule"""
+    _check_rule(leap_rule)
+    index = start.year * 12 + start.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    length = calendar.monthrange(year, month)[1]
+    if start.day <= length:
+        return start.replace(year=year, month=month)
+    if leap_rule == "feb28":
+        return start.replace(year=year, month=month, day=length)
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return start.replace(year=year, month=month, day=1)
+
+
+def anniversary(start, year, leap_rule="feb28"):
+    """start's anniversary in `year` (a Feb 29 birthday follows leap_rule in common years)"""
+    return shift_months(start, (year - start.year) * 12, leap_rule)
+
+
+def calendar_difference(start, end, leap_rule="feb28"):
+    """(years, months, days) from start to end; end must not be before start"""
+    if end < start:
+        raise ValueError("end is before start")
+    months = (end.year - start.year) * 12 + end.month - start.month
+    anchor = shift_months(start, months, leap_rule)
+    if anchor > end:
+        months -= 1
+        anchor = shift_months(start, months, leap_rule)
+    years, months = divmod(months, 12)
+    return years, months, (end - anchor).days
+
+
+def parse_dates(values):
+    """datetime64[D] array from ISO date strings, dates or datetimes; unparseable entries are NaT"""
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[D]")
+    values = [values] if isinstance(values, (str, date, np.datetime64)) else list(values)
+    try:
+        # numpy parses ISO 8601 strings in C, far faster than strptime per row
+        return np.array(values, dtype="datetime64[D]")
+    except (ValueError, TypeError):
+        parsed = np.empty(len(values), dtype="datetime64[D]")
+        for i, value in enumerate(values):
+            try:
+                if isinstance(value, str):
+                    value = parse_date(value.strip())
+                parsed[i] = np.datetime64(value.date() if isinstance(value, datetime) else value, "D")
+            except (ValueError, TypeError):
+                parsed[i] = np.datetime64("NaT")
+        return parsed
+
+
+def _shift_months_array(start, months, leap_rule):
+    """Vectorized shift_months over datetime64[D] arrays"""
+    start_month = start.astype("datetime64[M]")
+    day = (start - start_month).astype(np.int64)
+    target = start_month + months
+    length = ((target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")).astype(np.int64)
+    first = target.astype("datetime64[D]")
+    if leap_rule == "feb28":
+        return first + np.minimum(day, length - 1)
+    return np.where(day < length, first + day, (target + 1).astype("datetime64[D]"))
+
+
+def calendar_difference_array(start, end, leap_rule="feb28"):
+    """(years, months, days, valid) for columns of start and end dates (broadcast against each other)
+
+    valid is False where a date is missing (NaT) or end is before start;
+    the other arrays are 0 there.
+    """
+    _check_rule(leap_rule)
+    start, end = np.broadcast_arrays(parse_dates(start), parse_dates(end))
+    valid = ~np.isnat(start) & ~np.isnat(end) & (end >= start)
+    # Placeholder dates keep the arithmetic clean where the row is invalid
+    start = np.where(valid, start, np.datetime64("2000-01-01"))
+    end = np.where(valid, end, np.datetime64("2000-01-01"))
+    months = (end.astype("datetime64[M]") - start.astype("datetime64[M]")).astype(np.int64)
+    anchor = _shift_months_array(start, months, leap_rule)
+    over = anchor > end
+    months -= over
+    anchor = np.where(over, _shift_months_array(start, months, leap_rule), anchor)
+    days = (end - anchor).astype(np.int64)
+    years, months = np.divmod(months, 12)
+    return np.where(valid, years, 0), np.where(valid, months, 0), np.where(valid, days, 0), valid
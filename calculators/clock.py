@@ -0,0 +1,34 @@
+"""The calendar date that time-dependent calculators treat as "today"
+
+The date is taken in a configurable timezone (server local time by
+default) so every worker agrees on when the day rolls over.
+"""
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+_timezone = None
+
+
+def set_timezone(name):
+    """Use the IANA zone name for "today"; an empty name means local time"""
+    global _timezone
+    _timezone = ZoneInfo(name) if name else None
+
+
+def now():
+    return datetime.now(_timezone)
+
+
+def today():
+    """Midnight of the current date, as a naive datetime like parsed date inputs"""
+    current = now()
+    return datetime(current.year, current.month, current.day)
+
+
+def seconds_until_midnight():
+    """Whole seconds left before the date returned by today() changes"""
+    current = now()
+    midnight = datetime.combine(current.date() + timedelta(days=1), time(), tzinfo=_timezone)
+    if _timezone is None:
+        midnight = midnight.astimezone()
+    return max(int(midnight.timestamp() - current.timestamp()), 0)
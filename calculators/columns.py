@@ -0,0 +1,40 @@
+"""Coercion of JSON input lists into NumPy columns
+
+Shared by the columnar, sweep and unit-conversion paths so that all of
+them accept the same inputs: a single value or a flat list of values.
+Nested or ragged lists, and objects, are rejected with one message.
+"""
+import numpy as np
+
+_CONTAINERS = (list, tuple, dict)
+
+
+def column_rank(name, values):
+    """0 for a single value, 1 for a flat list; anything else raises ValueError"""
+    if isinstance(values, np.ndarray):
+        rank = values.ndim
+    elif isinstance(values, (list, tuple)):
+        rank = 1 if set(map(type, values)).isdisjoint(_CONTAINERS) else None
+    else:
+        rank = None if isinstance(values, dict) else 0
+    if rank not in (0, 1):
+        raise ValueError(f"{name} must be a list of numbers")
+    return rank
+
+
+def float_column(values):
+    """A flat list as float64; entries that are not numbers, booleans included, are NaN"""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return values.astype(np.float64)
+    if set(map(type, values)) <= {float, int}:
+        try:
+            return np.asarray(values, dtype=np.float64)
+        except OverflowError:
+            pass
+    column = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            column[i] = np.nan if isinstance(value, bool) else float(value)
+        except (ValueError, TypeError, OverflowError):
+            column[i] = np.nan
+    return column
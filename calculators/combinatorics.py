@@ -0,0 +1,174 @@
+"""Factorials, permutations and combinations without full factorials
+
+Exact values are built only when they have at most MAX_EXACT_DIGITS
+digits. They are products of the needed range of integers, multiplied
+by binary splitting. Larger values are summarised in scientific notation
+from log10, which comes from Stirling's series, so n itself can be
+huge. Results mod m use the cheapest method that fits a work budget:
+- a direct range product;
+- Wilson's theorem or Lucas' theorem for prime moduli;
+- Legendre prime exponents over a sieve.
+"""
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+from .primes import is_prime, primes_between
+
+MAX_EXACT_DIGITS = 1000
+# Largest number of modular multiplications one call may spend
+MOD_BUDGET = 10_000_000
+# Largest n for which prime exponents are found by sieving
+LEGENDRE_LIMIT = 10_000_000
+# Below this log10(n!) is taken from the exact factorial
+STIRLING_FROM = 1000
+_HALF_LN_2PI = Decimal("0.91893853320467274178032973640561763986139747363778")
+
+
+class BudgetExceeded(ArithmeticError):
+    pass
+
+
+def _range_product(lo, hi):
+    """lo * (lo + 1) * ... * hi by binary splitting (1 when the range is empty)"""
+    if hi - lo < 8:
+        result = 1
+        for k in range(lo, hi + 1):
+            result *= k
+        return result
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid + 1, hi)
+
+
+def _log10_factorial(n):
+    """log10(n!) as a Decimal in the caller's context"""
+    if n < STIRLING_FROM:
+        return Decimal(math.factorial(n)).log10()
+    n = Decimal(n)
+    ln = (n + Decimal("0.5")) * n.ln() - n + _HALF_LN_2PI + 1 / (12 * n) - 1 / (360 * n ** 3) + 1 / (1260 * n ** 5)
+    return ln / Decimal(10).ln()
+
+
+def _precision(n):
+    # Enough digits to keep ~25 after the decimal point of n * log10(n)
+    return 2 * len(str(n)) + 30
+
+
+def _summary(log10):
+    """(digit count, scientific-notation text) for a number with this log10"""
+    exponent = int(log10)
+    mantissa = float(Decimal(10) ** (log10 - exponent))
+    if mantissa >= 10:  # rounding pushed it up a decade
+        mantissa, exponent = mantissa / 10, exponent + 1
+    return exponent + 1, f"{mantissa:.9f} × 10^{exponent}"
+
+
+def _legendre_mod(n, denominators, modulus):
+    """n! / prod(d! for d in denominators) mod modulus, from prime exponents (n <= LEGENDRE_LIMIT)"""
+    if n > LEGENDRE_LIMIT:
+        raise BudgetExceeded(f"n is too large to reduce modulo {modulus}; try a prime modulus")
+    result = 1 % modulus
+    for primes in primes_between(2, n):
+        exponents = np.zeros(len(primes), dtype=np.int64)
+        power = primes.copy()
+        active = power <= n
+        while active.any():
+            terms = n // power
+            for d in denominators:
+                terms -= d // power
+            exponents += np.where(active, terms, 0)
+            power = np.where(active, power * np.where(active, primes, 1), power)
+            active &= power <= n
+        for p, e in zip(primes[exponents > 0].tolist(), exponents[exponents > 0].tolist()):
+            result = result * pow(p, e, modulus) % modulus
+    return result
+
+
+def _falling_mod(n, r, modulus):
+    """n * (n - 1) * ... * (n - r + 1) mod modulus"""
+    if r >= modulus:
+        return 0  # r consecutive integers include a multiple of the modulus
+    if r <= MOD_BUDGET:
+        result = 1 % modulus
+        for k in range(n - r + 1, n + 1):
+            result = result * k % modulus
+        return result
+    return _legendre_mod(n, [n - r], modulus)
+
+
+def _factorial_mod(n, modulus):
+    if n >= modulus:
+        return 0
+    if n > MOD_BUDGET and is_prime(modulus) and modulus - 1 - n <= MOD_BUDGET:
+        # Wilson: (p-1)! = -1, so n! = -1 / ((n+1) ... (p-1))
+        tail = _falling_mod(modulus - 1, modulus - 1 - n, modulus)
+        return -pow(tail, -1, modulus) % modulus
+    return _falling_mod(n, n, modulus)
+
+
+def _comb_mod_prime(n, r, p):
+    """C(n, r) mod prime p by Lucas' theorem, or None when over budget"""
+    budget = MOD_BUDGET
+    result = 1
+    while r:
+        n_digit, r_digit = n % p, r % p
+        if r_digit > n_digit:
+            return 0
+        k = min(r_digit, n_digit - r_digit)
+        budget -= k
+        if budget < 0:
+            return None
+        numerator = denominator = 1
+        for i in range(k):
+            numerator = numerator * (n_digit - i) % p
+            denominator = denominator * (i + 1) % p
+        result = result * numerator * pow(denominator, p - 2, p) % p
+        n //= p
+        r //= p
+    return result
+
+
+def _comb_mod(n, r, modulus):
+    if is_prime(modulus):
+        result = _comb_mod_prime(n, r, modulus)
+        if result is not None:
+            return result
+    return _legendre_mod(n, [r, n - r], modulus)
+
+
+def _value(log10, exact):
+    """("exact", value) when small enough to write out, else ("approx", digits, text)"""
+    if int(log10) < MAX_EXACT_DIGITS:
+        return ("exact", exact())
+    return ("approx",) + _summary(log10)
+
+
+def factorial(n, modulus=None):
+    """n! as ("exact", value), ("approx", digits, text) or ("mod", value)"""
+    if modulus is not None:
+        return ("mod", _factorial_mod(n, modulus))
+    with localcontext() as context:
+        context.prec = _precision(n)
+        return _value(_log10_factorial(n), lambda: _range_product(2, n))
+
+
+def permutations(n, r, modulus=None):
+    """P(n, r) = n! / (n - r)! for 0 <= r <= n, in the same forms as factorial()"""
+    if modulus is not None:
+        return ("mod", _falling_mod(n, r, modulus))
+    with localcontext() as context:
+        context.prec = _precision(n)
+        log10 = _log10_factorial(n) - _log10_factorial(n - r)
+        return _value(log10, lambda: _range_product(n - r + 1, n))
+
+
+def combinations(n, r, modulus=None):
+    """C(n, r) = n! / (r! (n - r)!) for 0 <= r <= n, in the same forms as factorial()"""
+    r = min(r, n - r)
+    if modulus is not None:
+        return ("mod", _comb_mod(n, r, modulus))
+    with localcontext() as context:
+        context.prec = _precision(n)
+        log10 = _log10_factorial(n) - _log10_factorial(r) - _log10_factorial(n - r)
+        return _value(log10, lambda: _range_product(n - r + 1, n) // _range_product(2, r))
@@ -0,0 +1,178 @@
+"""One conversion engine for every unit calculator
+
+Each dimension (length, area, temperature, ...) lists its units as an
+affine map to the dimension's base unit, the first one listed: base =
+scale * value + offset. Only temperatures have an offset. A Dimension
+precomputes the all-pairs matrices slope[i, j] and intercept[i, j]
+that take unit i straight to unit j. So a conversion is one lookup and
+one multiply-add. For a whole column, it is the same lookup done by
+fancy indexing. Every unit name belongs to exactly one dimension, and
+UNIT_DIMENSIONS finds the dimension of a bare unit name.
+
+Factors are the exact definitions (the international foot and pound,
+US liquid measures, IT calories and BTU, mechanical horsepower).
+"""
+from fractions import Fraction
+
+import numpy as np
+
+from .columns import column_rank, float_column
+
+
+def _exact(number):
+    # Decimal literals such as 0.3048 are taken at their written value, not their binary one
+    return number if isinstance(number, Fraction) else Fraction(str(number))
+
+
+class Dimension:
+    """The units of one quantity and the precomputed conversions between them"""
+
+    def __init__(self, name, units):
+        # units maps a name to its scale, or to (scale, offset) for affine units
+        self.name = name
+        self.units = tuple(units)
+        self.base = self.units[0]
+        self.index = {unit: i for i, unit in enumerate(self.units)}
+        pairs = [spec if isinstance(spec, tuple) else (spec, 0) for spec in units.values()]
+        pairs = [(_exact(scale), _exact(offset)) for scale, offset in pairs]
+        # Each pair's factors are worked out exactly and rounded once, so feet -> inches is 12
+        # and 100 celsius -> fahrenheit is 212, with no error picked up from going via the base
+        self.slope = np.array(
+            [[float(a / b) for b, _ in pairs] for a, _ in pairs], dtype=np.float64,
+        )
+        self.intercept = np.array(
+            [[float((c - d) / b) for b, d in pairs] for _, c in pairs], dtype=np.float64,
+        )
+        # Plain lists make the scalar path cheaper than indexing numpy arrays
+        self._slope_rows = self.slope.tolist()
+        self._intercept_rows = self.intercept.tolist()
+
+    def _position(self, unit, default):
+        i = self.index.get(unit)
+        if i is None:
+            if default is None:
+                raise LookupError(f"Unknown {self.name} unit '{unit}'")
+            i = self.index[default]
+        return i
+
+    def convert(self, value, from_unit, to_unit, default=None):
+        """value (a number) in from_unit expressed in to_unit
+
+        Unknown unit names raise LookupError, or count as `default` when
+        one is given.
+        """
+        i, j = self._position(from_unit, default), self._position(to_unit, default)
+        return value * self._slope_rows[i][j] + self._intercept_rows[i][j]
+
+    def positions(self, units, default=None):
+        """Indexes of a unit name or an array of names; unknown names give -1 (or default's index)"""
+        missing = -1 if default is None else self.index[default]
+        if isinstance(units, str) or np.ndim(units) == 0:
+            return np.intp(self.index.get(str(units), missing))
+        names, inverse = np.unique(np.asarray(units).astype(str), return_inverse=True)
+        lookup = np.array([self.index.get(name, missing) for name in names.tolist()], dtype=np.intp)
+        return lookup[inverse.reshape(np.shape(units))]
+
+    def convert_array(self, values, from_units, to_units, default=None):
+        """Vectorized convert; units may be single names or arrays broadcast against values
+
+        Entries with an unknown unit are NaN unless default is given.
+        """
+        i, j = self.positions(from_units, default), self.positions(to_units, default)
+        values = np.asarray(values, dtype=np.float64)
+        result = values * self.slope[i, j] + self.intercept[i, j]
+        if default is None:
+            result = np.where((i < 0) | (j < 0), np.nan, result)
+        return result
+
+
+LENGTH = Dimension("length", {
+    "meters": 1, "kilometers": 1000, "centimeters": 0.01, "millimeters": 0.001,
+    "miles": 1609.344, "yards": 0.9144, "feet": 0.3048, "inches": 0.0254,
+})
+
+AREA = Dimension("area", {
+    "sqm": 1, "sqcm": 0.0001, "sqkm": 1_000_000, "sqft": 0.09290304, "sqin": 0.00064516,
+    "sqyd": 0.83612736, "acre": 4046.8564224, "hectare": 10_000,
+})
+
+WEIGHT = Dimension("weight", {
+    "kilograms": 1, "grams": 0.001, "milligrams": 0.000001,
+    "pounds": 0.45359237, "ounces": 0.028349523125, "tons": 1000,
+})
+
+VOLUME = Dimension("volume", {
+    "liters": 1, "milliliters": 0.001, "gallons": 3.785411784, "quarts": 0.946352946,
+    "pints": 0.473176473, "cups": 0.2365882365, "fluid_ounces": 0.0295735295625, "cubic_meters": 1000,
+})
+
+SPEED = Dimension("speed", {
+    "meters_per_second": 1, "kilometers_per_hour": Fraction(1000, 3600), "miles_per_hour": 0.44704,
+    "feet_per_second": 0.3048, "knots": Fraction(1852, 3600),
+})
+
+TIME = Dimension("time", {
+    "seconds": 1, "minutes": 60, "hours": 3600, "days": 86400, "weeks": 604800, "years": 31_536_000,
+})
+
+ENERGY = Dimension("energy", {
+    "joules": 1, "kilojoules": 1000, "calories": 4.184, "kilocalories": 4184,
+    "watt_hours": 3600, "kilowatt_hours": 3_600_000,
+})
+
+POWER = Dimension("power", {
+    "watts": 1, "kilowatts": 1000,
+    # 550 foot-pounds-force per second
+    "horsepower": 550 * Fraction("0.3048") * Fraction("0.45359237") * Fraction("9.80665"),
+    "btu_per_hour": Fraction("1055.05585262") / 3600,
+})
+
+PRESSURE = Dimension("pressure", {
+    "pascals": 1, "kilopascals": 1000, "bar": 100_000, "psi": Fraction("0.45359237") * Fraction("9.80665") / Fraction("0.0254") ** 2, "atmospheres": 101_325,
+})
+
+TEMPERATURE = Dimension("temperature", {
+    "kelvin": 1,
+    "celsius": (1, 273.15),
+    "fahrenheit": (Fraction(5, 9), Fraction("273.15") - 32 * Fraction(5, 9)),
+})
+
+DIMENSIONS = {dimension.name: dimension for dimension in (
+    LENGTH, AREA, WEIGHT, VOLUME, SPEED, TIME, ENERGY, POWER, PRESSURE, TEMPERATURE,
+)}
+
+UNIT_DIMENSIONS = {}
+for _dimension in DIMENSIONS.values():
+    for _unit in _dimension.units:
+        if _unit in UNIT_DIMENSIONS:
+            raise ValueError(f"Unit '{_unit}' is in both {UNIT_DIMENSIONS[_unit].name} and {_dimension.name}")
+        UNIT_DIMENSIONS[_unit] = _dimension
+
+
+def dimension_of(from_unit, to_unit):
+    """The dimension both units belong to; LookupError when either is unknown or they differ"""
+    for unit in (from_unit, to_unit):
+        if unit not in UNIT_DIMENSIONS:
+            raise LookupError(f"Unknown unit '{unit}'")
+    dimension = UNIT_DIMENSIONS[from_unit]
+    if UNIT_DIMENSIONS[to_unit] is not dimension:
+        raise LookupError(
+            f"Cannot convert {dimension.name} ({from_unit}) to {UNIT_DIMENSIONS[to_unit].name} ({to_unit})"
+        )
+    return dimension
+
+
+def convert_column(values, from_unit, to_unit):
+    """A list of values converted between two units of the same dimension
+
+    Returns (dimension, results, valid); valid is False where a value is
+    not a finite number. Anything but a flat list raises ValueError.
+    """
+    dimension = dimension_of(from_unit, to_unit)
+    if column_rank("values", values) != 1:
+        raise ValueError("values must be a list of numbers")
+    column = float_column(values)
+    with np.errstate(all="ignore"):
+        results = dimension.convert_array(column, from_unit, to_unit)
+    return dimension, results, np.isfinite(results)
+
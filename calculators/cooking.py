@@ -0,0 +1,34 @@
+"""Cooking calculators"""
+
+from .registry import calculator
+from .schema import number, text
+
+
+@calculator("recipe_scaler", inputs=[
+    number("original_servings", label="original servings"),
+    number("desired_servings", label="desired servings"),
+])
+def recipe_scaler(original_servings, desired_servings):
+    multiplier = desired_servings / original_servings
+    return f"Recipe Multiplier: {multiplier:.2f}x (multiply all ingredients by this)"
+
+
+@calculator("oven_temp", inputs=[
+    number("temp", label="temperature"),
+    text("from", required=False, dest="from_unit"),
+    text("to", required=False, dest="to_unit"),
+])
+def oven_temp(temp, from_unit, to_unit):
+    if from_unit == "fahrenheit" and to_unit == "celsius":
+        result = (temp - 32) * 5/9
+    elif from_unit == "celsius" and to_unit == "fahrenheit":
+        result = (temp * 9/5) + 32
+    else:
+        result = temp
+    return f"{temp}° {from_unit} = {result:.0f}° {to_unit}"
+
+
+@calculator("cooking_time", inputs=[number("weight"), number("time_per_unit", default=20.0, label="time per unit")])
+def cooking_time(weight, time_per_unit):
+    total_time = weight * time_per_unit
+    return f"Cooking Time: {total_time:.0f} minutes"
@@ -0,0 +1,107 @@
+"""Pearson and Spearman correlation matrices for many series at once
+
+Series are the columns of an (observations x series) array, and missing
+values are NaN. With no missing values the Pearson matrix is one
+product of the centered, normalized columns. With missing values, each
+pair uses only the rows where both series are present (pairwise
+deletion). The sums needed for that come from masked matrix products,
+so no Python loop over pairs is needed.
+"""
+import numpy as np
+
+MISSING_TOKENS = {"", "na", "n/a", "nan", "null", "none", "-"}
+
+
+def parse_series(text):
+    """Parse "name: 1, 2, , 4" lines into (names, array); blanks and NA are missing
+
+    Lines without a "name:" prefix are numbered. Shorter series are
+    padded with missing values.
+    """
+    names, columns = [], []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        name, sep, values = line.partition(":")
+        if not sep:
+            name, values = f"Series {len(names) + 1}", line
+        column = []
+        for token in values.split(","):
+            token = token.strip()
+            column.append(np.nan if token.lower() in MISSING_TOKENS else float(token))
+        names.append(name.strip())
+        columns.append(column)
+    if not columns:
+        raise ValueError("No series given")
+    length = max(len(column) for column in columns)
+    data = np.full((length, len(columns)), np.nan)
+    for i, column in enumerate(columns):
+        data[:len(column), i] = column
+    return names, data
+
+
+def pearson_matrix(data):
+    """N x N Pearson matrix of the columns of data (NaN = missing; NaN where undefined)"""
+    data = np.asarray(data, dtype=np.float64)
+    present = ~np.isnan(data)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if present.all():
+            centered = data - data.mean(axis=0)
+            normalized = centered / np.sqrt((centered ** 2).sum(axis=0))
+            matrix = normalized.T @ normalized
+        else:
+            # Pairwise-complete sums: entry (i, j) sums over rows where both i and j are present
+            # Shifting each column by its mean keeps the raw sums well conditioned
+            mask = present.astype(np.float64)
+            values = np.where(present, data - np.nanmean(data, axis=0), 0.0)
+            n = mask.T @ mask
+            sum_x = values.T @ mask
+            sum_xx = (values ** 2).T @ mask
+            sum_xy = values.T @ values
+            covariance = sum_xy - sum_x * sum_x.T / n
+            variance_x = sum_xx - sum_x ** 2 / n
+            matrix = covariance / np.sqrt(variance_x * variance_x.T)
+    return np.clip(matrix, -1.0, 1.0)
+
+
+def _rank(column):
+    """Average ranks (1-based, ties share their mean rank) of a 1-D array without NaN"""
+    order = np.argsort(column, kind="mergesort")
+    ordered = column[order]
+    starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+    group = np.cumsum(np.r_[True, ordered[1:] != ordered[:-1]]) - 1
+    bounds = np.r_[starts, column.size]
+    ranks = np.empty(column.size)
+    ranks[order] = (bounds[group] + bounds[group + 1] + 1) / 2
+    return ranks
+
+
+def _rank_columns(data):
+    ranks = np.full(data.shape, np.nan)
+    for i in range(data.shape[1]):
+        present = ~np.isnan(data[:, i])
+        ranks[present, i] = _rank(data[present, i])
+    return ranks
+
+
+def spearman_matrix(data):
+    """N x N Spearman matrix: Pearson on average ranks
+
+    Without missing values every column is ranked once. With missing
+    values, a pair whose missing rows differ is re-ranked over its shared
+    rows, as pairwise deletion requires.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    present = ~np.isnan(data)
+    matrix = pearson_matrix(_rank_columns(data))
+    if present.all():
+        return matrix
+    series = data.shape[1]
+    for i in range(series):
+        for j in range(i + 1, series):
+            if np.array_equal(present[:, i], present[:, j]):
+                continue
+            shared = present[:, i] & present[:, j]
+            pair = np.column_stack([_rank(data[shared, i]), _rank(data[shared, j])])
+            matrix[i, j] = matrix[j, i] = pearson_matrix(pair)[0, 1] if shared.sum() > 1 else np.nan
+    return matrix
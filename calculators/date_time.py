@@ -0,0 +1,117 @@
+"""Date & Time calculators"""
+from datetime import datetime, timedelta
+
+from .business_days import add_business_days, count_business_days
+from .calendar_math import anniversary, calendar_difference
+from .registry import calculator
+from .schema import date, integer, number, text, time_of_day
+from .timezones import convert, format_offset
+
+# Filled in by the registry with today's date when the caller omits it
+AS_OF = date("as_of", required=False, label="as-of date")
+# Where a Feb 29 birthday falls in common years (see calendar_math.LEAP_RULES)
+LEAP_RULE = text("leap_rule", default="feb28", label="leap-day rule")
+
+
+@calculator("age", time_dependent=True, inputs=[date("dob", label="date of birth"), AS_OF, LEAP_RULE])
+def age(dob, as_of, leap_rule):
+    if dob > as_of:
+        return "Error: Date of birth is after the as-of date"
+    years, months, days = calendar_difference(dob, as_of, leap_rule)
+    return f"Age: {years} years, {months} months, {days} days"
+
+
+@calculator("days_between", inputs=[date("date1", label="start date"), date("date2", label="end date")])
+def days_between(date1, date2):
+    days = abs((date2 - date1).days)
+    return f"Days between: {days} days"
+
+
+@calculator("date_add", inputs=[date("date"), integer("days", default=0)])
+def date_add(date, days):
+    result_date = date + timedelta(days=days)
+    return f"Result Date: {result_date.strftime('%Y-%m-%d')}"
+
+
+@calculator("weekday", inputs=[date("date")])
+def weekday(date):
+    weekday = date.strftime("%A")
+    return f"Day of Week: {weekday}"
+
+
+@calculator("leap_year", inputs=[integer("year")])
+def leap_year(year):
+    is_leap = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+    return f"{year} is {'a leap year' if is_leap else 'not a leap year'}"
+
+
+@calculator("age_difference", inputs=[date("date1", label="first date"), date("date2", label="second date"), LEAP_RULE])
+def age_difference(date1, date2, leap_rule):
+    years, months, days = calendar_difference(min(date1, date2), max(date1, date2), leap_rule)
+    return f"Age Difference: {years} years, {months} months, {days} days"
+
+
+@calculator("countdown", time_dependent=True, inputs=[date("date", label="target date"), AS_OF])
+def countdown(date, as_of):
+    today = as_of
+    days = (date - today).days
+    return f"Days Until Event: {days} days"
+
+
+@calculator("next_birthday", time_dependent=True, inputs=[date("dob", label="date of birth"), AS_OF, LEAP_RULE])
+def next_birthday(dob, as_of, leap_rule):
+    today = as_of
+    next_bday = anniversary(dob, today.year, leap_rule)
+    if next_bday < today:
+        next_bday = anniversary(dob, today.year + 1, leap_rule)
+    days = (next_bday - today).days
+    return f"Days Until Next Birthday: {days} days"
+
+
+# Optional holiday calendar name (see business_days.HOLIDAY_CALENDARS)
+HOLIDAYS = text("calendar", default="", label="holiday calendar")
+
+
+@calculator("work_days", inputs=[date("date1", label="start date"), date("date2", label="end date"), HOLIDAYS])
+def work_days(date1, date2, calendar):
+    workdays = count_business_days(date1, date2, calendar)
+    return f"Work Days: {workdays} days"
+
+
+@calculator("add_work_days", inputs=[date("date"), integer("days", default=0), HOLIDAYS])
+def add_work_days(date, days, calendar):
+    result_date = add_business_days(date, days, calendar)
+    return f"Result Date: {result_date.strftime('%Y-%m-%d')} ({result_date.strftime('%A')})"
+
+
+@calculator("time_zone", inputs=[
+    time_of_day("time"),
+    number("from_offset", default=0.0, label="from offset"),
+    number("to_offset", default=0.0, label="to offset"),
+    text("from_zone", required=False, label="from zone"),
+    text("to_zone", required=False, label="to zone"),
+    date("date", required=False),
+])
+def time_zone(time, from_offset, to_offset, from_zone, to_zone, date):
+    if not (from_zone or to_zone):
+        diff = to_offset - from_offset
+        new_time = time + timedelta(hours=diff)
+        return f"Converted Time: {new_time.strftime('%H:%M')}"
+    # Zone names follow DST on the given date; a side without a zone keeps its fixed offset
+    if date is None:
+        return "Error: Enter the date of the time to convert"
+    moment = datetime.combine(date.date(), time.time())
+    if from_zone:
+        instant = convert(moment, from_zone, "UTC")[0]
+    else:
+        instant = moment - timedelta(hours=from_offset)
+    if to_zone:
+        new_time, offset, abbreviation = convert(instant, "UTC", to_zone)
+    else:
+        offset = round(to_offset * 3600)
+        new_time, abbreviation = instant + timedelta(seconds=offset), ""
+    label = f"{abbreviation} " if abbreviation and abbreviation[0] not in "+-" else ""
+    return (
+        f"Converted Time: {new_time.strftime('%H:%M')} {label}(UTC{format_offset(offset)}) "
+        f"on {new_time.strftime('%Y-%m-%d')}"
+    )
@@ -0,0 +1,124 @@
+"""One-pass descriptive statistics
+
+Summary keeps count, mean, the sum of squared deviations (M2), min and
+max. It can be fed single values or whole numpy chunks, and two
+summaries merge exactly with Chan's parallel update. Chunked or
+partitioned data therefore never has to be held in memory at once.
+Quantiles use np.partition (introselect), which is linear time, instead
+of a full sort.
+"""
+import math
+from collections import Counter
+
+import numpy as np
+
+
+class Summary:
+    """Running count, mean, variance, min and max (Welford/Chan)"""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def of(cls, values):
+        summary = cls()
+        summary.add_array(values)
+        return summary
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def add_array(self, values):
+        """Fold a chunk of values in with one vectorized pass over the chunk"""
+        values = np.asarray(values, dtype=np.float64)
+        if not values.size:
+            return
+        chunk = Summary()
+        chunk.count = values.size
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other):
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        """Population variance (divides by n)"""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def sample_variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+def quantiles(values, qs):
+    """Linearly interpolated quantiles (numpy's default method) by selection, not sorting"""
+    values = np.asarray(values, dtype=np.float64)
+    positions = [q * (values.size - 1) for q in qs]
+    kth = sorted({int(math.floor(p)) for p in positions} | {int(math.ceil(p)) for p in positions})
+    selected = np.partition(values, kth)
+    results = []
+    for p in positions:
+        lo, hi = int(math.floor(p)), int(math.ceil(p))
+        results.append(float(selected[lo] + (selected[hi] - selected[lo]) * (p - lo)))
+    return results
+
+
+def median(values):
+    return quantiles(values, [0.5])[0]
+
+
+def modes(values):
+    """Most frequent values, in order of first appearance"""
+    counter = Counter(values)
+    top = max(counter.values())
+    return [value for value, count in counter.items() if count == top]
+
+
+def describe(values):
+    """Every statistic the stats calculators offer, from one parsed list"""
+    array = np.asarray(values, dtype=np.float64)
+    summary = Summary.of(array)
+    q1, q2, q3 = quantiles(array, [0.25, 0.5, 0.75])
+    return {
+        "count": summary.count,
+        "mean": summary.mean,
+        "median": q2,
+        "modes": modes(values),
+        "std": summary.std,
+        "variance": summary.variance,
+        "min": summary.min,
+        "max": summary.max,
+        "q1": q1,
+        "q3": q3,
+    }
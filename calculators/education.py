@@ -0,0 +1,65 @@
+"""Education calculators"""
+
+from .registry import calculator
+from .schema import integer, number, number_list, text
+
+GRADE_POINTS = {"A": 4.0, "A-": 3.7, "B+": 3.3, "B": 3.0, "B-": 2.7,
+                "C+": 2.3, "C": 2.0, "C-": 1.7, "D+": 1.3, "D": 1.0, "F": 0.0}
+
+
+@calculator("gpa", inputs=[text("grades")])
+def gpa(grades):
+    grades = [g.strip().upper() for g in grades.split(",")]
+    total = 0
+    count = 0
+    for grade in grades:
+        if grade in GRADE_POINTS:
+            total += GRADE_POINTS[grade]
+            count += 1
+    if count == 0:
+        return "Error: No valid grades found"
+    gpa = total / count
+    return f"GPA: {gpa:.2f} (based on {count} grades)"
+
+
+@calculator("cgpa", inputs=[number_list("gpas", label="GPAs")])
+def cgpa(gpas):
+    cgpa = sum(gpas) / len(gpas)
+    return f"CGPA: {cgpa:.2f} (average of {len(gpas)} semesters)"
+
+
+@calculator("grade", inputs=[number("earned"), number("total", gt=0)])
+def grade(earned, total):
+    percentage = (earned / total) * 100
+    if percentage >= 90:
+        letter = "A"
+    elif percentage >= 80:
+        letter = "B"
+    elif percentage >= 70:
+        letter = "C"
+    elif percentage >= 60:
+        letter = "D"
+    else:
+        letter = "F"
+    return f"Grade: {percentage:.1f}% ({letter})"
+
+
+@calculator("test_score", inputs=[integer("correct"), integer("total", gt=0)])
+def test_score(correct, total):
+    percentage = (correct / total) * 100
+    return f"Score: {correct}/{total} = {percentage:.1f}%"
+
+
+@calculator("final_grade", inputs=[
+    number("current", label="current grade"),
+    number("desired", label="desired grade"),
+    number("weight", gt=0, le=100, label="final exam weight"),
+])
+def final_grade(current, desired, weight):
+    needed = (desired - current * (100 - weight) / 100) / (weight / 100)
+    if needed > 100:
+        return f"Grade Needed: {needed:.1f}% (Not achievable - you need more than 100%)"
+    elif needed < 0:
+        return f"Grade Needed: 0% (You already have the desired grade!)"
+    else:
+        return f"Grade Needed on Final: {needed:.1f}%"
@@ -0,0 +1,33 @@
+"""Environment calculators"""
+import math
+
+from .registry import calculator
+from .schema import number
+
+
+@calculator("carbon_footprint", inputs=[
+    number("electricity", default=0.0),
+    number("gas", default=0.0),
+    number("car_miles", default=0.0, label="car miles"),
+    number("flights", default=0.0),
+])
+def carbon_footprint(electricity, gas, car_miles, flights):
+    total = (electricity * 0.92) + (gas * 5.3) + (car_miles * 0.404) + (flights * 90)
+    return f"Annual Carbon Footprint: {total:.2f} kg CO2"
+
+
+@calculator("tree_offset", inputs=[number("co2", label="CO2")])
+def tree_offset(co2):
+    trees = co2 / 21.77
+    return f"Trees Needed: {math.ceil(trees)} trees to offset {co2:.2f} kg CO2/year"
+
+
+@calculator("recycling", inputs=[
+    number("paper", default=0.0),
+    number("plastic", default=0.0),
+    number("glass", default=0.0),
+    number("metal", default=0.0),
+])
+def recycling(paper, plastic, glass, metal):
+    co2_saved = (paper * 3.3) + (plastic * 1.5) + (glass * 0.3) + (metal * 1.5)
+    return f"CO2 Saved by Recycling: {co2_saved:.2f} kg CO2/year"
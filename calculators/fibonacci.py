@@ -0,0 +1,97 @@
+"""Fibonacci numbers by fast doubling
+
+fib_pair(n) finds F(n) and F(n + 1) in O(log n) big-integer steps, or
+modulo m in O(log n) small ones. Terms with more than MAX_EXACT_DIGITS
+digits are summarised as their digit count plus leading and trailing
+digits. The count and leading digits come from Binet's formula, and the
+trailing digits from doubling mod 10^k. A summary never needs the full
+number, so it is cheap for any index.
+"""
+from decimal import Decimal, localcontext
+
+MAX_EXACT_DIGITS = 1000
+SUMMARY_DIGITS = 10
+# Indexes are limited to this many digits; a summary's cost grows with the index's length
+MAX_INDEX_DIGITS = 100
+MAX_INDEX = 10 ** MAX_INDEX_DIGITS
+
+
+def fib_pair(n, mod=None):
+    """(F(n), F(n + 1)), optionally reduced mod `mod`"""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib(n, mod=None):
+    return fib_pair(n, mod)[0]
+
+
+def _first_index_with_digits(digits):
+    limit = 10 ** (digits - 1)
+    n, a, b = 0, 0, 1
+    while a < limit:
+        n, a, b = n + 1, b, a + b
+    return n
+
+
+# Smallest index whose term is summarised instead of written out
+FIRST_SUMMARISED = _first_index_with_digits(MAX_EXACT_DIGITS + 1)
+
+
+def summary(n, trailing=None):
+    """(digit count, leading digits, trailing digits) of F(n), without computing F(n)"""
+    if trailing is None:
+        trailing = fib(n, 10 ** SUMMARY_DIGITS)
+    with localcontext() as context:
+        # Binet: log10 F(n) = n log10(phi) - log10(sqrt 5), the error term is negligible here
+        context.prec = len(str(n)) + 30
+        root5 = Decimal(5).sqrt()
+        log = n * ((1 + root5) / 2).log10() - root5.log10()
+        whole = int(log)
+        leading = int(Decimal(10) ** (log - whole + SUMMARY_DIGITS - 1))
+    return whole + 1, leading, trailing
+
+
+def format_summary(digits, leading, trailing):
+    return f"{leading}...{trailing:0{SUMMARY_DIGITS}d} ({digits:,} digits)"
+
+
+def format_term(n):
+    """F(n) written out, or summarised when it is too long"""
+    if n < FIRST_SUMMARISED:
+        return str(fib(n))
+    return format_summary(*summary(n))
+
+
+def sequence(start, end):
+    """Yield F(start) .. F(end - 1) as strings, seeded from one fast-doubling step
+
+    Only two terms are held at a time. Summarised terms are stepped
+    mod 10^SUMMARY_DIGITS, so big integers are never built for them.
+    """
+    exact_end = min(end, FIRST_SUMMARISED)
+    if start < exact_end:
+        a, b = fib_pair(start)
+        for _ in range(start, exact_end):
+            yield str(a)
+            a, b = b, a + b
+    start = max(start, exact_end)
+    if start < end:
+        mod = 10 ** SUMMARY_DIGITS
+        a, b = fib_pair(start, mod)
+        for n in range(start, end):
+            yield format_summary(*summary(n, a))
+            a, b = b, (a + b) % mod
@@ -0,0 +1,142 @@
+"""Finance calculators"""
+
+from .montecarlo import MAX_MONTHS, simulate_retirement
+from .registry import HEAVY, calculator
+from .schema import number, whole_number
+
+# Most Monte Carlo paths one calculator call may simulate
+MAX_SIMULATION_PATHS = 100_000
+
+
+@calculator("simple_interest", inputs=[number("principal", gt=0), number("rate", ge=0), number("time", gt=0)])
+def simple_interest(principal, rate, time):
+    interest = (principal * rate * time) / 100
+    return f"Interest: ${interest:,.2f}, Total: ${principal + interest:,.2f}"
+
+
+@calculator("compound_interest", inputs=[
+    number("principal", gt=0),
+    number("rate", ge=0),
+    number("time", gt=0),
+    number("compounds", default=12.0, gt=0, dest="n"),
+])
+def compound_interest(principal, rate, time, n):
+    rate = rate / 100
+    amount = principal * (1 + rate/n) ** (n * time)
+    return f"Amount: ${amount:,.2f}, Interest: ${amount - principal:,.2f}"
+
+
+@calculator("loan_payment", inputs=[number("principal", gt=0), number("rate", ge=0), number("months", gt=0)])
+def loan_payment(principal, rate, months):
+    rate = rate / 100 / 12
+    if rate == 0:
+        payment = principal / months
+    else:
+        payment = principal * (rate * (1 + rate)**months) / ((1 + rate)**months - 1)
+    return f"Monthly Payment: ${payment:,.2f}"
+
+
+@calculator("mortgage", inputs=[
+    number("price", gt=0),
+    number("down", ge=0, label="down payment"),
+    number("rate", ge=0),
+    number("years", gt=0),
+])
+def mortgage(price, down, rate, years):
+    loan_amount = price - down
+    monthly_rate = rate / 100 / 12
+    months = years * 12
+    if monthly_rate == 0:
+        payment = loan_amount / months
+    else:
+        payment = loan_amount * (monthly_rate * (1 + monthly_rate)**months) / ((1 + monthly_rate)**months - 1)
+    return f"Monthly Payment: ${payment:,.2f}, Loan Amount: ${loan_amount:,.2f}"
+
+
+@calculator("discount", inputs=[number("price", gt=0), number("discount", ge=0, le=100)])
+def discount(price, discount):
+    final = price * (1 - discount / 100)
+    saved = price - final
+    return f"Final Price: ${final:.2f}, Saved: ${saved:.2f}"
+
+
+@calculator("tip_calculator", inputs=[number("bill", gt=0), number("tip", dest="tip_percent")])
+def tip_calculator(bill, tip_percent):
+    tip = bill * (tip_percent / 100)
+    total = bill + tip
+    return f"Tip: ${tip:.2f}, Total: ${total:.2f}"
+
+
+@calculator("investment_return", inputs=[number("initial"), number("rate"), number("years")])
+def investment_return(initial, rate, years):
+    amount = initial * (1 + rate/100) ** years
+    return f"Future Value: ${amount:,.2f}, Return: ${amount - initial:,.2f}"
+
+
+@calculator("savings_goal", inputs=[number("goal"), number("rate", default=0.0), number("months")])
+def savings_goal(goal, rate, months):
+    rate = rate / 100 / 12
+    if rate > 0:
+        payment = goal * rate / ((1 + rate)**months - 1)
+    else:
+        payment = goal / months
+    return f"Monthly Savings Needed: ${payment:,.2f}"
+
+
+@calculator("retirement", inputs=[
+    number("age"),
+    number("retire_age", label="retirement age"),
+    number("monthly", label="monthly contribution"),
+    number("return", label="annual return", dest="annual_return"),
+])
+def retirement(age, retire_age, monthly, annual_return):
+    if age >= retire_age:
+        return "Error: Retirement age must be greater than current age"
+    years = retire_age - age
+    monthly_rate = annual_return / 100 / 12
+    months = years * 12
+    if monthly_rate == 0:
+        total = monthly * months
+    else:
+        total = monthly * (((1 + monthly_rate) ** months - 1) / monthly_rate)
+    return f"Retirement Savings: ${total:,.2f} after {years} years"
+
+
+@calculator("retirement_monte_carlo", cost=HEAVY, inputs=[
+    number("age"),
+    number("retire_age", label="retirement age"),
+    number("monthly", label="monthly contribution"),
+    number("return", label="annual return", dest="annual_return"),
+    number("volatility", default=15.0, ge=0, label="annual volatility"),
+    whole_number("paths", default=10_000, ge=1),
+    number("goal", required=False, ge=0),
+    whole_number("seed", default=0, ge=0),
+])
+def retirement_monte_carlo(age, retire_age, monthly, annual_return, volatility, paths, goal, seed):
+    if age >= retire_age:
+        return "Error: Retirement age must be greater than current age"
+    if paths > MAX_SIMULATION_PATHS:
+        return f"Error: At most {MAX_SIMULATION_PATHS:,} paths per calculation"
+    years = retire_age - age
+    months = max(1, round(years * 12))
+    if months > MAX_MONTHS:
+        return f"Error: Retirement must be at most {MAX_MONTHS // 12} years away"
+    result = simulate_retirement(months, monthly, annual_return, volatility, paths, seed, goal)
+    final = result["final"]
+    text = (
+        f"Median: ${final['p50']:,.2f}, 5th percentile: ${final['p5']:,.2f}, "
+        f"95th percentile: ${final['p95']:,.2f} after {years} years"
+    )
+    if goal is not None:
+        text += f", Chance of reaching ${goal:,.2f}: {result['probability']:.1%}"
+    return text
+
+
+@calculator("currency_converter", inputs=[
+    number("amount"),
+    number("from_rate", default=1.0, dest="from_curr"),
+    number("to_rate", default=1.0, dest="to_curr"),
+])
+def currency_converter(amount, from_curr, to_curr):
+    result = (amount / from_curr) * to_curr
+    return f"Converted Amount: {result:,.2f}"
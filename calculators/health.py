@@ -0,0 +1,119 @@
+"""Health calculators"""
+from datetime import timedelta
+
+from .registry import calculator
+from .schema import integer, number, text, time_of_day
+
+
+@calculator("bmi", inputs=[number("weight", gt=0), number("height", gt=0)])
+def bmi(weight, height):
+    height = height / 100
+    bmi = weight / (height ** 2)
+    category = "Underweight" if bmi < 18.5 else "Normal" if bmi < 25 else "Overweight" if bmi < 30 else "Obese"
+    return f"BMI: {bmi:.2f} ({category})"
+
+
+@calculator("bmr", inputs=[
+    number("weight", gt=0),
+    number("height", gt=0),
+    number("age", gt=0),
+    text("gender", required=False),
+])
+def bmr(weight, height, age, gender):
+    if gender == "male":
+        bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+    else:
+        bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+    return f"BMR: {bmr:.2f} calories/day"
+
+
+@calculator("body_fat", inputs=[
+    number("height"),
+    number("weight"),
+    number("waist", default=0.0),
+    text("gender", default="male"),
+])
+def body_fat(height, weight, waist, gender):
+    if waist > 0:
+        if gender == "male":
+            bf = 64 - (20 * (height / waist))
+        else:
+            bf = 76 - (20 * (height / waist))
+        return f"Estimated Body Fat: {bf:.1f}%"
+    return "Please provide waist measurement"
+
+
+@calculator("ideal_weight", inputs=[number("height"), text("gender", default="male")])
+def ideal_weight(height, gender):
+    if gender == "male":
+        ideal = 50 + 2.3 * ((height / 2.54) - 60)
+    else:
+        ideal = 45.5 + 2.3 * ((height / 2.54) - 60)
+    return f"Ideal Weight: {max(30, ideal):.1f} kg ({max(30, ideal) * 2.20462:.1f} lbs)"
+
+
+@calculator("calories_burned", inputs=[
+    number("weight"),
+    number("duration"),
+    text("activity", default="moderate"),
+])
+def calories_burned(weight, duration, activity):
+    mets = {"light": 3, "moderate": 5, "vigorous": 8}.get(activity, 5)
+    calories = mets * weight * (duration / 60)
+    return f"Calories Burned: {calories:.0f}"
+
+
+@calculator("water_intake", inputs=[number("weight"), number("activity", default=0.0)])
+def water_intake(weight, activity):
+    base = weight * 0.033
+    additional = activity * 0.5
+    total = base + additional
+    return f"Daily Water Intake: {total:.1f} liters ({total * 33.814:.1f} oz)"
+
+
+@calculator("heart_rate", inputs=[number("age")])
+def heart_rate(age):
+    max_hr = 220 - age
+    target_min = max_hr * 0.5
+    target_max = max_hr * 0.85
+    return f"Max HR: {max_hr:.0f} bpm, Target Zone: {target_min:.0f}-{target_max:.0f} bpm"
+
+
+PROTEIN_MULTIPLIERS = {"sedentary": 0.8, "moderate": 1.2, "active": 1.6, "athlete": 2.0}
+CARBS_MULTIPLIERS = {"sedentary": 3, "moderate": 5, "active": 7, "athlete": 10}
+
+
+@calculator("protein_needs", inputs=[number("weight"), text("activity", default="moderate")])
+def protein_needs(weight, activity):
+    protein = weight * PROTEIN_MULTIPLIERS.get(activity, 1.2)
+    return f"Daily Protein Needs: {protein:.1f}g"
+
+
+@calculator("carbs_needs", inputs=[number("weight"), text("activity", default="moderate")])
+def carbs_needs(weight, activity):
+    carbs = weight * CARBS_MULTIPLIERS.get(activity, 5)
+    return f"Daily Carbs Needs: {carbs:.1f}g"
+
+
+@calculator("fiber_needs", inputs=[integer("age"), text("gender", default="male")])
+def fiber_needs(age, gender):
+    if gender == "male":
+        fiber = 38 if age < 50 else 30
+    else:
+        fiber = 25 if age < 50 else 21
+    return f"Daily Fiber Needs: {fiber}g"
+
+
+@calculator("sleep_hours", inputs=[time_of_day("bedtime"), time_of_day("waketime", label="wake time")])
+def sleep_hours(bedtime, waketime):
+    if waketime < bedtime:
+        waketime += timedelta(days=1)
+    hours = (waketime - bedtime).seconds / 3600
+    cycles = hours / 1.5
+    return f"Sleep Duration: {hours:.1f} hours ({cycles:.1f} sleep cycles)"
+
+
+@calculator("alcohol_units", inputs=[number("volume"), number("abv")])
+def alcohol_units(volume, abv):
+    units = (volume * abv) / 1000
+    return f"Alcohol Units: {units:.2f} units"
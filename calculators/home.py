@@ -0,0 +1,73 @@
+"""Home calculators"""
+import math
+
+from .registry import calculator
+from .schema import number
+
+FLOOR = [number("length"), number("width")]
+
+
+@calculator("paint_needed", inputs=FLOOR + [
+    number("height", default=0.0),
+    number("coats", default=1.0),
+    number("coverage", default=350.0),
+])
+def paint_needed(length, width, height, coats, coverage):
+    if height > 0:
+        area = 2 * (length * width + length * height + width * height)
+    else:
+        area = length * width
+    gallons = (area * coats) / coverage
+    return f"Paint Needed: {gallons:.2f} gallons"
+
+
+@calculator("flooring", inputs=FLOOR + [number("waste", default=10.0)])
+def flooring(length, width, waste):
+    area = length * width
+    waste = waste / 100
+    total = area * (1 + waste)
+    return f"Flooring Needed: {total:.2f} sq units (including {waste*100:.0f}% waste)"
+
+
+@calculator("tile_needed", inputs=FLOOR + [number("tile_size", label="tile size")])
+def tile_needed(length, width, tile_size):
+    area = length * width
+    tiles = math.ceil(area / (tile_size ** 2))
+    return f"Tiles Needed: {tiles} ({tiles * tile_size ** 2:.2f} sq units)"
+
+
+@calculator("concrete", inputs=FLOOR + [number("depth")])
+def concrete(length, width, depth):
+    volume = length * width * depth
+    cubic_yards = volume / 27
+    return f"Concrete Needed: {cubic_yards:.2f} cubic yards"
+
+
+@calculator("fence", inputs=FLOOR)
+def fence(length, width):
+    perimeter = 2 * (length + width)
+    return f"Fence Length Needed: {perimeter:.2f} ft"
+
+
+@calculator("roofing", inputs=FLOOR + [number("pitch", default=0.0)])
+def roofing(length, width, pitch):
+    area = length * width
+    if pitch > 0:
+        area *= (1 + (pitch / 12) ** 2) ** 0.5
+    squares = area / 100
+    return f"Roofing Needed: {squares:.2f} squares ({area:.2f} sq ft)"
+
+
+@calculator("electricity_cost", inputs=[number("watts"), number("hours"), number("rate")])
+def electricity_cost(watts, hours, rate):
+    kwh = (watts * hours) / 1000
+    cost = kwh * rate
+    return f"Electricity Cost: ${cost:.2f} ({kwh:.2f} kWh)"
+
+
+@calculator("solar_panels", inputs=[number("monthly_bill", label="monthly bill"), number("rate", default=0.12)])
+def solar_panels(monthly_bill, rate):
+    kwh_per_month = monthly_bill / rate
+    kwh_per_day = kwh_per_month / 30
+    panels = kwh_per_day / 1.5
+    return f"Solar Panels Needed: {math.ceil(panels)} panels (250W each)"
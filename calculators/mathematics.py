@@ -0,0 +1,275 @@
+"""Math calculators"""
+import math
+import random
+
+from . import combinatorics
+from . import fibonacci as fib
+from .primes import factorize, is_prime
+from .registry import HEAVY, calculator
+from .schema import integer, number, text, whole_number, whole_number_list
+
+
+@calculator("percentage", inputs=[number("value"), number("percent")])
+def percentage(value, percent):
+    result = (value * percent) / 100
+    return f"{percent}% of {value} = {result}"
+
+
+@calculator("percentage_change", inputs=[
+    number("old", label="old value", dest="old_val"),
+    number("new", label="new value", dest="new_val"),
+])
+def percentage_change(old_val, new_val):
+    change = ((new_val - old_val) / old_val) * 100
+    return f"Percentage Change: {change:.2f}%"
+
+
+@calculator("percentage_of", inputs=[number("value"), number("percent")])
+def percentage_of(value, percent):
+    result = (value * percent) / 100
+    return f"{percent}% of {value} = {result:.2f}"
+
+
+@calculator("area_circle", inputs=[number("radius", gt=0)])
+def area_circle(radius):
+    area = math.pi * radius ** 2
+    return f"Area: {area:.2f} square units"
+
+
+@calculator("area_rectangle", inputs=[number("length", gt=0), number("width", gt=0)])
+def area_rectangle(length, width):
+    area = length * width
+    return f"Area: {area:.2f} square units"
+
+
+@calculator("area_triangle", inputs=[number("base", gt=0), number("height", gt=0)])
+def area_triangle(base, height):
+    area = 0.5 * base * height
+    return f"Area: {area:.2f} square units"
+
+
+@calculator("area_trapezoid", inputs=[number("base1"), number("base2"), number("height")])
+def area_trapezoid(base1, base2, height):
+    area = 0.5 * (base1 + base2) * height
+    return f"Area: {area:.2f} square units"
+
+
+@calculator("volume_sphere", inputs=[number("radius", gt=0)])
+def volume_sphere(radius):
+    volume = (4/3) * math.pi * radius ** 3
+    return f"Volume: {volume:.2f} cubic units"
+
+
+@calculator("volume_cube", inputs=[number("side")])
+def volume_cube(side):
+    volume = side ** 3
+    return f"Volume: {volume:.2f} cubic units"
+
+
+@calculator("volume_cylinder", inputs=[number("radius"), number("height")])
+def volume_cylinder(radius, height):
+    volume = math.pi * radius ** 2 * height
+    return f"Volume: {volume:.2f} cubic units"
+
+
+@calculator("pythagorean", inputs=[
+    number("a", required=False),
+    number("b", required=False),
+    number("c", required=False),
+])
+def pythagorean(a, b, c):
+    provided = sum(1 for x in [a, b, c] if x is not None)
+    if provided != 2:
+        return "Error: Please provide exactly 2 values to calculate the third"
+    if c is None:
+        if a <= 0 or b <= 0:
+            return "Error: All sides must be positive"
+        c = math.sqrt(a**2 + b**2)
+        return f"Hypotenuse (c): {c:.2f}"
+    elif a is None:
+        if b <= 0 or c <= 0 or c <= b:
+            return "Error: All sides must be positive and hypotenuse must be largest"
+        a = math.sqrt(c**2 - b**2)
+        return f"Side (a): {a:.2f}"
+    else:
+        if a <= 0 or c <= 0 or c <= a:
+            return "Error: All sides must be positive and hypotenuse must be largest"
+        b = math.sqrt(c**2 - a**2)
+        return f"Side (b): {b:.2f}"
+
+
+POINTS = [number("x1"), number("y1"), number("x2"), number("y2")]
+
+
+@calculator("distance", inputs=POINTS)
+def distance(x1, y1, x2, y2):
+    dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    return f"Distance: {dist:.2f} units"
+
+
+@calculator("slope", inputs=POINTS)
+def slope(x1, y1, x2, y2):
+    slope = (y2 - y1) / (x2 - x1) if (x2 - x1) != 0 else "undefined"
+    return f"Slope: {slope}"
+
+
+MODULUS = whole_number("modulus", required=False, ge=1)
+
+
+def _show(label, value):
+    """Format a combinatorics result tuple: exact, approximate or modular"""
+    kind = value[0]
+    if kind == "exact":
+        return f"{label} = {value[1]:,}"
+    if kind == "approx":
+        return f"{label} ≈ {value[2]} ({value[1]:,} digits)"
+    return f"{label} = {value[1]}"
+
+
+@calculator("factorial", cost=HEAVY, inputs=[whole_number("n", ge=0), MODULUS])
+def factorial(n, modulus):
+    label = f"{n}!" if modulus is None else f"{n}! mod {modulus}"
+    return _show(label, combinatorics.factorial(n, modulus))
+
+
+# gcd and lcm take a and b, plus any number of extra values in "numbers"
+MULTI_INTEGERS = [
+    whole_number("a", required=False),
+    whole_number("b", required=False),
+    whole_number_list("numbers", required=False, label="additional numbers"),
+]
+
+
+def _collect(a, b, numbers):
+    values = [x for x in (a, b) if x is not None] + (numbers or [])
+    if len(values) < 2:
+        raise TypeError("Please provide at least two numbers")
+    return values
+
+
+@calculator("gcd", inputs=MULTI_INTEGERS)
+def gcd(a, b, numbers):
+    values = _collect(a, b, numbers)
+    if not any(values):
+        return "Error: GCD is undefined when both numbers are zero"
+    result = math.gcd(*values)
+    return f"GCD({', '.join(map(str, values))}) = {result}"
+
+
+@calculator("lcm", inputs=MULTI_INTEGERS)
+def lcm(a, b, numbers):
+    values = _collect(a, b, numbers)
+    if 0 in values:
+        return "Error: LCM is undefined when either number is zero"
+    result = math.lcm(*values)
+    return f"LCM({', '.join(map(str, values))}) = {result}"
+
+
+@calculator("quadratic", inputs=[number("a"), number("b"), number("c")])
+def quadratic(a, b, c):
+    discriminant = b**2 - 4*a*c
+    if discriminant < 0:
+        return "No real solutions"
+    x1 = (-b + math.sqrt(discriminant)) / (2*a)
+    x2 = (-b - math.sqrt(discriminant)) / (2*a)
+    return f"Solutions: x1 = {x1:.2f}, x2 = {x2:.2f}"
+
+
+CHOOSE = [whole_number("n", ge=0), whole_number("r", ge=0), MODULUS]
+
+
+@calculator("permutation", cost=HEAVY, inputs=CHOOSE)
+def permutation(n, r, modulus):
+    if r > n:
+        return "Error: r must not be greater than n"
+    label = f"P({n},{r})" if modulus is None else f"P({n},{r}) mod {modulus}"
+    return _show(label, combinatorics.permutations(n, r, modulus))
+
+
+@calculator("combination", cost=HEAVY, inputs=CHOOSE)
+def combination(n, r, modulus):
+    if r > n:
+        return "Error: r must not be greater than n"
+    label = f"C({n},{r})" if modulus is None else f"C({n},{r}) mod {modulus}"
+    return _show(label, combinatorics.combinations(n, r, modulus))
+
+
+@calculator("binary", inputs=[integer("number", dest="num")])
+def binary(num):
+    return f"Binary: {bin(num)[2:]}"
+
+
+@calculator("hex", inputs=[integer("number", dest="num")])
+def hexadecimal(num):
+    return f"Hexadecimal: {hex(num)[2:].upper()}"
+
+
+@calculator("octal", inputs=[integer("number", dest="num")])
+def octal(num):
+    return f"Octal: {oct(num)[2:]}"
+
+
+@calculator("prime_check", cost=HEAVY, inputs=[whole_number("number", dest="num")])
+def prime_check(num):
+    return f"{num} is {'prime' if is_prime(num) else 'not prime'}"
+
+
+@calculator("prime_factorization", cost=HEAVY, inputs=[whole_number("number", ge=1, dest="num")])
+def prime_factorization(num):
+    factors, unfactored = factorize(num)
+    terms = [f"{p}^{e}" if e > 1 else str(p) for p, e in factors.items()]
+    if unfactored:
+        terms += [f"{m} (composite, not fully factored)" for m in unfactored]
+        return f"Partial Factorization: {num} = {' × '.join(terms)}"
+    if not terms:
+        return f"{num} has no prime factors"
+    return f"Prime Factorization: {num} = {' × '.join(terms)}"
+
+
+# Most terms one sequence response lists; later terms are reached with start
+FIBONACCI_PAGE = 1000
+
+
+@calculator("fibonacci", inputs=[
+    whole_number("n", ge=0, lt=fib.MAX_INDEX),
+    text("mode", default="sequence"),
+    whole_number("start", default=0, ge=0, lt=fib.MAX_INDEX),
+    whole_number("modulus", required=False, ge=1, lt=fib.MAX_INDEX),
+])
+def fibonacci(n, mode, start, modulus):
+    if mode == "term":
+        if modulus is not None:
+            return f"F({n}) mod {modulus} = {fib.fib(n, modulus)}"
+        return f"F({n}) = {fib.format_term(n)}"
+    if mode != "sequence":
+        return "Error: mode must be 'sequence' or 'term'"
+    if n <= 0:
+        return "Please enter a positive number"
+    if start >= n:
+        return "Error: start must be less than n"
+    end = min(n, start + FIBONACCI_PAGE)
+    result = f"Fibonacci Sequence: {', '.join(fib.sequence(start, end))}"
+    if end < n:
+        result += f" (terms {start}-{end - 1} of {n}; continue with start={end})"
+    return result
+
+
+@calculator("random_number", random=True, inputs=[
+    integer("min", default=1, label="minimum", dest="min_val"),
+    integer("max", default=100, label="maximum", dest="max_val"),
+])
+def random_number(min_val, max_val):
+    result = random.randint(min_val, max_val)
+    return f"Random Number: {result}"
+
+
+@calculator("roman_numeral", inputs=[integer("number", ge=1, le=3999)])
+def roman_numeral(number):
+    values = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
+    numerals = ["M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"]
+    result = ""
+    for i in range(len(values)):
+        count = number // values[i]
+        result += numerals[i] * count
+        number -= values[i] * count
+    return f"Roman Numeral: {result}"
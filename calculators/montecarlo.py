@@ -0,0 +1,143 @@
+"""Monte Carlo retirement savings with random monthly returns
+
+Each path multiplies the fixed nominal monthly growth 1 + r (r =
+annual_return / 12, as in the deterministic calculator) by a lognormal
+shock exp(sigma Z - sigma^2 / 2), whose expected value is one. With
+zero volatility every path reproduces that calculator's result.
+
+Paths are simulated in fixed-size blocks, and each block is vectorized
+across its paths. Block i always draws from child i of
+SeedSequence(seed). So a seed gives the same result whether the blocks
+run inline or are sharded across any number of processes. A block holds
+a (months x paths) array of shocks, so the horizon is capped at
+MAX_MONTHS, and a deadline is checked before each block.
+"""
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+BLOCK_PATHS = 10_000
+# Longest horizon simulated: 100 years (a block's shocks then take 48 MB)
+MAX_MONTHS = 1200
+# Yearly bands come from the first paths only; the final-balance
+# percentiles and goal probability always use every path
+BAND_PATHS = 100_000
+PERCENTILES = (5, 50, 95)
+
+
+def _simulate_block(months, monthly, monthly_rate, monthly_volatility, paths, seed, snapshots):
+    """Final balances of one block, plus its balances at each snapshot month when asked"""
+    rng = np.random.default_rng(seed)
+    # Mean-one lognormal shocks in float32; the fixed rate is applied in float64
+    shocks = rng.standard_normal((months, paths), dtype=np.float32)
+    shocks *= np.float32(monthly_volatility)
+    shocks -= np.float32(monthly_volatility ** 2 / 2)
+    np.exp(shocks, out=shocks)
+    growth = 1 + monthly_rate
+
+    balance = np.zeros(paths)
+    recorded = np.empty((len(snapshots), paths), dtype=np.float32) if snapshots else None
+    snapshot = 0
+    for month in range(months):
+        # Contributions arrive at the end of each month, as in the deterministic formula
+        balance *= shocks[month]
+        balance *= growth
+        balance += monthly
+        if snapshots and snapshot < len(snapshots) and snapshots[snapshot] == month + 1:
+            recorded[snapshot] = balance
+            snapshot += 1
+    return balance, recorded
+
+
+def _run_blocks(jobs, deadline=None):
+    """Simulate blocks in order; raises TimeoutError once time.time() passes deadline"""
+    results = []
+    for job in jobs:
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError()
+        results.append(_simulate_block(*job))
+    return results
+
+
+class ShardPool:
+    """Lazily started process pool that simulation blocks are spread over"""
+
+    def __init__(self, workers=0):
+        self.workers = workers
+        self._executor = None
+
+    def configure(self, workers=None):
+        if workers is not None and workers != self.workers:
+            self.shutdown()
+            self.workers = workers
+
+    def map(self, jobs, deadline=None):
+        """Run block jobs in order; inline when the pool has no workers
+
+        deadline is a time.time() value, so every shard checks the same one.
+        """
+        if self.workers <= 1 or len(jobs) <= 1:
+            return _run_blocks(jobs, deadline)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        shards = [jobs[i::self.workers] for i in range(self.workers)]
+        results = list(self._executor.map(_run_blocks, shards, [deadline] * len(shards)))
+        # Undo the round-robin split so blocks come back in seed order
+        ordered = [None] * len(jobs)
+        for i, shard in enumerate(results):
+            ordered[i::self.workers] = shard
+        return ordered
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+SHARD_POOL = ShardPool()
+
+
+def simulate_retirement(months, monthly, annual_return, volatility, paths, seed=0, goal=None, pool=None,
+                        deadline=None):
+    """Percentile bands of savings after each year and at the end
+
+    annual_return and volatility are percentages. Returns a dict with the
+    final-balance percentiles, the probability of ending at or above goal
+    (when given) and a list of yearly {"month", "p5", "p50", "p95"} bands.
+    Raises ValueError past MAX_MONTHS and TimeoutError once time.time()
+    passes deadline.
+    """
+    if months > MAX_MONTHS:
+        raise ValueError(f"horizon must be at most {MAX_MONTHS // 12} years")
+    monthly_rate = annual_return / 100 / 12
+    monthly_volatility = volatility / 100 / math.sqrt(12)
+    snapshots = list(range(12, months, 12)) + [months]
+    band_paths = min(paths, BAND_PATHS)
+
+    seeds = np.random.SeedSequence(seed).spawn(math.ceil(paths / BLOCK_PATHS))
+    jobs = []
+    for i, child in enumerate(seeds):
+        size = min(BLOCK_PATHS, paths - i * BLOCK_PATHS)
+        banded = i * BLOCK_PATHS < band_paths
+        jobs.append((months, monthly, monthly_rate, monthly_volatility, size, child, snapshots if banded else None))
+    blocks = (pool or SHARD_POOL).map(jobs, deadline)
+
+    final = np.concatenate([balance for balance, _ in blocks])
+    recorded = np.concatenate([snapshot for _, snapshot in blocks if snapshot is not None], axis=1)
+    bands = np.percentile(recorded[:, :band_paths], PERCENTILES, axis=1)
+    result = {
+        "paths": paths,
+        "months": months,
+        "final": dict(zip((f"p{q}" for q in PERCENTILES), np.percentile(final, PERCENTILES).tolist())),
+        "bands": [
+            {"month": month, **{f"p{q}": float(value) for q, value in zip(PERCENTILES, band)}}
+            for month, band in zip(snapshots, bands.T)
+        ],
+    }
+    if goal is not None:
+        result["goal"] = goal
+        result["probability"] = float(np.mean(final >= goal))
+    return result
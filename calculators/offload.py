@@ -0,0 +1,126 @@
+"""Process-pool offload with hard time limits for CPU-heavy calculators
+
+Handlers registered with cost=HEAVY, and any other module-level
+function a route hands to call(), run in a small pool of worker
+processes instead of the web worker's own thread. Each call has a
+deadline; when it passes, the worker running the call is killed and
+replaced, so a hostile input cannot stall the server for everyone else.
+"""
+import multiprocessing
+import queue
+import threading
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 5.0
+
+
+class CalculationTimeout(Exception):
+    pass
+
+
+def _evaluate_registered(calc_id, values):
+    from .registry import REGISTRY, _evaluate
+
+    return _evaluate(REGISTRY[calc_id], values)
+
+
+def _worker_loop(conn):
+    """Child process: run (function, args) requests until the pipe closes"""
+    while True:
+        try:
+            function, args = conn.recv()
+        except (EOFError, OSError):
+            break
+        conn.send(function(*args))
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def call(self, function, args, timeout):
+        self.conn.send((function, args))
+        if not self.conn.poll(timeout):
+            raise CalculationTimeout()
+        return self.conn.recv()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class HeavyTaskPool:
+    """A bounded set of worker processes, each running one call at a time"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def configure(self, workers=None, timeout=None):
+        if workers is not None:
+            self.workers = workers
+        if timeout is not None:
+            self.timeout = timeout
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def _acquire(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.workers:
+                self._created += 1
+                try:
+                    return _Worker(self._context)
+                except Exception:
+                    self._created -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise CalculationTimeout() from None
+
+    def _discard(self, worker):
+        worker.kill()
+        with self._lock:
+            self._created -= 1
+
+    def run(self, calc_id, values, timeout=None):
+        """Evaluate a handler in a worker process; raises CalculationTimeout past the deadline"""
+        return self.call(_evaluate_registered, calc_id, values, timeout=timeout)
+
+    def call(self, function, *args, timeout=None):
+        """function(*args) in a worker process; function must be importable at module level"""
+        timeout = self.timeout if timeout is None else timeout
+        worker = self._acquire(timeout)
+        try:
+            result = worker.call(function, args, timeout)
+        except BaseException:
+            # Timed out, cancelled or the worker died: never reuse it
+            self._discard(worker)
+            raise
+        self._idle.put(worker)
+        return result
+
+    def shutdown(self):
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(worker)
+
+
+HEAVY_POOL = HeavyTaskPool()
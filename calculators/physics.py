@@ -0,0 +1,71 @@
+"""Physics calculators"""
+
+from .registry import calculator
+from .schema import number
+
+
+@calculator("speed", inputs=[number("distance", gt=0), number("time", gt=0)])
+def speed(distance, time):
+    speed = distance / time
+    return f"Speed: {speed:.2f} units/time"
+
+
+@calculator("force", inputs=[number("mass", gt=0), number("acceleration")])
+def force(mass, acceleration):
+    force = mass * acceleration
+    return f"Force: {force:.2f} N"
+
+
+@calculator("kinetic_energy", inputs=[number("mass", gt=0), number("velocity")])
+def kinetic_energy(mass, velocity):
+    ke = 0.5 * mass * velocity ** 2
+    return f"Kinetic Energy: {ke:.2f} J"
+
+
+@calculator("potential_energy", inputs=[number("mass"), number("height")])
+def potential_energy(mass, height):
+    g = 9.81
+    pe = mass * g * height
+    return f"Potential Energy: {pe:.2f} J"
+
+
+@calculator("power_physics", inputs=[number("work", default=0.0), number("time", default=0.0)])
+def power_physics(work, time):
+    if work > 0 and time > 0:
+        power = work / time
+        return f"Power: {power:.2f} W"
+    return "Please provide work & time"
+
+
+@calculator("density", inputs=[number("mass"), number("volume")])
+def density(mass, volume):
+    density = mass / volume
+    return f"Density: {density:.2f} kg/m³"
+
+
+@calculator("pressure_physics", inputs=[number("force"), number("area")])
+def pressure_physics(force, area):
+    pressure = force / area
+    return f"Pressure: {pressure:.2f} Pa"
+
+
+@calculator("work", inputs=[number("force"), number("distance")])
+def work(force, distance):
+    work = force * distance
+    return f"Work: {work:.2f} J"
+
+
+@calculator("momentum", inputs=[number("mass"), number("velocity")])
+def momentum(mass, velocity):
+    momentum = mass * velocity
+    return f"Momentum: {momentum:.2f} kg·m/s"
+
+
+@calculator("acceleration", inputs=[
+    number("initial_velocity", default=0.0, label="initial velocity"),
+    number("final_velocity", label="final velocity"),
+    number("time"),
+])
+def acceleration(initial_velocity, final_velocity, time):
+    acceleration = (final_velocity - initial_velocity) / time
+    return f"Acceleration: {acceleration:.2f} m/s²"
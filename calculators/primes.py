@@ -0,0 +1,248 @@
+"""Primality testing, factorization and prime ranges
+
+is_prime() uses trial division by a small-prime table, then a
+deterministic Miller-Rabin test below 3.3e24 (which covers every 64-bit
+input) and a Baillie-PSW test above that. No composite is known to pass
+Baillie-PSW. factorize() strips small primes by trial division and splits
+what is left with Pollard's rho (Brent's variant) under a work budget.
+primes_between() is a segmented sieve that yields primes in
+numpy chunks, so its memory use depends on the segment size rather than
+the span.
+"""
+import math
+import time
+
+import numpy as np
+
+SMALL_PRIME_LIMIT = 1000
+
+
+def _simple_sieve(limit):
+    """All primes <= limit as a numpy int64 array"""
+    if limit < 2:
+        return np.array([], dtype=np.int64)
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve).astype(np.int64)
+
+
+SMALL_PRIMES = tuple(int(p) for p in _simple_sieve(SMALL_PRIME_LIMIT))
+
+# With these bases Miller-Rabin is exact for n < 3,317,044,064,679,887,385,961,981
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+
+
+def _strong_probable_prime(n, base):
+    """Miller-Rabin round: False means n is certainly composite"""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a, n):
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n):
+    """Strong Lucas test with Selfridge's parameters (n odd, not a square, > SMALL_PRIME_LIMIT)"""
+    D = 5
+    while True:
+        jacobi = _jacobi(D, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    # Binary ladder over the bits of d for U_k, V_k and Q^k (mod n), starting at k = 1
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            U = (U + n if U % 2 else U) // 2 % n
+            V = (V + n if V % 2 else V) // 2 % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+def is_prime(n):
+    """Exact for n < 3.3e24; Baillie-PSW (no known counterexample) above"""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True
+    if n < _MR_DETERMINISTIC_LIMIT:
+        return all(_strong_probable_prime(n, base) for base in _MR_BASES)
+    if not _strong_probable_prime(n, 2):
+        return False
+    if math.isqrt(n) ** 2 == n:
+        return False
+    return _strong_lucas_probable_prime(n)
+
+
+# Rho iterations factorize() spends before giving up on a cofactor (~1-2 s)
+DEFAULT_FACTOR_BUDGET = 2_000_000
+
+
+def _pollard_brent(n, c, budget):
+    """One Brent-rho attempt with x -> x^2 + c; returns (factor or None, iterations used)
+
+    The factor may be n itself when the attempt fails and a different c
+    should be tried. Differences are multiplied together and checked with
+    one gcd per batch rather than one per step.
+    """
+    batch = 128
+    y, r, q, g = 2, 1, 1, 1
+    used = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(batch, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += batch
+        used += 2 * r
+        r *= 2
+        if g == 1 and used >= budget:
+            return None, used
+    if g == n:
+        # The batch overshot; step through it one value at a time
+        while True:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+            if g > 1:
+                break
+    return g, used
+
+
+def factorize(n, budget=DEFAULT_FACTOR_BUDGET):
+    """Prime factors of n >= 1 as ({prime: exponent}, unfactored)
+
+    unfactored lists composite cofactors the budget ran out on; it is
+    empty when the factorization is complete.
+    """
+    factors = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    unfactored = []
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            pending += [root, root]
+            continue
+        divisor = None
+        c = 1
+        while divisor is None and budget > 0:
+            divisor, used = _pollard_brent(m, c, budget)
+            budget -= used
+            if divisor == m:
+                divisor = None
+                c += 1
+        if divisor is None:
+            unfactored.append(m)
+        else:
+            pending += [divisor, m // divisor]
+    return dict(sorted(factors.items())), sorted(unfactored)
+
+
+DEFAULT_SEGMENT = 1 << 20
+
+
+def primes_between(start, end, segment=DEFAULT_SEGMENT):
+    """Yield numpy int64 arrays of the primes in [start, end], in increasing order
+
+    Only odd numbers are sieved and each segment covers 2 * segment
+    integers, so memory use is bounded by the segment size and by the
+    base primes up to sqrt(end).
+    """
+    start = max(start, 2)
+    if end < start:
+        return
+    if start == 2:
+        yield np.array([2], dtype=np.int64)
+        start = 3
+    base = _simple_sieve(math.isqrt(end))[1:]  # odd base primes
+    low = start | 1
+    while low <= end:
+        # Segment covers the odd numbers low, low + 2, ..., up to end
+        size = min(segment, (end - low) // 2 + 1)
+        high = low + 2 * size
+        sieve = np.ones(size, dtype=bool)
+        for p in base[base * base < high].tolist():
+            first = max(p * p, -(-low // p) * p)
+            if first % 2 == 0:
+                first += p
+            sieve[(first - low) // 2::p] = False
+        primes = low + 2 * np.flatnonzero(sieve).astype(np.int64)
+        if len(primes):
+            yield primes
+        low = high
+
+
+def count_primes(start, end, segment=DEFAULT_SEGMENT, deadline=None):
+    """Number of primes in [start, end]
+
+    Raises TimeoutError when time.monotonic() passes deadline between segments.
+    """
+    count = 0
+    for chunk in primes_between(start, end, segment):
+        count += len(chunk)
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError()
+    return count
@@ -0,0 +1,136 @@
+"""Calculator handler registry and constant-time dispatch"""
+from dataclasses import dataclass
+from typing import Callable
+
+from . import clock
+from .cache import DAILY_CACHE, MISSING, RESULT_CACHE, make_key
+from .offload import HEAVY_POOL, CalculationTimeout
+from .schema import Schema, format_errors
+
+# Cost classes used to decide how a handler is run
+CHEAP = "cheap"
+HEAVY = "heavy"
+
+REGISTRY = {}
+
+
+@dataclass(frozen=True)
+class CalculatorSpec:
+    """A calculator handler plus the metadata other features key off"""
+    calc_id: str
+    handler: Callable
+    schema: Schema
+    # Time-dependent handlers take an as_of date, filled with today when omitted
+    time_dependent: bool = False
+    random: bool = False
+    cost: str = CHEAP
+
+    @property
+    def pure(self):
+        """Same inputs always give the same result"""
+        return not (self.time_dependent or self.random)
+
+
+def calculator(calc_id, inputs=(), **meta):
+    """Register the decorated function as the handler for calc_id
+
+    inputs is the list of schema fields; the handler is called with the
+    coerced values as keyword arguments.
+    """
+    def decorator(handler):
+        if calc_id in REGISTRY:
+            raise ValueError(f"Calculator '{calc_id}' is already registered")
+        REGISTRY[calc_id] = CalculatorSpec(calc_id, handler, Schema(inputs), **meta)
+        return handler
+    return decorator
+
+
+def get_spec(calc_id):
+    return REGISTRY.get(calc_id)
+
+
+def _evaluate(spec, values):
+    """Call a handler, turning exceptions into user-facing error strings"""
+    try:
+        return spec.handler(**values)
+    except ValueError:
+        return "Error: Invalid input - please check your numbers"
+    except ZeroDivisionError:
+        return "Error: Division by zero - please check your inputs"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+def _execute(spec, values):
+    """Evaluate inline, or in the worker pool under a deadline for HEAVY handlers
+
+    Returns (result, cacheable); timeouts and worker failures are not cached.
+    """
+    if spec.cost != HEAVY or not HEAVY_POOL.enabled:
+        return _evaluate(spec, values), True
+    try:
+        return HEAVY_POOL.run(spec.calc_id, values), True
+    except CalculationTimeout:
+        return f"Error: Calculation took longer than {HEAVY_POOL.timeout:g} seconds - please try smaller inputs", False
+    except (EOFError, OSError):
+        return "Error: Calculation failed - please try again", False
+
+
+def run(spec, data):
+    """Validate a payload and run its handler, memoizing all but random calculators
+
+    Returns (result, cacheable). cacheable is False for timeouts and worker
+    failures, which must not be stored by any cache, in-process or HTTP.
+    """
+    values, errors = spec.schema.validate(data)
+    if errors:
+        return format_errors(errors), True
+
+    if spec.random:
+        return _execute(spec, values)
+    cache = RESULT_CACHE
+    if spec.time_dependent:
+        # An explicit as-of date makes the call pure; otherwise the answer
+        # holds until the calendar date changes.
+        if values["as_of"] is None:
+            values["as_of"] = clock.today()
+            cache = DAILY_CACHE
+            cache.roll_over(values["as_of"])
+    key = make_key(spec.calc_id, values)
+    result = cache.get(key)
+    if result is not MISSING:
+        return result, True
+    result, cacheable = _execute(spec, values)
+    if cacheable:
+        cache.put(key, result)
+    return result, cacheable
+
+
+def calculate(calc_id, data):
+    """Perform calculations based on calculator ID"""
+    spec = REGISTRY.get(calc_id)
+    if spec is None:
+        return "Calculator not yet implemented"
+    return run(spec, data)[0]
+
+
+def calculate_batch(items):
+    """Evaluate many (calc_id, data) pairs, returning results in input order
+
+    Items are grouped by calculator so the registry lookup and schema are
+    resolved once per group rather than once per item.
+    """
+    results = [None] * len(items)
+    groups = {}
+    for index, (calc_id, data) in enumerate(items):
+        groups.setdefault(calc_id, []).append(index)
+
+    for calc_id, indexes in groups.items():
+        spec = REGISTRY.get(calc_id)
+        if spec is None:
+            for index in indexes:
+                results[index] = "Calculator not yet implemented"
+            continue
+        for index in indexes:
+            results[index] = run(spec, items[index][1])[0]
+    return results
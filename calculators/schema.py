@@ -0,0 +1,236 @@
+"""Declarative input schemas for calculator handlers
+
+Each handler declares its inputs as a list of fields. The list is compiled
+once into a Schema whose validate() coerces a whole payload in one pass and
+collects every error instead of stopping at the first one.
+"""
+import math
+import operator
+from collections.abc import Mapping
+from datetime import datetime
+
+FLOAT = "float"
+INT = "int"
+WHOLE = "whole"
+TEXT = "text"
+DATE = "date"
+TIME = "time"
+NUMBER_LIST = "number_list"
+WHOLE_LIST = "whole_list"
+
+
+class Field:
+    """One named input: its type, whether it is required, default and range"""
+
+    def __init__(self, name, kind=FLOAT, required=None, default=None, gt=None, ge=None,
+                 lt=None, le=None, label=None, dest=None):
+        self.name = name
+        self.kind = kind
+        # Fields without a default are required unless stated otherwise
+        self.required = default is None if required is None else required
+        self.default = default
+        self.gt, self.ge, self.lt, self.le = gt, ge, lt, le
+        self.label = label or name.replace('_', ' ')
+        self.dest = dest or name
+
+
+def number(name, **options):
+    return Field(name, FLOAT, **options)
+
+
+def integer(name, **options):
+    return Field(name, INT, **options)
+
+
+def whole_number(name, **options):
+    """An integer of any size, parsed exactly (no float round-trip, no truncation)"""
+    return Field(name, WHOLE, **options)
+
+
+def text(name, **options):
+    return Field(name, TEXT, **options)
+
+
+def date(name, **options):
+    return Field(name, DATE, **options)
+
+
+def time_of_day(name, **options):
+    return Field(name, TIME, **options)
+
+
+def number_list(name, **options):
+    return Field(name, NUMBER_LIST, **options)
+
+
+def whole_number_list(name, **options):
+    return Field(name, WHOLE_LIST, **options)
+
+
+def parse_float(value):
+    result = float(value)
+    if not math.isfinite(result):
+        raise ValueError(value)
+    return result
+
+
+def parse_int(value):
+    """Parse an integer exactly; decimal or exponent input is truncated"""
+    if isinstance(value, bool):
+        raise TypeError(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return int(parse_float(value))
+
+
+def parse_whole(value):
+    if isinstance(value, bool):
+        raise TypeError(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(value)
+        return int(value)
+    return int(value.strip())
+
+
+def parse_text(value):
+    return str(value).strip()
+
+
+def parse_date(value):
+    # fromisoformat is several times faster than strptime; strptime still
+    # takes the unpadded forms (2024-1-5) that the format has always allowed
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def parse_time(value):
+    return datetime.strptime(value, "%H:%M")
+
+
+def parse_number_list(value):
+    if isinstance(value, (list, tuple)):
+        numbers = [parse_float(item) for item in value]
+    else:
+        numbers = [parse_float(item) for item in value.split(",") if item.strip()]
+    if not numbers:
+        raise ValueError(value)
+    return numbers
+
+
+def parse_whole_list(value):
+    if isinstance(value, (list, tuple)):
+        numbers = [parse_whole(item) for item in value]
+    else:
+        numbers = [parse_whole(item) for item in value.split(",") if item.strip()]
+    if not numbers:
+        raise ValueError(value)
+    return numbers
+
+
+PARSERS = {
+    FLOAT: parse_float,
+    INT: parse_int,
+    WHOLE: parse_whole,
+    TEXT: parse_text,
+    DATE: parse_date,
+    TIME: parse_time,
+    NUMBER_LIST: parse_number_list,
+    WHOLE_LIST: parse_whole_list,
+}
+
+INVALID_MESSAGES = {
+    FLOAT: "{label} must be a valid number",
+    INT: "{label} must be a whole number",
+    WHOLE: "{label} must be a whole number",
+    TEXT: "{label} is not valid",
+    DATE: "{label} must be a date in YYYY-MM-DD format",
+    TIME: "{label} must be a time in HH:MM format",
+    NUMBER_LIST: "{label} must be a comma-separated list of numbers",
+    WHOLE_LIST: "{label} must be a comma-separated list of whole numbers",
+}
+
+
+def _fmt(bound):
+    # Huge whole-number bounds (e.g. 10**100) read better as 1e+100
+    return f"{bound:g}" if isinstance(bound, float) or abs(bound) >= 10**15 else str(bound)
+
+
+def _range_checks(field):
+    checks = []
+    if field.gt is not None:
+        checks.append((operator.gt, field.gt, f"{field.label} must be greater than {_fmt(field.gt)}"))
+    if field.ge is not None:
+        checks.append((operator.ge, field.ge, f"{field.label} must be at least {_fmt(field.ge)}"))
+    if field.lt is not None:
+        checks.append((operator.lt, field.lt, f"{field.label} must be less than {_fmt(field.lt)}"))
+    if field.le is not None:
+        checks.append((operator.le, field.le, f"{field.label} must be at most {_fmt(field.le)}"))
+    return tuple(checks)
+
+
+class Schema:
+    """A compiled list of fields
+
+    All per-field work that does not depend on the payload (parser lookup,
+    error message text, range checks) is done here, once.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.names = tuple(field.name for field in self.fields)
+        self._plan = tuple(
+            (
+                field.name,
+                field.dest,
+                PARSERS[field.kind],
+                field.required,
+                field.default,
+                _range_checks(field),
+                f"Please provide {field.label}",
+                INVALID_MESSAGES[field.kind].format(label=field.label),
+            )
+            for field in self.fields
+        )
+
+    def validate(self, data):
+        """Coerce a payload; returns (values, errors) with every error collected"""
+        if not isinstance(data, Mapping):
+            return {}, ["data must be an object"]
+        values = {}
+        errors = []
+        for name, dest, parse, required, default, checks, missing, invalid in self._plan:
+            raw = data.get(name)
+            if raw is None or raw == "":
+                if required:
+                    errors.append(missing)
+                else:
+                    values[dest] = default
+                continue
+            try:
+                value = parse(raw)
+            except (ValueError, TypeError, OverflowError, AttributeError):
+                errors.append(invalid)
+                continue
+            for test, bound, message in checks:
+                if not test(value, bound):
+                    errors.append(message)
+                    break
+            else:
+                values[dest] = value
+        return values, errors
+
+
+def format_errors(errors):
+    return "Error: " + "; ".join(errors)
@@ -0,0 +1,191 @@
+"""Mergeable sketches for statistics over inputs too large to hold
+
+KLLSketch answers quantile queries within about `error` of the true
+rank. FrequentItems (Misra-Gries) finds heavy hitters: every value that
+makes up more than an `error` fraction of the input is kept, and each
+count is low by at most error * n. Both use memory that depends on the
+error bound, not on the input size, and both merge, so chunks or
+partitions can be sketched separately and combined.
+"""
+import math
+from collections import Counter
+
+import numpy as np
+
+from .descriptive import Summary
+
+DEFAULT_ERROR = 0.01
+
+
+class KLLSketch:
+    """KLL quantile sketch: levels of sorted compactors, each item at level h weighs 2^h"""
+
+    def __init__(self, error=DEFAULT_ERROR, seed=None):
+        # Measured worst-case rank error stays under 3 / k
+        self.k = max(8, math.ceil(3 / error))
+        self.error = error
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update_array(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def update(self, x):
+        self.update_array([x])
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep every other item (random parity), doubling its weight;
+                # an odd one out stays behind at this level
+                spare = items[-1:] if items.size % 2 else items[:0]
+                paired = items[:items.size - spare.size]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[level] = spare
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs):
+        if not self.count:
+            return [math.nan for _ in qs]
+        items, cumulative = self._weighted()
+        total = cumulative[-1]
+        return [float(items[min(np.searchsorted(cumulative, q * total, side="left"), items.size - 1)]) for q in qs]
+
+    def quantile(self, q):
+        return self.quantiles([q])[0]
+
+    @property
+    def size(self):
+        return sum(items.size for items in self.levels)
+
+
+class FrequentItems:
+    """Misra-Gries heavy hitters with at most k counters (k = 1 / error)"""
+
+    def __init__(self, error=DEFAULT_ERROR):
+        self.k = max(1, math.ceil(1 / error))
+        self.error = error
+        self.counters = Counter()
+        self.count = 0
+
+    def update_array(self, values):
+        values, counts = np.unique(np.asarray(values), return_counts=True)
+        self._merge_counts(dict(zip(values.tolist(), counts.tolist())), int(counts.sum()))
+
+    def update(self, x):
+        self._merge_counts({x: 1}, 1)
+
+    def merge(self, other):
+        self._merge_counts(other.counters, other.count)
+
+    def _merge_counts(self, counts, total):
+        self.counters.update(counts)
+        self.count += total
+        if len(self.counters) > self.k:
+            # Subtract the (k+1)-th largest count from everything and drop what
+            # reaches zero; this is the mergeable-summaries reduction
+            cut = sorted(self.counters.values(), reverse=True)[self.k]
+            self.counters = Counter({v: c - cut for v, c in self.counters.items() if c > cut})
+
+    @property
+    def max_undercount(self):
+        """Each reported count is at most this much below the true count"""
+        return math.floor(self.count / (self.k + 1))
+
+    def top(self, n=10):
+        """[(value, lower-bound count)] for the n most frequent values"""
+        return self.counters.most_common(n)
+
+
+class StreamSketch:
+    """Exact summary plus quantile and heavy-hitter sketches over one stream"""
+
+    def __init__(self, error=DEFAULT_ERROR, seed=None):
+        self.summary = Summary()
+        self.quantile_sketch = KLLSketch(error, seed)
+        self.frequent = FrequentItems(error)
+
+    def update_array(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.summary.add_array(values)
+        self.quantile_sketch.update_array(values)
+        self.frequent.update_array(values)
+
+    def merge(self, other):
+        self.summary.merge(other.summary)
+        self.quantile_sketch.merge(other.quantile_sketch)
+        self.frequent.merge(other.frequent)
+
+    def report(self, qs=(0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99), top=10):
+        """JSON-ready results; statistics of an empty stream are None"""
+        summary = self.summary
+        quantiles = self.quantile_sketch.quantiles(qs) if summary.count else [None] * len(qs)
+        return {
+            "count": summary.count,
+            "mean": summary.mean if summary.count else None,
+            "std": summary.std if summary.count else None,
+            "variance": summary.variance if summary.count else None,
+            "min": summary.min if summary.count else None,
+            "max": summary.max if summary.count else None,
+            "quantiles": dict(zip((f"{q:g}" for q in qs), quantiles)),
+            "quantile_rank_error": self.quantile_sketch.error,
+            "top": [[value, count] for value, count in self.frequent.top(top)],
+            "top_max_undercount": self.frequent.max_undercount,
+        }
+
+
+def _finite(tokens):
+    numbers = np.array(tokens, dtype=np.float64)
+    # numpy accepts "nan" and "inf", which would poison every statistic
+    if not np.isfinite(numbers).all():
+        raise ValueError("numbers must be finite")
+    return numbers
+
+
+def read_numbers(stream, block_chars=1 << 20):
+    """Yield float64 arrays parsed block by block from text of comma/whitespace separated numbers
+
+    Raises ValueError for tokens that are not finite numbers.
+    """
+    carry = ""
+    while True:
+        block = stream.read(block_chars)
+        if not block:
+            break
+        text = (carry + block).replace(",", " ")
+        # The last token may continue into the next block
+        cut = max(text.rfind(" "), text.rfind("\n"), text.rfind("\t"), text.rfind("\r"))
+        carry, text = text[cut + 1:], text[:cut + 1]
+        tokens = text.split()
+        if tokens:
+            yield _finite(tokens)
+    if carry.strip():
+        yield _finite(carry.split())
@@ -0,0 +1,214 @@
+"""Goal seek: find the input value that makes a calculator produce a target
+
+The solver works on the numeric cores in vectorized.py, never on result
+strings. Where the formula can be inverted by hand (registered with
+@inverse), that inverse is used. Otherwise one vectorized call evaluates
+a grid across [lo, hi], which finds a bracket where the output crosses
+the target even when it is not monotonic. Brent's method then refines
+that bracket. Every point evaluated, grid points included, counts
+against max_evaluations, so a solve has a fixed worst-case cost.
+"""
+import math
+
+import numpy as np
+
+from .registry import get_spec
+from .schema import FLOAT, Schema
+from .vectorized import VECTORIZED
+
+GRID_POINTS = 33
+MAX_EVALUATIONS = 100
+INVERSES = {}
+
+
+def inverse(calc_id, output, free):
+    """Register fn(target, **inputs) -> value of `free` that gives `target` for `output`"""
+    def decorator(fn):
+        INVERSES[(calc_id, output, free)] = fn
+        return fn
+    return decorator
+
+
+@inverse("simple_interest", "interest", "principal")
+def _interest_principal(target, rate, time, **_):
+    return 100 * target / (rate * time)
+
+
+@inverse("simple_interest", "interest", "rate")
+def _interest_rate(target, principal, time, **_):
+    return 100 * target / (principal * time)
+
+
+@inverse("simple_interest", "interest", "time")
+def _interest_time(target, principal, rate, **_):
+    return 100 * target / (principal * rate)
+
+
+@inverse("simple_interest", "total", "principal")
+def _total_principal(target, rate, time, **_):
+    return target / (1 + rate * time / 100)
+
+
+@inverse("simple_interest", "total", "rate")
+def _total_rate(target, principal, time, **_):
+    return 100 * (target - principal) / (principal * time)
+
+
+@inverse("simple_interest", "total", "time")
+def _total_time(target, principal, rate, **_):
+    return 100 * (target - principal) / (principal * rate)
+
+
+@inverse("bmi", "bmi", "weight")
+def _bmi_weight(target, height, **_):
+    return target * (height / 100) ** 2
+
+
+@inverse("bmi", "bmi", "height")
+def _bmi_height(target, weight, **_):
+    return 100 * math.sqrt(weight / target)
+
+
+def _brent(f, a, b, fa, fb, xtol, ftol, budget):
+    """Root of f in [a, b] (fa, fb of opposite sign); returns (x, f(x), evaluations, converged)"""
+    c, fc = b, fb
+    d = e = b - a
+    evaluations = 0
+    while True:
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + xtol / 2
+        middle = (c - b) / 2
+        if abs(middle) <= tol or abs(fb) <= ftol:
+            return b, fb, evaluations, True
+        if evaluations >= budget:
+            return b, fb, evaluations, False
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation, or secant when only two points are distinct
+            s = fb / fa
+            if a == c:
+                p, q = 2 * middle * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * middle * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * middle * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = middle
+        else:
+            d = e = middle
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, middle)
+        fb = f(b)
+        evaluations += 1
+
+
+def _numeric_outputs(formula, inputs):
+    with np.errstate(all="ignore"):
+        results = formula(**inputs)
+    return [name for name, values in results.items() if np.asarray(values).dtype.kind == "f"]
+
+
+def solve(calc_id, target, solve_for, data, lo=None, hi=None, output=None, max_evaluations=MAX_EVALUATIONS):
+    """Value of input `solve_for` in [lo, hi] that makes `output` equal `target`
+
+    data holds the other inputs, as they would be posted to /calculate.
+    Returns a dict with the value, the output it gives, the method used
+    and the number of evaluations. Raises LookupError for calculators
+    without a numeric core and ValueError for unusable inputs.
+    """
+    spec = get_spec(calc_id)
+    formula = VECTORIZED.get(calc_id)
+    if spec is None or formula is None:
+        raise LookupError(f"Calculator '{calc_id}' cannot be solved for an input")
+    field = next((field for field in spec.schema.fields if field.name == solve_for), None)
+    if field is None or field.kind != FLOAT:
+        raise ValueError(f"'{solve_for}' is not a numeric input of {calc_id}")
+
+    # The other inputs must be valid as given; the free one must stay inside its own limits
+    values, errors = Schema([other for other in spec.schema.fields if other is not field]).validate(data)
+    free_limits = Schema([field])
+    for bound in (lo, hi):
+        if bound is not None:
+            errors += free_limits.validate({solve_for: bound})[1]
+    if errors:
+        raise ValueError("; ".join(errors))
+    inputs = {name: np.asarray(value) for name, value in values.items()}
+    inputs[field.dest] = np.asarray(lo if lo is not None else hi if hi is not None else 1.0)
+
+    outputs = _numeric_outputs(formula, inputs)
+    if output is None:
+        # The first output is the calculator's headline result
+        output = outputs[0]
+    elif output not in outputs:
+        raise ValueError(f"'{output}' is not a numeric output of {calc_id}")
+
+    def evaluate(x):
+        with np.errstate(all="ignore"):
+            return formula(**{**inputs, field.dest: np.asarray(x, dtype=np.float64)})[output] - target
+
+    analytic = INVERSES.get((calc_id, output, solve_for))
+    if analytic is not None:
+        try:
+            with np.errstate(all="ignore"):
+                x = float(analytic(target, **{name: float(value) for name, value in values.items()}))
+        except (ZeroDivisionError, ValueError):
+            x = math.nan
+        outside = (lo is not None and x < lo) or (hi is not None and x > hi)
+        if not math.isfinite(x) or outside or free_limits.validate({solve_for: x})[1]:
+            raise ValueError(f"No {solve_for} gives {output} = {target:g}" + _range_note(lo, hi))
+        return _result(solve_for, x, output, float(evaluate(x)) + target, "analytic", 1, True)
+
+    if lo is None or hi is None or not lo < hi:
+        raise ValueError("Give bounds lo < hi for the input being solved")
+    points = min(GRID_POINTS, max_evaluations)
+    if points < 2:
+        raise ValueError("max_evaluations must be at least 2")
+    grid = np.linspace(lo, hi, points)
+    gaps = np.asarray(evaluate(grid), dtype=np.float64)
+    finite = np.isfinite(gaps)
+
+    exact = np.flatnonzero(finite & (gaps == 0))
+    if exact.size:
+        x = float(grid[exact[0]])
+        return _result(solve_for, x, output, target, "grid", points, True)
+    crossing = np.flatnonzero(finite[:-1] & finite[1:] & (np.sign(gaps[:-1]) != np.sign(gaps[1:])))
+    if not crossing.size:
+        reached = gaps[finite] + target
+        span = f" (it ranges from {reached.min():g} to {reached.max():g})" if reached.size else ""
+        raise ValueError(f"No {solve_for} in [{lo:g}, {hi:g}] gives {output} = {target:g}{span}")
+
+    i = crossing[0]
+    ftol = 1e-12 * max(1.0, abs(target))
+    xtol = 1e-12 * (abs(lo) + abs(hi))
+    x, gap, used, converged = _brent(
+        lambda x: float(evaluate(x)), float(grid[i]), float(grid[i + 1]), float(gaps[i]), float(gaps[i + 1]),
+        xtol, ftol, max_evaluations - points,
+    )
+    return _result(solve_for, x, output, gap + target, "brent", points + used, converged)
+
+
+def _range_note(lo, hi):
+    if lo is None and hi is None:
+        return ""
+    return f" in [{'-inf' if lo is None else f'{lo:g}'}, {'inf' if hi is None else f'{hi:g}'}]"
+
+
+def _result(solve_for, value, output, achieved, method, evaluations, converged):
+    return {
+        "solve_for": solve_for,
+        "value": value,
+        "output": output,
+        "achieved": achieved,
+        "method": method,
+        "evaluations": evaluations,
+        "converged": converged,
+    }
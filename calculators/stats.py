@@ -0,0 +1,87 @@
+"""Statistics calculators"""
+import math
+
+from . import descriptive
+from .correlation import parse_series, pearson_matrix, spearman_matrix
+from .descriptive import Summary
+from .registry import calculator
+from .schema import number_list, text
+
+NUMBERS = [number_list("numbers")]
+
+
+@calculator("mean", inputs=NUMBERS)
+def mean(numbers):
+    mean = Summary.of(numbers).mean
+    return f"Mean: {mean:.2f}"
+
+
+@calculator("median", inputs=NUMBERS)
+def median(numbers):
+    median = descriptive.median(numbers)
+    return f"Median: {median:.2f}"
+
+
+@calculator("mode", inputs=NUMBERS)
+def mode(numbers):
+    modes = descriptive.modes(numbers)
+    return f"Mode: {modes}"
+
+
+@calculator("standard_deviation", inputs=NUMBERS)
+def standard_deviation(numbers):
+    std_dev = Summary.of(numbers).std
+    return f"Standard Deviation: {std_dev:.2f}"
+
+
+@calculator("variance", inputs=NUMBERS)
+def variance(numbers):
+    variance = Summary.of(numbers).variance
+    return f"Variance: {variance:.2f}"
+
+
+@calculator("describe", inputs=NUMBERS)
+def describe(numbers):
+    stats = descriptive.describe(numbers)
+    return (
+        f"Count: {stats['count']}, Mean: {stats['mean']:.2f}, Median: {stats['median']:.2f}, "
+        f"Mode: {stats['modes']}, Standard Deviation: {stats['std']:.2f}, Variance: {stats['variance']:.2f}, "
+        f"Min: {stats['min']:.2f}, Q1: {stats['q1']:.2f}, Q3: {stats['q3']:.2f}, Max: {stats['max']:.2f}"
+    )
+
+
+@calculator("correlation", inputs=[number_list("x_values", label="X values"), number_list("y_values", label="Y values")])
+def correlation(x_values, y_values):
+    if len(x_values) != len(y_values):
+        return "Error: X and Y must have same number of values"
+    correlation = pearson_matrix(list(zip(x_values, y_values)))[0, 1]
+    if math.isnan(correlation):
+        correlation = 0
+    # Adding 0.0 turns a rounded -0.0 into 0.0 so it never prints as "-0.0000"
+    correlation = round(correlation, 4) + 0.0
+    return f"Correlation Coefficient: {correlation:.4f}"
+
+
+def _format_matrix(names, matrix):
+    width = max(len(name) for name in names)
+    rows = [" " * width + "  " + "  ".join(f"{name:>8}" for name in names)]
+    for name, row in zip(names, matrix):
+        cells = "  ".join("     n/a" if math.isnan(r) else f"{r:8.4f}" for r in row)
+        rows.append(f"{name:<{width}}  {cells}")
+    return "\n".join(rows)
+
+
+@calculator("correlation_matrix", inputs=[text("series"), text("method", default="both")])
+def correlation_matrix(series, method):
+    """Pearson and/or Spearman matrices for every pair of series at once"""
+    if method not in ("pearson", "spearman", "both"):
+        return "Error: method must be 'pearson', 'spearman' or 'both'"
+    names, data = parse_series(series)
+    if len(names) < 2:
+        return "Error: Enter at least two series, one per line"
+    sections = []
+    if method in ("pearson", "both"):
+        sections.append("Pearson\n" + _format_matrix(names, pearson_matrix(data)))
+    if method in ("spearman", "both"):
+        sections.append("Spearman\n" + _format_matrix(names, spearman_matrix(data)))
+    return "\n\n".join(sections)
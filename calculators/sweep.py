@@ -0,0 +1,193 @@
+"""Parameter sweeps: evaluate a calculator over the Cartesian grid of its inputs
+
+Each swept input is one axis of the grid. Its values come from a list,
+a {"start", "stop", "step"} range or a {"start", "stop", "num"}
+linspace. Fixed inputs are plain values. The calculator's vectorized
+formula evaluates the grid by broadcasting, one slab of the first axis
+at a time. So the grid is never built as a list of rows, and memory
+follows the slab size rather than the grid size.
+"""
+import json
+import math
+
+import numpy as np
+
+from .columns import column_rank, float_column
+from .registry import get_spec
+from .schema import FLOAT, TEXT
+from .vectorized import VECTORIZED, in_bounds
+
+# Cells evaluated per slab
+CHUNK_CELLS = 100_000
+# Significant digits written to CSV and JSON tables
+DIGITS = 10
+
+
+def _axis_values(field, value, max_values):
+    """Values of a swept input, or None when the input is fixed"""
+    if isinstance(value, dict):
+        if field.kind != FLOAT:
+            raise ValueError(f"Range for '{field.name}' needs a numeric input")
+        try:
+            start, stop = float(value["start"]), float(value["stop"])
+            if "num" in value:
+                count = int(value["num"])
+            else:
+                step = float(value["step"])
+                if step <= 0 or not stop >= start:
+                    raise ValueError()
+                # Include stop when it lies on the grid, despite float rounding
+                count = math.floor((stop - start) / step + 1e-9) + 1
+        except (KeyError, TypeError, ValueError, OverflowError):
+            raise ValueError(
+                f"Range for '{field.name}' needs start <= stop and a step > 0, or start, stop and num"
+            ) from None
+        if not 1 <= count <= max_values:
+            raise ValueError(f"Range for '{field.name}' must have between 1 and {max_values:,} values")
+        if not (math.isfinite(start) and math.isfinite(stop)):
+            raise ValueError(f"Range for '{field.name}' must have finite start and stop")
+        if "num" in value:
+            return np.linspace(start, stop, count)
+        return start + step * np.arange(count)
+    if isinstance(value, (list, tuple)):
+        if not 1 <= len(value) <= max_values:
+            raise ValueError(f"List for '{field.name}' must have between 1 and {max_values:,} values")
+        column_rank(field.name, value)
+        if field.kind != FLOAT:
+            return np.asarray(value, dtype=object)
+        values = float_column(value)
+        if not np.isfinite(values).all():
+            raise ValueError(f"List for '{field.name}' must contain only finite numbers")
+        return values
+    return None
+
+
+class Sweep:
+    """The grid of one calculator's inputs; swept inputs vary, the rest are fixed"""
+
+    def __init__(self, calc_id, inputs, every=1, max_cells=math.inf):
+        spec = get_spec(calc_id)
+        self.formula = VECTORIZED.get(calc_id)
+        if spec is None or self.formula is None:
+            raise LookupError(f"Calculator '{calc_id}' has no sweep mode")
+        unknown = set(inputs) - set(spec.schema.names)
+        if unknown:
+            raise ValueError(f"Unknown inputs: {', '.join(sorted(unknown))}")
+
+        self.fixed = {}
+        self.axes = []
+        for field in spec.schema.fields:
+            value = inputs.get(field.name)
+            if value is None:
+                if field.required:
+                    raise ValueError(f"Missing input '{field.name}'")
+                value = field.default
+            if field.kind not in (FLOAT, TEXT):
+                raise ValueError(f"Input '{field.name}' cannot be swept")
+            values = _axis_values(field, value, max_cells)
+            if values is None:
+                values = np.asarray([value], dtype=np.float64 if field.kind == FLOAT else object)
+                if field.kind == FLOAT and not in_bounds(field, float_column(values))[0]:
+                    raise ValueError(f"Input '{field.name}' must be a number within its limits")
+                self.fixed[field.dest] = values[0] if field.kind == TEXT else np.float64(values[0])
+                continue
+            values = values[::every]
+            valid = in_bounds(field, values) if field.kind == FLOAT else np.ones(values.size, dtype=bool)
+            self.axes.append((field, values, valid))
+        if not self.axes:
+            raise ValueError("Give a list or range for at least one input")
+
+        self.shape = tuple(values.size for _, values, _ in self.axes)
+        self.cells = math.prod(self.shape)
+        if self.cells > max_cells:
+            raise ValueError(f"Grid has {self.cells:,} cells, at most {max_cells:,} allowed")
+        self.input_names = [field.name for field, _, _ in self.axes]
+        with np.errstate(all="ignore"):
+            sample = self.formula(**self._inputs(slice(0, 1)))
+        self.output_names = list(sample)
+        self.numeric_outputs = [name for name, values in sample.items() if np.asarray(values).dtype.kind == "f"]
+
+    def _inputs(self, rows):
+        """Formula arguments for a slab of the first axis, shaped to broadcast"""
+        arguments = dict(self.fixed)
+        for i, (field, values, _) in enumerate(self.axes):
+            shape = [1] * len(self.axes)
+            shape[i] = -1
+            arguments[field.dest] = (values[rows] if i == 0 else values).reshape(shape)
+        return arguments
+
+    def slabs(self, chunk_cells=CHUNK_CELLS):
+        """Yield (inputs, outputs, valid) as flat arrays in row-major grid order"""
+        per_row = self.cells // self.shape[0]
+        step = max(1, chunk_cells // per_row)
+        for first in range(0, self.shape[0], step):
+            rows = slice(first, first + step)
+            with np.errstate(all="ignore"):
+                results = self.formula(**self._inputs(rows))
+            shape = (len(range(*rows.indices(self.shape[0]))),) + self.shape[1:]
+            grids = np.meshgrid(*[
+                (values[rows] if i == 0 else values) for i, (_, values, _) in enumerate(self.axes)
+            ], indexing="ij")
+            valid = np.ones(shape, dtype=bool)
+            for i, (_, _, axis_valid) in enumerate(self.axes):
+                axis_shape = [1] * len(self.axes)
+                axis_shape[i] = -1
+                valid &= (axis_valid[rows] if i == 0 else axis_valid).reshape(axis_shape)
+            outputs = {}
+            for name, values in results.items():
+                values = np.broadcast_to(values, shape)
+                if values.dtype.kind == "f":
+                    valid &= np.isfinite(values)
+                outputs[name] = values.ravel()
+            inputs = {name: grid.ravel() for name, grid in zip(self.input_names, grids)}
+            yield inputs, outputs, valid.ravel()
+
+    def aggregate(self):
+        """min, max, argmin and argmax (as input values) of every numeric output over valid cells"""
+        best = {name: {"count": 0, "min": None, "max": None, "argmin": None, "argmax": None}
+                for name in self.numeric_outputs}
+        for inputs, outputs, valid in self.slabs():
+            if not valid.any():
+                continue
+            for name in self.numeric_outputs:
+                stats = best[name]
+                values = np.where(valid, outputs[name], np.nan)
+                stats["count"] += int(valid.sum())
+                low, high = int(np.nanargmin(values)), int(np.nanargmax(values))
+                if stats["min"] is None or values[low] < stats["min"]:
+                    stats["min"], stats["argmin"] = float(values[low]), _cell(inputs, low)
+                if stats["max"] is None or values[high] > stats["max"]:
+                    stats["max"], stats["argmax"] = float(values[high]), _cell(inputs, high)
+        return {"cells": self.cells, "outputs": best}
+
+    def _lines(self, inputs, outputs, valid, text, missing, prefix="", suffix=""):
+        """One formatted line per cell; invalid cells get `missing` in place of every output"""
+        columns = [inputs[name] for name in self.input_names] + [outputs[name] for name in self.output_names]
+        values = [column.tolist() if column.dtype.kind == "f" else list(map(text, column.tolist())) for column in columns]
+        templates = [f"{{:.{DIGITS}g}}" if column.dtype.kind == "f" else "{}" for column in columns]
+        lines = list(map((prefix + ",".join(templates) + suffix).format, *values))
+        known = len(self.input_names)
+        partial = prefix + ",".join(templates[:known] + [missing] * len(self.output_names)) + suffix
+        for i in np.flatnonzero(~valid).tolist():
+            lines[i] = partial.format(*(column[i] for column in values[:known]))
+        return lines
+
+    def csv_chunks(self):
+        """Yield the table as CSV text, one slab per chunk; invalid cells have empty outputs"""
+        yield ",".join(self.input_names + self.output_names) + "\n"
+        for slab in self.slabs():
+            yield "\n".join(self._lines(*slab, text=str, missing="")) + "\n"
+
+    def json_chunks(self):
+        """Yield {"columns", "cells", "rows"} as JSON text; invalid cells have null outputs"""
+        yield json.dumps({"columns": self.input_names + self.output_names, "cells": self.cells})[:-1] + ', "rows": ['
+        separator = ""
+        for slab in self.slabs():
+            yield separator + ",".join(self._lines(*slab, text=json.dumps, missing="null", prefix="[", suffix="]"))
+            separator = ","
+        yield "]}"
+
+
+def _cell(inputs, index):
+    return {name: values[index].item() if hasattr(values[index], "item") else values[index]
+            for name, values in inputs.items()}
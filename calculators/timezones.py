@@ -0,0 +1,358 @@
+"""IANA time-zone conversion from precomputed UTC-offset transition tables
+
+A ZoneTable holds a zone's history as two sorted arrays. One holds the
+UTC instants at which the offset changes. The other holds the offset
+(and abbreviation) in force from each instant on. Finding the offset at
+an instant is a bisect, or a single np.searchsorted for a whole column.
+The explicit transitions are read from the zone's TZif file. Where the
+file ends in a recurring DST rule, the table is extended to
+TABLE_END_YEAR by asking zoneinfo. Instants past the table go to
+zoneinfo directly.
+
+Building a table costs a file read and a few thousand zoneinfo calls,
+so ZONES keeps the most recently used tables in an LRU.
+"""
+import bisect
+import importlib.resources
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from zoneinfo import TZPATH, ZoneInfo
+
+import numpy as np
+
+DEFAULT_MAX_ZONES = 64
+# Recurring DST rules are expanded into the table up to the end of this year
+TABLE_END_YEAR = 2100
+# Step used to find rule-based transitions; DST periods are far longer than this
+_SCAN_STEP = 7 * 86400
+_DAY = 86400
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+# Epoch seconds of the first and last second datetime can represent
+_FIRST = (datetime.min - _EPOCH) // _SECOND
+_LAST = (datetime.max - _EPOCH) // _SECOND
+
+
+def _read_tzif(name):
+    """Raw bytes of a zone's TZif file from TZPATH or the tzdata package"""
+    for directory in TZPATH:
+        path = os.path.join(directory, *name.split("/"))
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                return f.read()
+    resource = importlib.resources.files("tzdata.zoneinfo").joinpath(*name.split("/"))
+    return resource.read_bytes()
+
+
+def _parse_tzif(data):
+    """(transition times, offsets, abbreviations, footer) of a TZif file
+
+    offsets and abbreviations have one more entry than the transitions;
+    the first describes the time before the first transition.
+    """
+    if data[:4] != b"TZif":
+        raise ValueError("not a TZif file")
+    version = data[4:5]
+    counts = struct.unpack(">6l", data[20:44])
+    time_size = 4
+    body = 44
+    if version >= b"2":
+        # Skip the 32-bit block; the second header starts the 64-bit data
+        isut, isstd, leap, times, types, chars = counts
+        body += times * 5 + types * 6 + chars + leap * 8 + isstd + isut
+        counts = struct.unpack(">6l", data[body + 20:body + 44])
+        body += 44
+        time_size = 8
+    isut, isstd, leap, times, types, chars = counts
+
+    transitions = struct.unpack(f">{times}{'q' if time_size == 8 else 'l'}", data[body:body + times * time_size])
+    body += times * time_size
+    indices = data[body:body + times]
+    body += times
+    infos = [struct.unpack(">lBB", data[body + 6 * i:body + 6 * i + 6]) for i in range(types)]
+    body += types * 6
+    names = data[body:body + chars]
+    body += chars + leap * (time_size + 4) + isstd + isut
+
+    def abbreviation(info):
+        start = info[2]
+        return names[start:names.index(b"\0", start)].decode("ascii")
+
+    # Times before the first transition use local time type 0 (RFC 8536)
+    kinds = [infos[0]] + [infos[i] for i in indices]
+    footer = data[body:].strip(b"\n").decode("ascii") if version >= b"2" else ""
+    return list(transitions), [info[0] for info in kinds], [abbreviation(info) for info in kinds], footer
+
+
+class ZoneTable:
+    """UTC-offset history of one IANA zone"""
+
+    def __init__(self, name):
+        self.name = name
+        self.zone = ZoneInfo(name)
+        transitions, offsets, abbreviations, footer = _parse_tzif(_read_tzif(name))
+        self.end = int((datetime(TABLE_END_YEAR + 1, 1, 1) - _EPOCH).total_seconds())
+        if "," in footer:
+            # The file ends in a recurring DST rule; expand it with zoneinfo
+            start = transitions[-1] if transitions else 0
+            self._extend(transitions, offsets, abbreviations, start)
+        self.transitions = transitions
+        self.offsets = offsets
+        self.abbreviations = abbreviations
+        self.transition_array = np.asarray(transitions, dtype=np.int64)
+        self.offset_array = np.asarray(offsets, dtype=np.int64)
+
+    def _zone_offset(self, instant):
+        # Kept a day inside datetime's range, so that adding the offset cannot overflow
+        instant = min(max(instant, _FIRST + _DAY), _LAST - _DAY)
+        moment = datetime.fromtimestamp(instant, timezone.utc).astimezone(self.zone)
+        return int(moment.utcoffset().total_seconds()), moment.tzname()
+
+    def _extend(self, transitions, offsets, abbreviations, start):
+        previous = self._zone_offset(start)
+        instant = start
+        while instant < self.end:
+            step = min(instant + _SCAN_STEP, self.end)
+            current = self._zone_offset(step)
+            if current != previous:
+                # Narrow the week down to the exact second of the change
+                low, high = instant, step
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._zone_offset(middle) == previous:
+                        low = middle
+                    else:
+                        high = middle
+                transitions.append(high)
+                offsets.append(current[0])
+                abbreviations.append(current[1])
+                previous = current
+            instant = step
+
+    def offset_at(self, instant):
+        """(UTC offset in seconds, abbreviation) at a UTC instant given as epoch seconds"""
+        if instant >= self.end:
+            return self._zone_offset(instant)
+        i = bisect.bisect_right(self.transitions, instant)
+        return self.offsets[i], self.abbreviations[i]
+
+    def offsets_at(self, instants):
+        """UTC offsets in seconds at an int64 array of UTC epoch seconds"""
+        offsets = self.offset_array[np.searchsorted(self.transition_array, instants, side="right")]
+        late = np.flatnonzero(instants >= self.end)
+        for i in late.tolist():
+            offsets[i] = self._zone_offset(int(instants[i]))[0]
+        return offsets
+
+    def to_utc(self, local):
+        """UTC epoch seconds of a wall-clock time (epoch seconds read as if local were UTC)
+
+        As zoneinfo does with fold=0, a time that occurs twice takes the
+        earlier instant, and a time skipped by a gap is read with the
+        offset in force before the gap.
+        """
+        if local + _DAY < self.end:
+            i = bisect.bisect_right(self.transitions, local - _DAY)
+            if i == len(self.transitions) or self.transitions[i] > local + _DAY:
+                # No transition within a day either side, so the offset is unambiguous
+                return local - self.offsets[i]
+        before = self.offset_at(local - _DAY)[0]
+        after = self.offset_at(local + _DAY)[0]
+        if self.offset_at(local - before)[0] != before and self.offset_at(local - after)[0] == after:
+            return local - after
+        return local - before
+
+    def to_utc_array(self, local):
+        """to_utc over an int64 array of wall-clock epoch seconds"""
+        before = self.offsets_at(local - _DAY)
+        after = self.offsets_at(local + _DAY)
+        use_after = (self.offsets_at(local - before) != before) & (self.offsets_at(local - after) == after)
+        return local - np.where(use_after, after, before)
+
+
+class ZoneCache:
+    """Thread-safe LRU of ZoneTables keyed by zone name"""
+
+    def __init__(self, max_zones=DEFAULT_MAX_ZONES):
+        self.max_zones = max_zones
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_zones=None):
+        with self._lock:
+            if max_zones is not None:
+                self.max_zones = max_zones
+            self._evict()
+
+    def get(self, name):
+        """The table for an IANA zone name; raises LookupError for unknown zones"""
+        with self._lock:
+            table = self._tables.get(name)
+            if table is not None:
+                self._tables.move_to_end(name)
+                self.hits += 1
+                return table
+            self.misses += 1
+        try:
+            table = ZoneTable(name)
+        except (LookupError, ValueError, OSError, ModuleNotFoundError, struct.error):
+            # zoneinfo raises ValueError for keys such as absolute paths
+            raise LookupError(f"Unknown time zone '{name}'") from None
+        with self._lock:
+            self._tables[name] = table
+            self._evict()
+        return table
+
+    def _evict(self):
+        while len(self._tables) > self.max_zones:
+            self._tables.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "zones": len(self._tables),
+                "max_zones": self.max_zones,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+ZONES = ZoneCache()
+
+
+def format_offset(seconds):
+    """UTC offset as +HH:MM (with :SS when the offset is not whole minutes)"""
+    sign = "-" if seconds < 0 else "+"
+    hours, rest = divmod(abs(int(seconds)), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}" + (f":{seconds:02d}" if seconds else "")
+
+
+def _epoch_seconds(moment):
+    return (moment - _EPOCH) // _SECOND
+
+
+def _isoformat(seconds):
+    """ISO text of epoch seconds, or None outside the years 1 to 9999"""
+    if not _FIRST <= seconds <= _LAST:
+        return None
+    return (_EPOCH + timedelta(seconds=seconds)).isoformat()
+
+
+def convert(moment, from_zone, to_zone):
+    """(wall time, UTC offset in seconds, abbreviation) in to_zone of a naive wall time in from_zone
+
+    Raises OverflowError when the wall time in to_zone falls outside the years 1 to 9999.
+    """
+    instant = ZONES.get(from_zone).to_utc(_epoch_seconds(moment))
+    offset, abbreviation = ZONES.get(to_zone).offset_at(instant)
+    return _EPOCH + timedelta(seconds=instant + offset), offset, abbreviation
+
+
+def convert_to_zones(moment, from_zone, zones):
+    """One wall time in from_zone as seen in each of zones
+
+    Returns {"utc", "conversions"}, where conversions is a list of
+    {"zone", "time", "offset", "abbreviation"} in the order of zones.
+    A time that falls outside the years 1 to 9999 is None.
+    """
+    instant = ZONES.get(from_zone).to_utc(_epoch_seconds(moment))
+    conversions = []
+    for name in zones:
+        offset, abbreviation = ZONES.get(name).offset_at(instant)
+        conversions.append({
+            "zone": name,
+            "time": _isoformat(instant + offset),
+            "offset": format_offset(offset),
+            "abbreviation": abbreviation,
+        })
+    utc = _isoformat(instant)
+    return {"utc": utc and utc + "Z", "conversions": conversions}
+
+
+# A full wall-clock date-time: no UTC offset, and no date or time part left out
+_MOMENT = re.compile(r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d(?::\d\d(?:\.\d{1,6})?)?")
+_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15]
+
+
+def parse_moment(value):
+    """Naive datetime from a "YYYY-MM-DDTHH:MM[:SS]" string; raises ValueError for anything else"""
+    value = value.strip()
+    if not _MOMENT.fullmatch(value):
+        raise ValueError("time must be a full date and wall-clock time without a UTC offset")
+    return datetime.fromisoformat(value)
+
+
+def _all_plain(values):
+    """True when every entry is a full date-time string that numpy parses exactly as written
+
+    Checked on the raw bytes in one pass: numpy would also take partial
+    dates ("2025") and shift zone-qualified times ("...Z", "...+05:00") to UTC.
+    """
+    try:
+        text = np.array(values, dtype="S")
+    except (UnicodeEncodeError, ValueError, TypeError):
+        return False
+    if text.ndim != 1 or not text.size or text.dtype.itemsize < 16:
+        return False
+    chars = text.view(np.uint8).reshape(text.size, -1)
+    digit = (chars >= ord("0")) & (chars <= ord("9"))
+    tail = chars[:, 16:]
+    return bool(
+        digit[:, _DIGITS].all()
+        and (chars[:, [4, 7]] == ord("-")).all()
+        and np.isin(chars[:, 10], (ord("T"), ord(" "))).all()
+        and (chars[:, 13] == ord(":")).all()
+        # Seconds and fractions only; padding is zero bytes
+        and (digit[:, 16:] | (tail == ord(":")) | (tail == ord(".")) | (tail == 0)).all()
+    )
+
+
+def parse_moments(values):
+    """datetime64[s] array of full naive date-times; unparseable, partial or zone-qualified entries are NaT"""
+    if _all_plain(values):
+        try:
+            # numpy parses ISO 8601 strings in C, far faster than fromisoformat per row
+            return np.array(values, dtype="datetime64[s]")
+        except ValueError:
+            pass
+    parsed = np.empty(len(values), dtype="datetime64[s]")
+    for i, value in enumerate(values):
+        try:
+            moment = value if isinstance(value, datetime) else parse_moment(value)
+            parsed[i] = np.datetime64(moment, "s") if moment.tzinfo is None else np.datetime64("NaT")
+        except (ValueError, TypeError, AttributeError):
+            parsed[i] = np.datetime64("NaT")
+    return parsed
+
+
+def convert_instants(moments, from_zone, to_zone):
+    """Many wall times in from_zone converted to to_zone in one pass
+
+    Returns (times, offsets, valid): datetime64[s] wall times in to_zone,
+    to_zone's UTC offsets in seconds, and False where an input was
+    missing or unparseable, or its UTC instant or converted time falls
+    outside the years 1 to 9999.
+    """
+    source, target = ZONES.get(from_zone), ZONES.get(to_zone)
+    moments = parse_moments(moments)
+    valid = ~np.isnat(moments)
+    local = np.where(valid, moments, np.datetime64(0, "s")).astype(np.int64)
+    instants = source.to_utc_array(local)
+    offsets = target.offsets_at(instants)
+    times = instants + offsets
+    valid &= (instants >= _FIRST) & (instants <= _LAST) & (times >= _FIRST) & (times <= _LAST)
+    return times.astype("datetime64[s]"), offsets, valid
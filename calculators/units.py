@@ -0,0 +1,81 @@
+"""Unit Conversion calculators"""
+
+from .conversion import AREA, ENERGY, LENGTH, POWER, PRESSURE, SPEED, TEMPERATURE, TIME, VOLUME, WEIGHT
+from .registry import calculator
+from .schema import number, text
+
+CONVERSION = [
+    number("value"),
+    text("from", required=False, dest="from_unit"),
+    text("to", required=False, dest="to_unit"),
+]
+
+
+@calculator("area-converter", inputs=[
+    number("value"),
+    text("fromUnit", label="from unit", dest="from_unit"),
+    text("toUnit", label="to unit", dest="to_unit"),
+])
+def area_converter(value, from_unit, to_unit):
+    if from_unit not in AREA.index or to_unit not in AREA.index:
+        return "Error: Invalid unit selected"
+    result = AREA.convert(value, from_unit, to_unit)
+    return f"Converted Value: {result:.4f} {to_unit}"
+
+
+@calculator("unit_temperature", inputs=[
+    number("temp", label="temperature"),
+    text("from", label="from unit", dest="from_unit"),
+    text("to", label="to unit", dest="to_unit"),
+])
+def unit_temperature(temp, from_unit, to_unit):
+    if from_unit not in TEMPERATURE.index or to_unit not in TEMPERATURE.index:
+        return "Error: Invalid unit selected"
+    result = TEMPERATURE.convert(temp, from_unit, to_unit)
+    return f"{temp}° {from_unit} = {result:.2f}° {to_unit}"
+
+
+def _convert(dimension, value, from_unit, to_unit):
+    # A missing or unknown unit counts as the dimension's base unit
+    result = dimension.convert(value, from_unit, to_unit, default=dimension.base)
+    return f"{value} {from_unit} = {result:.4f} {to_unit}"
+
+
+@calculator("unit_length", inputs=CONVERSION)
+def unit_length(value, from_unit, to_unit):
+    return _convert(LENGTH, value, from_unit, to_unit)
+
+
+@calculator("unit_weight", inputs=CONVERSION)
+def unit_weight(value, from_unit, to_unit):
+    return _convert(WEIGHT, value, from_unit, to_unit)
+
+
+@calculator("unit_volume", inputs=CONVERSION)
+def unit_volume(value, from_unit, to_unit):
+    return _convert(VOLUME, value, from_unit, to_unit)
+
+
+@calculator("unit_speed", inputs=CONVERSION)
+def unit_speed(value, from_unit, to_unit):
+    return _convert(SPEED, value, from_unit, to_unit)
+
+
+@calculator("unit_time", inputs=CONVERSION)
+def unit_time(value, from_unit, to_unit):
+    return _convert(TIME, value, from_unit, to_unit)
+
+
+@calculator("unit_energy", inputs=CONVERSION)
+def unit_energy(value, from_unit, to_unit):
+    return _convert(ENERGY, value, from_unit, to_unit)
+
+
+@calculator("unit_power", inputs=CONVERSION)
+def unit_power(value, from_unit, to_unit):
+    return _convert(POWER, value, from_unit, to_unit)
+
+
+@calculator("unit_pressure", inputs=CONVERSION)
+def unit_pressure(value, from_unit, to_unit):
+    return _convert(PRESSURE, value, from_unit, to_unit)
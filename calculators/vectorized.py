@@ -0,0 +1,229 @@
+"""Columnar (NumPy) evaluation for the closed-form numeric calculators
+
+Instead of one scalar handler call per row, evaluate_columns() takes one
+array per input field and evaluates the formula for the whole batch.
+Inputs are coerced and range-checked against the calculator's schema, so
+the scalar and columnar paths share one definition of each input. Rows
+that fail validation, or whose result is not finite, are reported through
+a boolean validity mask rather than per-row error strings.
+"""
+import numpy as np
+
+from . import clock
+from .amortization import annuity_payment
+from .calendar_math import LEAP_RULES, calendar_difference_array, parse_dates
+from .columns import column_rank, float_column
+from .conversion import AREA, ENERGY, LENGTH, POWER, PRESSURE, SPEED, TEMPERATURE, TIME, VOLUME, WEIGHT
+from .registry import get_spec
+from .schema import DATE, FLOAT, TEXT
+
+VECTORIZED = {}
+
+
+def vectorized(calc_id):
+    """Register an array formula for calc_id
+
+    The formula receives one array per schema field (by dest name) and
+    returns a dict of result arrays.
+    """
+    def decorator(formula):
+        VECTORIZED[calc_id] = formula
+        return formula
+    return decorator
+
+
+def _column_length(columns):
+    length = None
+    for name, values in columns.items():
+        if column_rank(name, values) == 0:
+            continue
+        if length is None:
+            length = len(values)
+        elif len(values) != length:
+            raise ValueError(f"Column '{name}' has {len(values)} rows, expected {length}")
+    if length is None:
+        raise ValueError("At least one input must be an array")
+    return length
+
+
+def in_bounds(field, column):
+    """Mask of finite values within the field's range limits"""
+    valid = np.isfinite(column)
+    if field.gt is not None:
+        valid &= column > field.gt
+    if field.ge is not None:
+        valid &= column >= field.ge
+    if field.lt is not None:
+        valid &= column < field.lt
+    if field.le is not None:
+        valid &= column <= field.le
+    return valid
+
+
+def coerce_columns(spec, columns):
+    """Coerce input columns against the schema; returns (arrays, valid mask)"""
+    size = _column_length(columns)
+    valid = np.ones(size, dtype=bool)
+    arrays = {}
+    for field in spec.schema.fields:
+        values = columns.get(field.name)
+        if values is None:
+            if field.required:
+                raise ValueError(f"Missing column '{field.name}'")
+            values = clock.today() if spec.time_dependent and field.name == "as_of" else field.default
+        if not column_rank(field.name, values):
+            values = [values]
+
+        if field.kind == FLOAT:
+            column = float_column(values)
+            column = np.broadcast_to(column, (size,))
+            valid &= in_bounds(field, column)
+        elif field.kind == DATE:
+            column = np.broadcast_to(parse_dates(values), (size,))
+            valid &= ~np.isnat(column)
+        elif field.kind == TEXT:
+            column = np.broadcast_to(np.asarray(values, dtype=object), (size,))
+        else:
+            raise ValueError(f"Column input of type '{field.kind}' is not supported")
+        arrays[field.dest] = column
+    return arrays, valid
+
+
+def evaluate_columns(calc_id, columns):
+    """Evaluate calc_id over whole columns of inputs
+
+    columns maps input field names to sequences (or scalars, which are
+    broadcast). Returns (results, valid) where results maps output names
+    to arrays and valid is a boolean mask of rows with usable results.
+    """
+    formula = VECTORIZED.get(calc_id)
+    if formula is None:
+        raise ValueError(f"Calculator '{calc_id}' has no columnar mode")
+    arrays, valid = coerce_columns(get_spec(calc_id), columns)
+    with np.errstate(all="ignore"):
+        results = formula(**arrays)
+    for values in results.values():
+        if values.dtype.kind == "f":
+            valid &= np.isfinite(values)
+    return results, valid
+
+
+def _unit_formula(dimension, lenient=True):
+    """Array formula for a unit calculator; lenient ones treat unknown units as the base unit"""
+    def formula(value, from_unit, to_unit):
+        default = dimension.base if lenient else None
+        return {"result": dimension.convert_array(value, from_unit, to_unit, default)}
+    return formula
+
+
+@vectorized("bmi")
+def bmi(weight, height):
+    height = height / 100
+    bmi = weight / (height ** 2)
+    category = np.select([bmi < 18.5, bmi < 25, bmi < 30], ["Underweight", "Normal", "Overweight"], "Obese")
+    return {"bmi": bmi, "category": category}
+
+
+@vectorized("bmr")
+def bmr(weight, height, age, gender):
+    male = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+    female = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+    return {"bmr": np.where(gender == "male", male, female)}
+
+
+@vectorized("simple_interest")
+def simple_interest(principal, rate, time):
+    interest = (principal * rate * time) / 100
+    return {"interest": interest, "total": principal + interest}
+
+
+@vectorized("compound_interest")
+def compound_interest(principal, rate, time, n):
+    amount = principal * (1 + rate / 100 / n) ** (n * time)
+    return {"amount": amount, "interest": amount - principal}
+
+
+@vectorized("loan_payment")
+def loan_payment(principal, rate, months):
+    return {"payment": annuity_payment(principal, rate / 100 / 12, months)}
+
+
+@vectorized("mortgage")
+def mortgage(price, down, rate, years):
+    loan_amount = price - down
+    payment = annuity_payment(loan_amount, rate / 100 / 12, years * 12)
+    return {"payment": payment, "loan_amount": loan_amount}
+
+
+@vectorized("investment_return")
+def investment_return(initial, rate, years):
+    amount = initial * (1 + rate / 100) ** years
+    return {"amount": amount, "return": amount - initial}
+
+
+@vectorized("savings_goal")
+def savings_goal(goal, rate, months):
+    rate = rate / 100 / 12
+    return {"payment": np.where(rate > 0, goal * rate / ((1 + rate) ** months - 1), goal / months)}
+
+
+@vectorized("retirement")
+def retirement(age, retire_age, monthly, annual_return):
+    months = np.where(age < retire_age, (retire_age - age) * 12, np.nan)
+    rate = annual_return / 100 / 12
+    total = np.where(rate == 0, monthly * months, monthly * (((1 + rate) ** months - 1) / rate))
+    return {"total": total}
+
+
+@vectorized("final_grade")
+def final_grade(current, desired, weight):
+    return {"needed": (desired - current * (100 - weight) / 100) / (weight / 100)}
+
+
+def _calendar_difference(start, end, leap_rule):
+    """Years, months and days as float columns, NaN where the row has no answer"""
+    result = {name: np.full(start.shape, np.nan) for name in ("years", "months", "days")}
+    for rule in LEAP_RULES:
+        rows = leap_rule == rule
+        if rows.any():
+            years, months, days, valid = calendar_difference_array(start[rows], end[rows], rule)
+            for name, values in zip(result, (years, months, days)):
+                result[name][rows] = np.where(valid, values, np.nan)
+    return result
+
+
+@vectorized("age")
+def age(dob, as_of, leap_rule):
+    return _calendar_difference(dob, as_of, leap_rule)
+
+
+@vectorized("age_difference")
+def age_difference(date1, date2, leap_rule):
+    return _calendar_difference(np.minimum(date1, date2), np.maximum(date1, date2), leap_rule)
+
+
+vectorized("unit_length")(_unit_formula(LENGTH))
+vectorized("unit_weight")(_unit_formula(WEIGHT))
+vectorized("unit_volume")(_unit_formula(VOLUME))
+vectorized("unit_speed")(_unit_formula(SPEED))
+vectorized("unit_time")(_unit_formula(TIME))
+vectorized("unit_energy")(_unit_formula(ENERGY))
+vectorized("unit_power")(_unit_formula(POWER))
+vectorized("unit_pressure")(_unit_formula(PRESSURE))
+vectorized("area-converter")(_unit_formula(AREA, lenient=False))
+
+
+@vectorized("unit_temperature")
+def unit_temperature(temp, from_unit, to_unit):
+    return {"result": TEMPERATURE.convert_array(temp, from_unit, to_unit)}
+
+
+@vectorized("kinetic_energy")
+def kinetic_energy(mass, velocity):
+    return {"kinetic_energy": 0.5 * mass * velocity ** 2}
+
+
+@vectorized("fuel_cost")
+def fuel_cost(distance, mpg, price_per_gallon):
+    gallons = distance / mpg
+    return {"cost": gallons * price_per_gallon, "gallons": gallons}
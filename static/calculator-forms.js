@@ -9,6 +9,13 @@ function generateFormHTML(calcId) {
                     <label>Date of Birth:</label>
                     <input type="date" id="dob" required>
                 </div>
+                <div class="form-group">
+                    <label>Feb 29 Birthdays in Common Years:</label>
+                    <select id="leap_rule">
+                        <option value="feb28">Fall on Feb 28</option>
+                        <option value="mar1">Fall on Mar 1</option>
+                    </select>
+                </div>
             `;
         } else if (calcId === 'days_between') {
             html += `
@@ -118,7 +125,11 @@ function generateFormHTML(calcId) {
             html += `
                 <div class="form-group">
                     <label>Number:</label>
-                    <input type="number" id="n" min="0" max="170" required>
+                    <input type="number" id="n" min="0" required>
+                </div>
+                <div class="form-group">
+                    <label>Modulus (optional):</label>
+                    <input type="number" id="modulus" min="1">
                 </div>
             `;
         } else if (calcId === 'speed') {
@@ -298,6 +309,10 @@ function generateFormHTML(calcId) {
                     <label>Number B:</label>
                     <input type="number" id="b" required>
                 </div>
+                <div class="form-group">
+                    <label>More Numbers (optional, comma-separated):</label>
+                    <input type="text" id="numbers">
+                </div>
             `;
         } else if (calcId === 'lcm') {
             html += `
@@ -309,6 +324,10 @@ function generateFormHTML(calcId) {
                     <label>Number B:</label>
                     <input type="number" id="b" required>
                 </div>
+                <div class="form-group">
+                    <label>More Numbers (optional, comma-separated):</label>
+                    <input type="text" id="numbers">
+                </div>
             `;
         } else if (calcId === 'mean') {
             html += `
@@ -349,6 +368,13 @@ function generateFormHTML(calcId) {
                     <input type="number" id="number" required>
                 </div>
             `;
+        } else if (calcId === 'prime_factorization') {
+            html += `
+                <div class="form-group">
+                    <label>Number:</label>
+                    <input type="text" id="number" inputmode="numeric" required>
+                </div>
+            `;
         } else if (calcId === 'fibonacci') {
             html += `
                 <div class="form-group">
@@ -413,6 +439,13 @@ function generateFormHTML(calcId) {
                     <input type="text" id="numbers" required>
                 </div>
             `;
+        } else if (calcId === 'describe') {
+            html += `
+                <div class="form-group">
+                    <label>Numbers (comma-separated):</label>
+                    <input type="text" id="numbers" required>
+                </div>
+            `;
         } else if (calcId === 'variance') {
             html += `
                 <div class="form-group">
@@ -796,6 +829,26 @@ function generateFormHTML(calcId) {
     `;
 }
 
+        else if (calcId === 'correlation_matrix') {
+    html += `
+        <div class="form-group">
+            <label>Series (one per line, "name: values"):</label>
+            <textarea id="series" rows="6" placeholder="sales: 12, 15, 11, 18&#10;ads: 3, 4, 2, 5&#10;visits: 120, 160, , 190" required></textarea>
+        </div>
+
+        <div class="form-group">
+            <label>Method:</label>
+            <select id="method">
+                <option value="both">Pearson and Spearman</option>
+                <option value="pearson">Pearson</option>
+                <option value="spearman">Spearman (rank)</option>
+            </select>
+        </div>
+
+        <p class="note">Leave a value blank or write NA when it is missing.</p>
+    `;
+}
+
         else if (calcId === 'unit_energy') {
     html += `
         <div class="form-group">
@@ -1074,6 +1127,48 @@ else if (calcId === 'time_zone') {
                 <option value="14">UTC +14</option>
             </select>
         </div>
+
+        <div class="form-group">
+            <label>From Time Zone Name (optional, follows daylight saving):</label>
+            <input type="text" id="from_zone" list="zone_names" placeholder="e.g. Europe/London">
+        </div>
+
+        <div class="form-group">
+            <label>To Time Zone Name (optional, follows daylight saving):</label>
+            <input type="text" id="to_zone" list="zone_names" placeholder="e.g. Asia/Kolkata">
+        </div>
+
+        <div class="form-group">
+            <label>Date (needed with zone names):</label>
+            <input type="date" id="date">
+        </div>
+
+        <datalist id="zone_names">
+            <option value="UTC">
+            <option value="Europe/London">
+            <option value="Europe/Paris">
+            <option value="Europe/Berlin">
+            <option value="Europe/Moscow">
+            <option value="Africa/Cairo">
+            <option value="Africa/Lagos">
+            <option value="Africa/Johannesburg">
+            <option value="Asia/Dubai">
+            <option value="Asia/Kolkata">
+            <option value="Asia/Kathmandu">
+            <option value="Asia/Singapore">
+            <option value="Asia/Shanghai">
+            <option value="Asia/Tokyo">
+            <option value="Australia/Adelaide">
+            <option value="Australia/Sydney">
+            <option value="Pacific/Auckland">
+            <option value="America/Sao_Paulo">
+            <option value="America/New_York">
+            <option value="America/Chicago">
+            <option value="America/Denver">
+            <option value="America/Los_Angeles">
+            <option value="America/Anchorage">
+            <option value="Pacific/Honolulu">
+        </datalist>
     `;
 }
 
@@ -1266,6 +1361,13 @@ else if (calcId === 'recycling') {
                     <label>Date of Birth:</label>
                     <input type="date" id="dob" required>
                 </div>
+                <div class="form-group">
+                    <label>Feb 29 Birthdays in Common Years:</label>
+                    <select id="leap_rule">
+                        <option value="feb28">Fall on Feb 28</option>
+                        <option value="mar1">Fall on Mar 1</option>
+                    </select>
+                </div>
             `;
         } else if (calcId === 'countdown') {
             html += `
@@ -1284,6 +1386,13 @@ else if (calcId === 'recycling') {
                     <label>End Date:</label>
                     <input type="date" id="date2" required>
                 </div>
+                <div class="form-group">
+                    <label>Holidays:</label>
+                    <select id="calendar">
+                        <option value="">None (weekends only)</option>
+                        <option value="us_federal">US Federal Holidays</option>
+                    </select>
+                </div>
             `;
         } else if (calcId === 'car_loan') {
             html += `
@@ -1667,6 +1776,41 @@ else if (calcId === 'recycling') {
                     <input type="number" id="return" step="0.01" value="7" required>
                 </div>
             `;
+        } else if (calcId === 'retirement_monte_carlo') {
+            html += `
+                <div class="form-group">
+                    <label>Current Age:</label>
+                    <input type="number" id="age" required>
+                </div>
+                <div class="form-group">
+                    <label>Retirement Age:</label>
+                    <input type="number" id="retire_age" required>
+                </div>
+                <div class="form-group">
+                    <label>Monthly Savings ($):</label>
+                    <input type="number" id="monthly" step="0.01" required>
+                </div>
+                <div class="form-group">
+                    <label>Average Annual Return (%):</label>
+                    <input type="number" id="return" step="0.01" value="7" required>
+                </div>
+                <div class="form-group">
+                    <label>Annual Volatility (%):</label>
+                    <input type="number" id="volatility" step="0.01" value="15" min="0">
+                </div>
+                <div class="form-group">
+                    <label>Savings Goal ($, optional):</label>
+                    <input type="number" id="goal" step="0.01" min="0">
+                </div>
+                <div class="form-group">
+                    <label>Simulated Paths:</label>
+                    <input type="number" id="paths" step="1" value="10000" min="1" max="100000">
+                </div>
+                <div class="form-group">
+                    <label>Random Seed:</label>
+                    <input type="number" id="seed" step="1" value="0" min="0">
+                </div>
+            `;
         } else if (calcId === 'investment') {
             html += `
                 <div class="form-group">
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Heavy calculators run inline, so tests never spawn worker processes
+os.environ.setdefault("HEAVY_WORKERS", "0")
+
+
+@pytest.fixture
+def client():
+    from app import app
+
+    return app.test_client()
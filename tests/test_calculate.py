@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.mark.parametrize("data", [[1, 2], "70", 5, None])
+def test_data_that_is_not_an_object_is_rejected(client, data):
+    response = client.post("/calculate", json={"calc_id": "bmi", "data": data})
+    assert response.get_json() == {"result": "Error: data must be an object"}
+
+
+def test_batch_and_single_agree_on_data_that_is_not_an_object(client):
+    response = client.post("/calculate/batch", json={"items": [{"calc_id": "bmi", "data": [1, 2]}]})
+    assert response.get_json()["results"] == [{"error": "data must be an object"}]
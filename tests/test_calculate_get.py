@@ -0,0 +1,17 @@
+from calculators import offload, registry
+
+
+def test_pure_result_is_publicly_cacheable(client):
+    response = client.get("/calculate/bmi?weight=70&height=175")
+    assert response.headers["Cache-Control"] == "public, max-age=86400"
+
+
+def test_timeout_is_not_cached(client, monkeypatch):
+    def too_slow(calc_id, values, timeout=None):
+        raise offload.CalculationTimeout()
+
+    monkeypatch.setattr(registry.HEAVY_POOL, "workers", 1)
+    monkeypatch.setattr(registry.HEAVY_POOL, "run", too_slow)
+    response = client.get("/calculate/factorial?n=123457")
+    assert "longer than" in response.get_json()["result"]
+    assert response.headers["Cache-Control"] == "no-store"
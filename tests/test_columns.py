@@ -0,0 +1,43 @@
+import pytest
+
+
+def test_columns_broadcast_scalars(client):
+    response = client.post("/calculate/columns", json={
+        "calc_id": "bmi", "columns": {"weight": [70, "x"], "height": 175},
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["valid"] == [True, False]
+    assert body["columns"]["bmi"][0] == pytest.approx(22.857, abs=1e-3)
+
+
+@pytest.mark.parametrize("weight", [[[70, 80], [90]], [70, [80]], [[70], [80]]])
+def test_columns_reject_nested_arrays(client, weight):
+    response = client.post("/calculate/columns", json={
+        "calc_id": "bmi", "columns": {"weight": weight, "height": [170, 180]},
+    })
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "weight must be a list of numbers"}
+
+
+@pytest.mark.parametrize("weight", [[[60, 70]], [60, [70]], [{"a": 1}]])
+def test_sweep_rejects_nested_lists(client, weight):
+    response = client.post("/calculate/sweep", json={
+        "calc_id": "bmi", "inputs": {"weight": weight, "height": [170]},
+    })
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Error: weight must be a list of numbers"}
+
+
+@pytest.mark.parametrize("values", [[[1, 2], [3, 4]], [[1, 2], [3]], [{"a": 1}]])
+def test_unit_convert_rejects_nested_lists(client, values):
+    response = client.post("/units/convert", json={"values": values, "from": "meters", "to": "kilometers"})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Error: values must be a list of numbers"}
+
+
+def test_unit_convert_nulls_values_that_are_not_numbers(client):
+    response = client.post("/units/convert", json={
+        "values": [1, True, "2", "x", None], "from": "meters", "to": "kilometers",
+    })
+    assert response.get_json()["values"] == [0.001, None, 0.002, None, None]
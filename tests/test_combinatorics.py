@@ -0,0 +1,71 @@
+import math
+from decimal import Decimal
+
+import pytest
+
+from calculators import combinatorics
+from calculators.combinatorics import combinations, factorial, permutations
+
+# Primes and composites, including prime powers and moduli below n
+MODULI = [1, 2, 3, 7, 13, 97, 4, 12, 25, 27, 60, 1001, 1024, 10 ** 9 + 7]
+
+
+def test_exact_values_match_math():
+    for n in range(0, 120):
+        assert factorial(n) == ("exact", math.factorial(n))
+        for r in range(0, n + 1, 7):
+            assert permutations(n, r) == ("exact", math.perm(n, r))
+            assert combinations(n, r) == ("exact", math.comb(n, r))
+
+
+@pytest.mark.parametrize("modulus", MODULI)
+def test_modular_values_match_math(modulus):
+    for n in range(0, 40):
+        assert factorial(n, modulus) == ("mod", math.factorial(n) % modulus)
+        for r in range(0, n + 1):
+            assert permutations(n, r, modulus) == ("mod", math.perm(n, r) % modulus)
+            assert combinations(n, r, modulus) == ("mod", math.comb(n, r) % modulus)
+
+
+@pytest.mark.parametrize("modulus", MODULI)
+def test_sieve_and_lucas_paths_match_math(monkeypatch, modulus):
+    # A tiny budget sends every case past the direct product, to Lucas or Legendre
+    monkeypatch.setattr(combinatorics, "MOD_BUDGET", 3)
+    for n in range(0, 80, 3):
+        for r in range(0, n + 1, 2):
+            assert permutations(n, r, modulus) == ("mod", math.perm(n, r) % modulus)
+            assert combinations(n, r, modulus) == ("mod", math.comb(n, r) % modulus)
+
+
+@pytest.mark.parametrize("p", [101, 1009, 10007])
+def test_wilson_path_matches_math(monkeypatch, p):
+    monkeypatch.setattr(combinatorics, "MOD_BUDGET", 20)
+    for n in range(p - 15, p):
+        assert factorial(n, p) == ("mod", math.factorial(n) % p)
+
+
+def test_lucas_handles_n_far_beyond_the_prime():
+    n, r, p = 10 ** 30 + 7, 10 ** 15 + 3, 13
+    expected = 1
+    while r:
+        expected = expected * math.comb(n % p, r % p) % p
+        n, r = n // p, r // p
+    assert combinations(10 ** 30 + 7, 10 ** 15 + 3, 13) == ("mod", expected)
+
+
+# From STIRLING_FROM on log10(n!) comes from Stirling's series; all of these still fit in a str
+@pytest.mark.parametrize("kind, reference, args", [
+    (factorial, math.factorial, (999,)),
+    (factorial, math.factorial, (1400,)),
+    (permutations, math.perm, (1400, 700)),
+    (permutations, math.perm, (1450, 500)),
+    (combinations, math.comb, (3600, 1800)),
+    (combinations, math.comb, (6000, 1500)),
+])
+def test_summaries_match_exact_digits(kind, reference, args):
+    form, digits, text = kind(*args)
+    written = str(reference(*args))
+    assert form == "approx"
+    assert digits == len(written)
+    mantissa = Decimal(text.split(" ")[0])
+    assert abs(mantissa - Decimal(written[:12]) / 10 ** 11) < Decimal("1e-8")
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from calculators.correlation import parse_series, pearson_matrix, spearman_matrix
+
+
+def _average_ranks(column):
+    ordered = sorted(column)
+    first = {}
+    last = {}
+    for i, value in enumerate(ordered, start=1):
+        first.setdefault(value, i)
+        last[value] = i
+    return np.array([(first[value] + last[value]) / 2 for value in column])
+
+
+def _pairwise(data, rank=False):
+    """Correlation of every pair over the rows where both are present, one pair at a time"""
+    series = data.shape[1]
+    matrix = np.full((series, series), np.nan)
+    for i in range(series):
+        for j in range(series):
+            shared = ~np.isnan(data[:, i]) & ~np.isnan(data[:, j])
+            x, y = data[shared, i], data[shared, j]
+            if rank:
+                x, y = _average_ranks(x.tolist()), _average_ranks(y.tolist())
+            if x.size > 1 and x.std() and y.std():
+                matrix[i, j] = np.corrcoef(x, y)[0, 1]
+    return matrix
+
+
+def _data(missing):
+    rng = np.random.default_rng(5)
+    base = rng.normal(size=(300, 1))
+    data = np.hstack([
+        base + rng.normal(scale=s, size=(300, 1)) for s in (0.1, 0.5, 2.0)
+    ] + [np.round(rng.normal(size=(300, 1)) * 3), 1e8 + base])  # ties, and a large offset
+    if missing:
+        data[rng.random(data.shape) < missing] = np.nan
+        data[:40, 2] = np.nan  # one series with a long gap of its own
+    return data
+
+
+@pytest.mark.parametrize("missing", [0, 0.15])
+def test_pearson_matches_pairwise_reference(missing):
+    data = _data(missing)
+    np.testing.assert_allclose(pearson_matrix(data), _pairwise(data), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("missing", [0, 0.15])
+def test_spearman_matches_pairwise_reference(missing):
+    data = _data(missing)
+    np.testing.assert_allclose(spearman_matrix(data), _pairwise(data, rank=True), rtol=1e-9, atol=1e-12)
+
+
+def test_pandas_pairwise_deletion_agrees():
+    pandas = pytest.importorskip("pandas")
+    data = _data(0.15)
+    frame = pandas.DataFrame(data)
+    np.testing.assert_allclose(pearson_matrix(data), frame.corr().to_numpy(), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(spearman_matrix(data), frame.corr("spearman").to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+def test_scipy_agrees_on_complete_pairs():
+    stats = pytest.importorskip("scipy.stats")
+    data = _data(0.15)
+    shared = ~np.isnan(data[:, 0]) & ~np.isnan(data[:, 3])
+    x, y = data[shared, 0], data[shared, 3]
+    assert pearson_matrix(data)[0, 3] == pytest.approx(stats.pearsonr(x, y)[0], rel=1e-9)
+    assert spearman_matrix(data)[0, 3] == pytest.approx(stats.spearmanr(x, y)[0], rel=1e-9)
+
+
+def test_parse_series_pads_and_reads_missing_tokens():
+    names, data = parse_series("a: 1, 2, NA, 4\n3, , 5")
+    assert names == ["a", "Series 2"]
+    np.testing.assert_array_equal(data, [[1, 3], [2, np.nan], [np.nan, 5], [4, np.nan]])
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from calculators.descriptive import Summary, describe, quantiles
+
+
+def _values(size=10_001, seed=1):
+    # A large mean and a small spread, where a naive sum-of-squares variance loses digits
+    return np.random.default_rng(seed).normal(1e6, 3.0, size)
+
+
+def test_merged_chunks_match_numpy():
+    values = _values()
+    summary = Summary()
+    for chunk in np.array_split(values, 17):
+        summary.merge(Summary.of(chunk))
+    assert summary.count == values.size
+    assert summary.mean == pytest.approx(values.mean(), rel=1e-15)
+    assert summary.variance == pytest.approx(values.var(), rel=1e-9)
+    assert summary.sample_variance == pytest.approx(values.var(ddof=1), rel=1e-9)
+    assert (summary.min, summary.max) == (values.min(), values.max())
+
+
+def test_single_values_match_numpy():
+    values = _values(2000, seed=2)
+    summary = Summary()
+    for x in values.tolist():
+        summary.add(x)
+    assert summary.mean == pytest.approx(values.mean(), rel=1e-15)
+    assert summary.variance == pytest.approx(values.var(), rel=1e-9)
+
+
+def test_merge_with_empty_summaries():
+    values = _values(10)
+    summary = Summary()
+    summary.merge(Summary())
+    summary.merge(Summary.of(values))
+    summary.merge(Summary())
+    assert summary.count == 10
+    assert summary.variance == pytest.approx(values.var(), rel=1e-9)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_quantiles_match_numpy(size):
+    values = _values(size, seed=size)
+    qs = [0, 0.01, 0.25, 0.5, 0.75, 0.99, 1]
+    assert quantiles(values, qs) == pytest.approx(np.quantile(values, qs).tolist(), rel=1e-15)
+
+
+def test_describe():
+    stats = describe([1, 2, 2, 3, 4])
+    assert stats["mean"] == pytest.approx(2.4)
+    assert stats["median"] == 2
+    assert stats["modes"] == [2]
+    assert stats["variance"] == pytest.approx(np.var([1, 2, 2, 3, 4]))
+    assert (stats["q1"], stats["q3"]) == (2, 3)
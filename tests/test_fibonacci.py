@@ -0,0 +1,49 @@
+import pytest
+
+from calculators import calculate
+from calculators import fibonacci as fib
+
+
+def _iterate(count, mod=None):
+    terms, a, b = [], 0, 1
+    for _ in range(count):
+        terms.append(a)
+        a, b = b, a + b
+        if mod:
+            a, b = a % mod, b % mod
+    return terms
+
+
+def test_fast_doubling_matches_iteration():
+    assert [fib.fib(n) for n in range(1500)] == _iterate(1500)
+    assert [fib.fib_pair(n)[1] for n in range(300)] == _iterate(301)[1:]
+
+
+@pytest.mark.parametrize("mod", [1, 2, 10, 97, 1000, 2 ** 32, 10 ** 9 + 7, 10 ** 30 + 57])
+def test_modular_terms_match_iteration(mod):
+    assert [fib.fib(n, mod) for n in range(800)] == _iterate(800, mod)
+
+
+def test_huge_index_follows_the_pisano_period():
+    # F(n) mod 10 repeats every 60 terms and mod 1000 every 1500
+    n = 10 ** 99 + 12345
+    assert fib.fib(n, 10) == fib.fib(n % 60, 10)
+    assert fib.fib(n, 1000) == fib.fib(n % 1500, 1000)
+
+
+@pytest.mark.parametrize("n", [fib.FIRST_SUMMARISED, fib.FIRST_SUMMARISED + 1, 10_000, 20_000])
+def test_summary_matches_the_written_out_term(n):
+    written = str(fib.fib(n))
+    digits, leading, trailing = fib.summary(n)
+    assert digits == len(written)
+    assert str(leading) == written[:fib.SUMMARY_DIGITS]
+    assert trailing == int(written[-fib.SUMMARY_DIGITS:])
+
+
+def test_sequence_crosses_into_summaries():
+    start = fib.FIRST_SUMMARISED - 3
+    assert list(fib.sequence(start, start + 6)) == [fib.format_term(n) for n in range(start, start + 6)]
+
+
+def test_sequence_rejects_start_at_or_past_n():
+    assert calculate("fibonacci", {"n": "5", "start": "5"}) == "Error: start must be less than n"
@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from calculators import calculate
+from calculators.montecarlo import BLOCK_PATHS, MAX_MONTHS, ShardPool, simulate_retirement
+
+
+def test_zero_volatility_reproduces_the_deterministic_calculator():
+    result = simulate_retirement(360, 500, 7, 0, 50, seed=3, goal=600_000)
+    expected = calculate("retirement", {"age": 30, "retire_age": 60, "monthly": 500, "return": 7})
+    rate = 0.07 / 12
+    for value in result["final"].values():
+        assert value == pytest.approx(500 * ((1 + rate) ** 360 - 1) / rate, rel=1e-12)
+        assert f"${value:,.2f}" in expected
+    assert result["probability"] == 1.0
+    assert [band["month"] for band in result["bands"]] == list(range(12, 361, 12))
+
+
+def test_seed_gives_the_same_result_inline_and_sharded():
+    paths = 2 * BLOCK_PATHS + 500
+    inline = simulate_retirement(60, 200, 6, 15, paths, seed=11, goal=15_000, pool=ShardPool(0))
+    pool = ShardPool(2)
+    try:
+        sharded = simulate_retirement(60, 200, 6, 15, paths, seed=11, goal=15_000, pool=pool)
+    finally:
+        pool.shutdown()
+    assert sharded == inline
+    assert inline != simulate_retirement(60, 200, 6, 15, paths, seed=12, goal=15_000, pool=ShardPool(0))
+
+
+def test_horizon_and_deadline_are_enforced():
+    with pytest.raises(ValueError):
+        simulate_retirement(MAX_MONTHS + 1, 100, 5, 10, 10)
+    with pytest.raises(TimeoutError):
+        simulate_retirement(12, 100, 5, 10, 10, deadline=time.time() - 1)
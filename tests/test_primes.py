@@ -0,0 +1,110 @@
+from itertools import takewhile
+
+import pytest
+
+from calculators import calculate
+from calculators.primes import count_primes, factorize, is_prime, primes_between
+
+LIMIT = 1_200_000
+
+
+def _sieve(limit):
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, int(limit ** 0.5) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytearray(len(range(p * p, limit + 1, p)))
+    return flags
+
+
+REFERENCE = _sieve(LIMIT)
+SMALL = [n for n in range(LIMIT) if REFERENCE[n]]
+
+
+def _trial_division(n):
+    return n >= 2 and all(n % p for p in takewhile(lambda p: p * p <= n, SMALL))
+
+
+def test_is_prime_matches_sieve_below_trial_division_limit():
+    assert [n for n in range(20_000) if is_prime(n)] == [n for n in range(20_000) if REFERENCE[n]]
+
+
+def test_is_prime_matches_sieve_in_miller_rabin_range():
+    # 10^6 and up is past trial division and goes to Miller-Rabin
+    numbers = range(1_000_000 - 1000, LIMIT)
+    assert [n for n in numbers if is_prime(n)] == [n for n in numbers if REFERENCE[n]]
+
+
+@pytest.mark.parametrize("n", [
+    561, 1105, 1729, 2465, 2821, 6601, 8911, 41041, 825265, 321197185, 5394826801,  # Carmichael numbers
+    3215031751,  # strong pseudoprime to bases 2, 3, 5 and 7
+    3825123056546413051,  # strong pseudoprime to every base up to 23
+    318665857834031151167461,  # strong pseudoprime to every base up to 37
+    (2 ** 61 - 1) * (2 ** 89 - 1),
+    (2 ** 89 - 1) ** 2,  # perfect square past the deterministic limit
+    1_000_003 ** 2,
+])
+def test_is_prime_rejects_pseudoprimes_and_squares(n):
+    assert not is_prime(n)
+
+
+@pytest.mark.parametrize("n", [1_000_003, 2 ** 31 - 1, 2 ** 61 - 1, 2 ** 89 - 1, 2 ** 107 - 1, 2 ** 127 - 1])
+def test_is_prime_accepts_large_primes(n):
+    assert is_prime(n)
+
+
+@pytest.mark.parametrize("start, end", [(0, 1), (0, 2), (2, 3), (4, 4), (10, 5), (0, 5000), (1, 4999), (997, 10_007), (50_000, 51_234)])
+@pytest.mark.parametrize("segment", [1, 7, 64, 1 << 20])
+def test_segmented_sieve_matches_sieve(start, end, segment):
+    primes = [p for chunk in primes_between(start, end, segment) for p in chunk.tolist()]
+    assert primes == [n for n in range(start, end + 1) if REFERENCE[n]]
+    assert count_primes(start, end, segment) == len(primes)
+
+
+def test_sieve_near_a_trillion_matches_trial_division():
+    start, end = 10 ** 12 - 1000, 10 ** 12
+    primes = [p for chunk in primes_between(start, end, segment=100) for p in chunk.tolist()]
+    assert primes == [n for n in range(start, end + 1) if _trial_division(n)]
+    assert all(map(is_prime, primes))
+
+
+def _factor_by_trial_division(n):
+    factors = {}
+    for p in takewhile(lambda p: p * p <= n, SMALL):
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def test_factorize_matches_trial_division():
+    for n in list(range(1, 5000)) + list(range(10 ** 9, 10 ** 9 + 500)):
+        assert factorize(n) == (_factor_by_trial_division(n), [])
+
+
+@pytest.mark.parametrize("factors", [
+    {1_000_003: 2},  # p^2 past trial division
+    {1_000_003: 3, 2: 1},
+    {999_983: 1, 1_000_003: 1},
+    {2 ** 31 - 1: 1, 2 ** 61 - 1: 1},
+    {65_537: 2, 4_294_967_311: 2},
+    {3: 1, 11: 1, 17: 1, 1_000_003: 1},  # the Carmichael number 561 times a prime
+    {2 ** 89 - 1: 1},
+])
+def test_factorize_splits_products_of_known_primes(factors):
+    n = 1
+    for p, e in factors.items():
+        n *= p ** e
+    assert factorize(n) == (dict(sorted(factors.items())), [])
+
+
+def test_factorize_reports_what_the_budget_leaves():
+    n = (2 ** 61 - 1) * (2 ** 89 - 1)
+    assert factorize(n, budget=1) == ({}, [n])
+
+
+def test_gcd_and_lcm_take_several_values():
+    assert calculate("gcd", {"a": "84", "b": "126", "numbers": "210, 294"}) == "GCD(84, 126, 210, 294) = 42"
+    assert calculate("lcm", {"a": "4", "b": "6", "numbers": "10"}) == "LCM(4, 6, 10) = 60"
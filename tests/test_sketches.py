@@ -0,0 +1,82 @@
+import io
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from calculators.sketches import FrequentItems, KLLSketch, read_numbers
+
+
+def test_read_numbers_parses_across_blocks():
+    stream = io.StringIO("1, 2,3\n4 5.5\t6")
+    numbers = [value for chunk in read_numbers(stream, block_chars=4) for value in chunk.tolist()]
+    assert numbers == [1, 2, 3, 4, 5.5, 6]
+
+
+@pytest.mark.parametrize("token", ["nan", "inf", "-inf", "NaN", "1e999"])
+def test_read_numbers_rejects_non_finite(token):
+    with pytest.raises(ValueError):
+        list(read_numbers(io.StringIO(f"1, 2, {token}, 4")))
+
+
+def test_sketch_route_rejects_non_finite(client):
+    response = client.post("/stats/sketch", data="1 2 nan 3")
+    assert response.status_code == 400
+    assert "finite" in response.get_json()["error"]
+
+
+def _rank_error(values, sketch, qs):
+    """Largest distance from q to the range of ranks the sketch's answer occupies"""
+    ordered = np.sort(values)
+    worst = 0.0
+    for q, answer in zip(qs, sketch.quantiles(qs)):
+        low = np.searchsorted(ordered, answer, side="left") / ordered.size
+        high = np.searchsorted(ordered, answer, side="right") / ordered.size
+        worst = max(worst, low - q, q - high, 0.0)
+    return worst
+
+
+@pytest.mark.parametrize("error", [0.01, 0.05])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_kll_rank_error_stays_under_error(error, seed):
+    rng = np.random.default_rng(seed)
+    values = np.concatenate([rng.lognormal(0, 2, 150_000), rng.integers(0, 50, 50_000).astype(float)])
+    rng.shuffle(values)
+    sketch = KLLSketch(error, seed=seed)
+    for chunk in np.array_split(values, 37):
+        sketch.update_array(chunk)
+    qs = np.linspace(0, 1, 201)
+    assert _rank_error(values, sketch, qs) <= error
+
+
+def test_merged_kll_sketches_keep_the_bound():
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(i, 1, 40_000) for i in range(5)]
+    merged = KLLSketch(0.01, seed=3)
+    for i, part in enumerate(parts):
+        sketch = KLLSketch(0.01, seed=i)
+        sketch.update_array(part)
+        merged.merge(sketch)
+    assert merged.count == 200_000
+    assert _rank_error(np.concatenate(parts), merged, np.linspace(0, 1, 101)) <= 0.01
+
+
+@pytest.mark.parametrize("error", [0.01, 0.1])
+def test_frequent_items_undercount_within_bound(error):
+    rng = np.random.default_rng(4)
+    values = np.concatenate([rng.zipf(1.5, 100_000) % 5000, rng.integers(0, 100_000, 50_000)])
+    rng.shuffle(values)
+    items = FrequentItems(error)
+    halves = np.array_split(values, 2)
+    for chunk in np.array_split(halves[0], 13):
+        items.update_array(chunk)
+    other = FrequentItems(error)
+    other.update_array(halves[1])
+    items.merge(other)
+
+    truth = Counter(values.tolist())
+    for value, count in items.counters.items():
+        assert truth[value] - items.max_undercount <= count <= truth[value]
+    # Every value above the error fraction is kept
+    heavy = {value for value, count in truth.items() if count > error * values.size}
+    assert heavy <= set(items.counters)
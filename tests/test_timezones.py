@@ -0,0 +1,76 @@
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from calculators.timezones import convert, convert_instants, parse_moment, parse_moments
+
+
+def test_convert_follows_daylight_saving():
+    assert convert(datetime(2025, 1, 10, 14, 0), "Europe/London", "Asia/Kolkata")[0] == datetime(2025, 1, 10, 19, 30)
+    assert convert(datetime(2025, 7, 10, 14, 0), "Europe/London", "Asia/Kolkata")[0] == datetime(2025, 7, 10, 18, 30)
+
+
+def test_batch_matches_single_conversions():
+    times = ["2025-03-09T02:30", "2025-11-02T01:30", "2025-07-01 12:00:00"]
+    converted, _, valid = convert_instants(times, "America/New_York", "Asia/Kolkata")
+    assert valid.all()
+    expected = [convert(parse_moment(text), "America/New_York", "Asia/Kolkata")[0] for text in times]
+    assert converted.astype(datetime).tolist() == expected
+
+
+@pytest.mark.parametrize("text", ["2025-03-30T01:30+05:00", "2025-03-30T01:30Z", "2025", "2025-03", "2025-03-30"])
+def test_batch_rejects_offsets_and_partial_times(text):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        parsed = parse_moments(["2025-03-30T01:30", text])
+    assert not caught
+    assert parsed[0] == np.datetime64("2025-03-30T01:30")
+    assert np.isnat(parsed[1])
+
+
+@pytest.mark.parametrize("text", ["2025-03-30T01:30+05:00", "2025-03-30T01:30Z", "2025"])
+def test_single_time_rejects_offsets_and_partial_times(text):
+    with pytest.raises(ValueError):
+        parse_moment(text)
+
+
+def test_route_returns_null_for_rejected_batch_entries(client):
+    response = client.post("/time-zones/convert", json={
+        "times": ["2025-06-01T12:00", "2025-06-01T12:00Z", "2025"], "from_zone": "UTC", "to_zone": "Asia/Kolkata",
+    })
+    assert response.status_code == 200
+    assert response.get_json()["times"] == ["2025-06-01T17:30:00", None, None]
+
+
+@pytest.mark.parametrize("text, from_zone, to_zone", [
+    ("9999-12-31T23:00:00", "America/New_York", "Pacific/Kiritimati"),
+    ("0001-01-01T00:30:00", "Asia/Tokyo", "America/New_York"),
+])
+def test_batch_marks_times_past_the_datetime_range_invalid(client, text, from_zone, to_zone):
+    response = client.post("/time-zones/convert", json={
+        "times": [text, "2024-01-01T00:00:00"], "from_zone": from_zone, "to_zone": to_zone,
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["times"][0] is None and body["offsets"][0] is None
+    assert body["times"][1] is not None
+
+
+@pytest.mark.parametrize("text, from_zone, to_zone", [
+    ("9999-12-31T23:00:00", "America/New_York", "Pacific/Kiritimati"),
+    ("0001-01-01T00:30:00", "Asia/Tokyo", "America/New_York"),
+])
+def test_single_time_past_the_datetime_range_is_null(client, text, from_zone, to_zone):
+    response = client.post("/time-zones/convert", json={"time": text, "from_zone": from_zone, "to_zones": [to_zone]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["utc"] is None
+    assert body["conversions"][0]["time"] is None
+
+
+def test_times_at_the_ends_of_the_range_still_convert():
+    converted, _, valid = convert_instants(["0001-01-01T00:00:00", "9999-12-31T23:59:59"], "UTC", "UTC")
+    assert valid.all()
+    assert converted.astype(str).tolist() == ["0001-01-01T00:00:00", "9999-12-31T23:59:59"]